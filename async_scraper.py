@@ -0,0 +1,168 @@
+# Async Playwright backend: several searches as concurrent pages in one persistent context
+import argparse
+import asyncio
+from urllib.parse import quote
+
+from playwright.async_api import async_playwright  # Async Playwright for concurrent pages
+
+from main2 import BROWSER_ARGS, USER_AGENT, USER_DATA_DIR, load_cache, save_cache  # Shared settings and URL cache
+from extraction import CARD_SELECTORS, extract_cards_playwright_async  # Shared selectors and batch extraction
+from pacing import RatePolicy, wait_for_results_playwright_async  # Navigation pacing and page readiness
+from resource_policy import ResourcePolicy  # Blocks images, fonts, media and trackers
+from sinks import JsonlSink  # Line-per-profile output
+
+# Constants
+OUTPUT_FILE = "output.jsonl"  # Profiles are appended here one per line as they are found
+CONCURRENCY = 3  # Maximum number of search pages open at once
+MAX_PROFILES = 200  # Maximum number of new profiles per query
+MAX_ITERATIONS = 20  # Maximum number of pages per query
+
+
+# 🧺 Shared Output
+class ProfileSink:
+    """
+    Dedup set and output file shared by every concurrent query.
+    All tasks run on one event loop, so checking and adding a URL cannot interleave.
+    """
+
+    def __init__(self, path, seen):
+        """
+        :param path: JSON lines file to append profiles to.
+        :param seen: UrlIndex (or set) of already collected profile URLs.
+        """
+        self.seen = seen
+        self._sink = JsonlSink(path)  # Appends and flushes one line per profile
+
+    def add(self, card, query):
+        """
+        Write a profile unless its URL was already collected.
+        :return: True if the profile was new.
+        """
+        if card["url"] in self.seen:
+            return False
+        profile = {"name": card["name"], "url": card["url"]}
+        if self.seen.stamp(card["url"], profile) == "unchanged":
+            return False  # Stale entry re-extracted in refresh mode, but nothing changed
+        profile["query"] = query
+        self._sink.write(profile)
+        return True
+
+    @property
+    def count(self):
+        return self._sink.count  # Profiles written this run
+
+    def close(self):
+        self._sink.close()
+
+
+# 🔎 Scrape One Query
+async def scrape_query(context, keyword, semaphore, rate_policy, sink, max_profiles=MAX_PROFILES,
+                       max_pages=MAX_ITERATIONS):
+    """
+    Scrape one search query in its own page.
+    :param context: Shared persistent browser context.
+    :param keyword: Search keyword.
+    :param semaphore: Bounds the number of concurrently open pages.
+    :param rate_policy: RatePolicy shared by all queries (global navigation rate).
+    :param sink: Shared ProfileSink.
+    :return: Number of new profiles collected for this query.
+    """
+    async with semaphore:
+        page = await context.new_page()
+        collected = 0
+        try:
+            await rate_policy.wait_async()  # Respect the global navigation rate limit
+            await page.goto(f"https://www.linkedin.com/search/results/people/?keywords={quote(keyword)}")
+            await wait_for_results_playwright_async(page, timeout=30)
+
+            for page_number in range(max_pages):
+                print(f"🔄 [{keyword}] Scanning page {page_number + 1}... (So far: {collected})")
+                cards, _ = await extract_cards_playwright_async(page)
+                for card in cards:
+                    if sink.add(card, keyword):
+                        collected += 1
+                        if collected >= max_profiles:
+                            break
+                if collected >= max_profiles:
+                    break
+
+                # 🚦 Handle Pagination (Next Page)
+                next_button = await page.query_selector("button[aria-label='Next']")
+                if not next_button or not await next_button.is_enabled():
+                    print(f"🚦 [{keyword}] No more pages to navigate.")
+                    break
+                previous = await page.query_selector(CARD_SELECTORS["card"])  # Must detach before the next page counts as loaded
+                await rate_policy.wait_async()
+                await next_button.click()
+                await wait_for_results_playwright_async(page, previous=previous)
+        except Exception as e:
+            print(f"⚠️ [{keyword}] Stopped early: {e}")
+        finally:
+            await page.close()
+
+    print(f"✅ [{keyword}] {collected} new profiles")
+    return collected
+
+
+# 🚀 Main Scraper Function
+async def run_async_scraper(keywords, concurrency=CONCURRENCY, max_profiles=MAX_PROFILES, max_pages=MAX_ITERATIONS,
+                            output_file=OUTPUT_FILE, rate_policy=None, resource_policy=None, headless=False):
+    """
+    Run several search queries concurrently in one logged-in persistent context.
+    :param keywords: Search keywords, one query each.
+    :param concurrency: Maximum number of pages open at once.
+    :param rate_policy: Global RatePolicy shared by all pages (default: 12 page loads per minute).
+    :param resource_policy: Optional ResourcePolicy.
+    :return: List of (keyword, new profiles collected) pairs in query order; a repeated keyword gets one pair per run.
+    """
+    rate_policy = rate_policy or RatePolicy()
+    cache = load_cache()
+    print(f"⚡ Loaded {len(cache)} profiles from cache...")
+    sink = ProfileSink(output_file, cache)
+
+    try:
+        async with async_playwright() as p:
+            # Reuse the login saved by save_login_state.py
+            context = await p.chromium.launch_persistent_context(
+                USER_DATA_DIR,
+                headless=headless,
+                args=BROWSER_ARGS,
+                user_agent=USER_AGENT
+            )
+            if resource_policy:
+                await resource_policy.install_playwright_async(context)
+
+            semaphore = asyncio.Semaphore(concurrency)
+            counts = await asyncio.gather(*(
+                scrape_query(context, keyword, semaphore, rate_policy, sink, max_profiles, max_pages)
+                for keyword in keywords
+            ))
+            await context.close()
+    finally:
+        sink.close()
+        save_cache(cache)  # Persist every URL seen, including ones found before an error
+
+    print(f"✅ Saved {sink.count} profiles to '{output_file}'")
+    return list(zip(keywords, counts))
+
+
+# Entry point of the script
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape several LinkedIn searches concurrently with async Playwright.")
+    parser.add_argument("keywords", nargs="+", help="Search keywords, one query each")
+    parser.add_argument("-c", "--concurrency", type=int, default=CONCURRENCY, help="Pages open at once")
+    parser.add_argument("--max-profiles", type=int, default=MAX_PROFILES, help="New profiles per query")
+    parser.add_argument("--rate", type=float, default=12, help="Maximum page loads per minute across all pages")
+    parser.add_argument("-o", "--output", default=OUTPUT_FILE, help="JSON lines output file")
+    args = parser.parse_args()
+    if args.rate <= 0:
+        parser.error("--rate must be a positive number of page loads per minute")
+
+    asyncio.run(run_async_scraper(
+        args.keywords,
+        concurrency=args.concurrency,
+        max_profiles=args.max_profiles,
+        output_file=args.output,
+        rate_policy=RatePolicy(max_per_minute=args.rate),
+        resource_policy=ResourcePolicy(),
+    ))
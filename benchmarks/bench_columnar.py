@@ -0,0 +1,134 @@
+# File size, load time and memory of the columnar profile formats versus the scrapers' JSON output
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Repository root
+
+from columnar import ColumnarSink, iter_columnar, load_records, pyarrow  # noqa: E402
+from dedup_index import content_hash  # noqa: E402
+
+FIRST = ['Alex', 'Maria', 'Wei', 'Priya', 'John', 'Fatima', 'Lukas', 'Sofia', 'Kenji', 'Amara', 'Diego', 'Olga']
+LAST = ['Smith', 'Garcia', 'Chen', 'Patel', 'Müller', 'Okafor', 'Rossi', 'Kim', 'Novak', 'Silva', 'Haddad']
+ROLES = ['Data Scientist', 'ML Engineer', 'Software Engineer', 'Product Manager', 'Research Scientist',
+         'Data Engineer', 'Engineering Manager', 'Analytics Lead', 'Backend Developer', 'SRE']
+COMPANIES = ['Microsoft', 'Google', 'Amazon', 'Meta', 'Apple', 'Netflix', 'Stripe', 'SAP', 'Spotify', 'Airbnb',
+             'Uber', 'Shopify', 'Atlassian', 'Zalando', 'Booking.com', 'Adobe', 'Oracle', 'IBM', 'Intel', 'NVIDIA']
+CITIES = ['Seattle, Washington, United States', 'San Francisco Bay Area', 'New York, New York, United States',
+          'London, England, United Kingdom', 'Berlin, Germany', 'Bengaluru, Karnataka, India', 'Toronto, Canada',
+          'Austin, Texas, United States', 'Amsterdam, North Holland, Netherlands', 'Singapore', 'Paris, France',
+          'Sydney, New South Wales, Australia', 'Dublin, Ireland', 'Zurich, Switzerland', 'Greater Boston']
+
+
+def make_profiles(count, missing_rate=0.1, seed=0):
+    """
+    Synthetic main.py records: unique names and URLs, headlines and locations drawn from a small vocabulary.
+    """
+    rng = random.Random(seed)
+    start = 1_760_000_000
+    for i in range(count):
+        profile = {
+            'name': f'{rng.choice(FIRST)} {rng.choice(LAST)}',
+            'profile_url': f'https://www.linkedin.com/in/member-{i:08d}-{rng.randrange(16 ** 4):04x}',
+            'headline': f'{rng.choice(ROLES)} at {rng.choice(COMPANIES)}' if rng.random() > missing_rate else "N/A",
+            'location': rng.choice(CITIES) if rng.random() > missing_rate else "N/A",
+        }
+        seen = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(start + i // 10 * 7))  # One results page ~ 7s
+        profile.update(first_seen=seen, last_seen=seen, content_hash=content_hash(profile))
+        yield profile
+
+
+def write_json(profiles, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(list(profiles), f, indent=2, ensure_ascii=False)  # What _save_to_cache used to write
+
+
+def write_jsonl(profiles, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        for profile in profiles:
+            f.write(json.dumps(profile, ensure_ascii=False) + '\n')
+
+
+def write_columnar(compress):
+    def write(profiles, path):
+        with ColumnarSink(path, compress=compress) as sink:
+            for profile in profiles:
+                sink.write(profile)
+    return write
+
+
+def load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_jsonl(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+# Format name -> (file suffix, writer, {loader name: loader})
+FORMATS = {
+    'json (indent=2)': ('.json', write_json, {'dicts': load_json, 'records': load_records}),
+    'jsonl': ('.jsonl', write_jsonl, {'dicts': load_jsonl}),
+    'lpc (zlib)': ('.lpc', write_columnar(True), {'dicts': lambda p: list(iter_columnar(p)), 'records': load_records}),
+    'lpc (raw)': ('.lpc', write_columnar(False), {'dicts': lambda p: list(iter_columnar(p)), 'records': load_records}),
+    'parquet': ('.parquet', write_columnar(True), {'dicts': lambda p: list(iter_columnar(p)), 'records': load_records}),
+}
+
+
+def measure(loader, path, runs):
+    """
+    :return: (best load seconds, bytes held by the loaded data).
+    """
+    timings = []
+    for _ in range(runs):
+        gc.collect()
+        start = time.perf_counter()
+        data = loader(path)
+        timings.append(time.perf_counter() - start)
+        del data
+    gc.collect()
+    tracemalloc.start()
+    data = loader(path)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del data
+    return min(timings), held
+
+
+# Main script execution
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare profile file formats: size, load time, memory.")
+    parser.add_argument('-n', '--profiles', type=int, default=100_000, help="Synthetic profiles to write")
+    parser.add_argument('--runs', type=int, default=3, help="Load runs per format (best is reported)")
+    parser.add_argument('--json', help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name, (suffix, writer, loaders) in FORMATS.items():
+            if suffix == '.parquet' and pyarrow is None:
+                print(f"{name:16} skipped (pyarrow not installed)")
+                continue
+            path = os.path.join(directory, name.split()[0] + ('-raw' if 'raw' in name else '') + suffix)
+            start = time.perf_counter()
+            writer(make_profiles(args.profiles), path)
+            write_time = time.perf_counter() - start
+            size = os.path.getsize(path)
+            for loader_name, loader in loaders.items():
+                load_time, held = measure(loader, path, args.runs)
+                results.append({'format': name, 'as': loader_name, 'bytes': size, 'write_s': write_time,
+                                'load_s': load_time, 'memory_bytes': held})
+                print(f"{name:16} {loader_name:8} size {size / 2 ** 20:8.2f} MB   write {write_time:6.2f}s   "
+                      f"load {load_time:6.3f}s   memory {held / 2 ** 20:8.1f} MB")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
@@ -0,0 +1,286 @@
+# Offline throughput benchmark of the scrapers' extraction paths against the local fixture server
+import argparse
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from urllib.request import urlopen
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Repository root
+
+from fixture_server import FixtureServer  # noqa: E402
+from extraction import CARD_SELECTORS  # noqa: E402
+
+try:
+    import psutil  # Optional: lets the peak RSS include the browser processes
+except ImportError:
+    psutil = None
+
+# Benchmark name -> (backend, extraction path)
+BENCHMARKS = {
+    'main-batch': ('selenium', 'main.py, one execute_script per page'),
+    'main-cards': ('selenium', 'main.py _extract_card, field-by-field WebDriver calls'),
+    'main3-cards': ('selenium', 'main3.py extract_card, field-by-field WebDriver calls'),
+    'main2-batch': ('playwright', 'main2.py, one page.evaluate per page'),
+    'main2-cards': ('playwright', 'main2.py parse_card, per-card element handles'),
+    'offline': ('none', 'html_archive.parse_cards on the raw HTML, no browser'),
+}
+
+
+# Define the RssSampler class
+class RssSampler:
+    """
+    Samples the resident set size of this process and its children (the
+    browser and driver) in a background thread and keeps the peak.
+    Without psutil only this process's own peak (ru_maxrss) is reported.
+    """
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        me = psutil.Process()
+        while not self._stop.is_set():
+            total = 0
+            for proc in [me] + me.children(recursive=True):
+                try:
+                    total += proc.memory_info().rss
+                except psutil.Error:
+                    pass  # Process exited between listing and reading
+            self.peak = max(self.peak, total)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        if psutil:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        else:
+            self.peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # KiB on Linux
+
+    @property
+    def includes_browser(self):
+        return psutil is not None
+
+
+def _percentile(values, fraction):
+    values = sorted(values)
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+# Define the RunStats class
+class RunStats:
+    """
+    Pages, cards and extraction time per page for one benchmark run.
+    """
+
+    def __init__(self):
+        self.pages = 0
+        self.cards = 0
+        self.per_card = []  # Extraction seconds per card, one entry per page
+        self.extract_s = 0.0
+
+    def page(self, seconds, cards):
+        self.pages += 1
+        self.cards += len(cards)
+        self.extract_s += seconds
+        if cards:
+            self.per_card.append(seconds / len(cards))
+
+    def report(self, name, wall_s, peak_rss, includes_browser):
+        return {
+            'benchmark': name,
+            'pages': self.pages,
+            'cards': self.cards,
+            'wall_s': round(wall_s, 3),
+            'pages_per_s': round(self.pages / wall_s, 2) if wall_s else None,
+            'cards_per_s': round(self.cards / wall_s, 2) if wall_s else None,
+            'extract_cards_per_s': round(self.cards / self.extract_s, 1) if self.extract_s else None,
+            'per_card_ms_p50': round(_percentile(self.per_card, 0.5) * 1000, 3) if self.per_card else None,
+            'per_card_ms_p95': round(_percentile(self.per_card, 0.95) * 1000, 3) if self.per_card else None,
+            'peak_rss_mb': round(peak_rss / 2 ** 20, 1),
+            'rss_includes_browser': includes_browser,
+        }
+
+
+def _selenium_extractor(name):
+    from extraction import extract_cards_selenium
+
+    if name == 'main-batch':
+        return lambda driver, elements: extract_cards_selenium(driver)[0]
+    if name == 'main-cards':
+        from main import LinkedInScraper
+        scraper = LinkedInScraper.__new__(LinkedInScraper)  # Bare instance: no browser, cache or login
+    else:
+        from main3 import LinkedInScraper
+        scraper = LinkedInScraper.__new__(LinkedInScraper)
+    extract = scraper._extract_card if name == 'main-cards' else scraper.extract_card
+    return lambda driver, elements: [extract(element) for element in elements]
+
+
+def run_selenium(name, server, paginate, implicit_wait):
+    """
+    Drive headless Chrome through every fixture page and time the extraction path.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.by import By
+    from driver_cache import resolve_chromedriver
+    from pacing import wait_for_results_selenium
+
+    extract = _selenium_extractor(name)
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless=new')
+    options.add_argument('--disable-gpu')
+    driver = webdriver.Chrome(service=Service(resolve_chromedriver()), options=options)
+    driver.implicitly_wait(implicit_wait)  # Charged to every find_element that misses
+    stats = RunStats()
+    try:
+        driver.get(server.url(1))
+        previous = None
+        for page in range(1, server.pages + 1):
+            wait_for_results_selenium(driver, previous=previous, timeout=10)
+            start = time.perf_counter()
+            elements = driver.find_elements(By.CSS_SELECTOR, CARD_SELECTORS['card'])
+            cards = [card for card in extract(driver, elements) if card]
+            stats.page(time.perf_counter() - start, cards)
+            if page == server.pages:
+                break
+            if paginate == 'url':
+                driver.get(server.url(page + 1))
+                previous = None
+            else:
+                previous = elements[0]
+                driver.find_element(By.CSS_SELECTOR, "button[aria-label='Next']").click()
+    finally:
+        driver.quit()
+    return stats
+
+
+def run_playwright(name, server, paginate):
+    """
+    Drive headless Chromium through every fixture page and time the extraction path.
+    """
+    from playwright.sync_api import sync_playwright
+    from extraction import extract_cards_playwright
+    from main2 import parse_card
+    from pacing import wait_for_results_playwright
+
+    stats = RunStats()
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        try:
+            page.goto(server.url(1))
+            previous = None
+            for number in range(1, server.pages + 1):
+                wait_for_results_playwright(page, previous=previous, timeout=10)
+                start = time.perf_counter()
+                if name == 'main2-batch':
+                    cards, _ = extract_cards_playwright(page)
+                else:
+                    cards = [parse_card(card) for card in page.query_selector_all(CARD_SELECTORS['card'])]
+                cards = [card for card in cards if card]
+                stats.page(time.perf_counter() - start, cards)
+                if number == server.pages:
+                    break
+                if paginate == 'url':
+                    page.goto(server.url(number + 1))
+                    previous = None
+                else:
+                    previous = page.query_selector(CARD_SELECTORS['card'])
+                    page.click("button[aria-label='Next']")
+        finally:
+            browser.close()
+    return stats
+
+
+def run_offline(server):
+    """
+    Fetch each fixture page over HTTP and parse it without a browser (the archive re-extraction path).
+    """
+    from html_archive import parse_cards
+
+    stats = RunStats()
+    for page in range(1, server.pages + 1):
+        url = server.url(page)
+        with urlopen(url) as response:
+            html = response.read().decode('utf-8')
+        start = time.perf_counter()
+        cards = parse_cards(html, url)
+        stats.page(time.perf_counter() - start, cards)
+    return stats
+
+
+def run_benchmark(name, server, paginate='url', implicit_wait=0):
+    """
+    Run one named benchmark against a started FixtureServer.
+    :return: Report dict (throughput, per-card latency percentiles, peak RSS).
+    """
+    backend = BENCHMARKS[name][0]
+    with RssSampler() as rss:
+        start = time.perf_counter()
+        if backend == 'selenium':
+            stats = run_selenium(name, server, paginate, implicit_wait)
+        elif backend == 'playwright':
+            stats = run_playwright(name, server, paginate)
+        else:
+            stats = run_offline(server)
+        wall = time.perf_counter() - start
+    return stats.report(name, wall, rss.peak, rss.includes_browser)
+
+
+def format_table(reports):
+    columns = ('benchmark', 'pages', 'cards', 'pages_per_s', 'cards_per_s', 'per_card_ms_p50',
+               'per_card_ms_p95', 'peak_rss_mb')
+    rows = [columns] + [tuple('-' if r[c] is None else str(r[c]) for c in columns) for r in reports]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    return '\n'.join('  '.join(cell.ljust(width) for cell, width in zip(row, widths)) for row in rows)
+
+
+# Main script execution
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the scrapers' extraction paths against local fixture pages.")
+    parser.add_argument('benchmarks', nargs='*', help="Benchmarks to run (default: all). " +
+                             '; '.join(f'{k}: {v[1]}' for k, v in BENCHMARKS.items()))
+    parser.add_argument('--pages', type=int, default=10, help="Result pages to crawl")
+    parser.add_argument('--per-page', type=int, default=10, help="Result containers per page")
+    parser.add_argument('--missing-rate', type=float, default=0.2, help="Fraction of cards missing a field")
+    parser.add_argument('--paginate', choices=['click', 'url'], default='url',
+                        help="Follow the Next button or open each page by its number")
+    parser.add_argument('--implicit-wait', type=float, default=0,
+                        help="Selenium implicit wait in seconds, to measure what it costs on cards missing a field")
+    parser.add_argument('--json', help="Also write the reports to this JSON file (e.g. to compare runs)")
+    args = parser.parse_args()
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    reports = []
+    with FixtureServer(args.pages, args.per_page, args.missing_rate) as server:
+        for name in args.benchmarks or list(BENCHMARKS):
+            print(f"⏱️ {name}: {BENCHMARKS[name][1]}", file=sys.stderr)
+            try:
+                reports.append(run_benchmark(name, server, args.paginate, args.implicit_wait))
+            except Exception as e:
+                # A missing browser or driver should only skip that backend
+                print(f"⚠️ {name} skipped: {e}", file=sys.stderr)
+
+    print(format_table(reports))
+    if not psutil:
+        print("(peak RSS is this process only; install psutil to include the browser)")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(reports, f, indent=2)
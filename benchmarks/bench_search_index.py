@@ -0,0 +1,70 @@
+# Build rate, size and query latency of the profile search index on synthetic profiles
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Repository root
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_columnar import make_profiles  # noqa: E402
+from search_index import SearchIndex  # noqa: E402
+
+QUERIES = [
+    'ml engineer',
+    'ml engineer location:seattle',
+    'data eng*',
+    'microsoft location:berlin',
+    'research scientist nvidia zurich',
+    'name:priya amazon',
+    'product manager at stripe london',
+    'nosuchword',
+]
+
+
+def time_query(index, query, limit, runs):
+    """
+    :return: (median milliseconds for search() of the first `limit` matches, number of matches).
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        index.search(query, limit=limit)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000, index.count(query)
+
+
+# Main script execution
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark building and querying the profile search index.")
+    parser.add_argument('-n', '--profiles', type=int, default=200_000, help="Synthetic profiles to index")
+    parser.add_argument('--limit', type=int, default=20, help="Results per query")
+    parser.add_argument('--runs', type=int, default=5, help="Runs per query (median is reported)")
+    parser.add_argument('--index', help="Reuse or keep this index file instead of a temporary one")
+    parser.add_argument('--json', help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.index or os.path.join(directory, 'index.sqlite')
+        with SearchIndex(path) as index:
+            report = {'profiles': args.profiles, 'queries': []}
+            if len(index) < args.profiles:
+                start = time.perf_counter()
+                index.add_many(make_profiles(args.profiles))
+                report['build_s'] = time.perf_counter() - start
+                print(f"Indexed {args.profiles} profiles in {report['build_s']:.1f}s "
+                      f"({args.profiles / report['build_s']:,.0f}/s)")
+            report['bytes'] = os.path.getsize(path)
+            print(f"Index size {report['bytes'] / 2 ** 20:.1f} MB")
+
+            for query in QUERIES:
+                ms, matches = time_query(index, query, args.limit, args.runs)
+                report['queries'].append({'query': query, 'ms': ms, 'matches': matches})
+                print(f"{query:36} {ms:8.2f} ms   {matches:>9,} matches")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
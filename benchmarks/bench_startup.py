@@ -0,0 +1,58 @@
+# Startup time of the unified CLI (lazy backend imports) versus importing each backend up front
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # Repository root
+
+# Name -> command, each run in a fresh interpreter from the repository root
+COMMANDS = {
+    'python (baseline)': [sys.executable, '-c', 'pass'],
+    'cli --help': [sys.executable, '-m', 'linkedin_scraper', '--help'],
+    'cli scrape --check': [sys.executable, '-m', 'linkedin_scraper', 'scrape', 'data scientist', '--check'],
+    'cli extract --help': [sys.executable, '-m', 'linkedin_scraper', 'extract', '--help'],
+    'import main (selenium)': [sys.executable, '-c', 'import main'],
+    'import main3 (selenium)': [sys.executable, '-c', 'import main3'],
+    'import main2 (playwright)': [sys.executable, '-c', 'import main2'],
+}
+
+
+def time_command(command, runs):
+    """
+    Run a command `runs` times.
+    :return: List of wall-clock seconds, or None if the command failed (e.g. a backend is not installed).
+    """
+    env = dict(os.environ, LINKEDIN_EMAIL='bench@example.com', LINKEDIN_PASSWORD='bench')  # For --check
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            return None
+    return timings
+
+
+# Main script execution
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure CLI startup time against eager backend imports.")
+    parser.add_argument('-n', '--runs', type=int, default=10, help="Runs per command (median is reported)")
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help="Exit with status 1 if 'cli --help' takes longer than this median (for CI)")
+    args = parser.parse_args()
+
+    medians = {}
+    for name, command in COMMANDS.items():
+        timings = time_command(command, args.runs)
+        if timings is None:
+            print(f"{name:28} skipped (command failed; backend not installed?)")
+            continue
+        medians[name] = statistics.median(timings) * 1000
+        print(f"{name:28} median {medians[name]:8.1f} ms   min {min(timings) * 1000:8.1f} ms")
+
+    if args.budget_ms is not None and medians.get('cli --help', float('inf')) > args.budget_ms:
+        print(f"❌ cli --help exceeded the {args.budget_ms:.0f} ms budget")
+        sys.exit(1)
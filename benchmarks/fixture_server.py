@@ -0,0 +1,155 @@
+# Local HTTP server serving synthetic LinkedIn-style search result pages for offline benchmarks
+import argparse
+import html
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+SEARCH_PATH = '/search/results/people/'
+
+FIRST_NAMES = ['Ana', 'Ben', 'Chen', 'Dara', 'Elif', 'Femi', 'Greta', 'Hiro', 'Ines', 'Jonas', 'Kofi', 'Lena']
+LAST_NAMES = ['Almeida', 'Brooks', 'Cohen', 'Dubois', 'Eriksen', 'Fischer', 'Garcia', 'Haddad', 'Ito', 'Jensen']
+HEADLINES = ['Data Scientist at Contoso', 'Machine Learning Engineer', 'Senior Software Engineer at Fabrikam',
+             'Research Scientist', 'Analytics Lead at Northwind', 'Staff Engineer, Platform']
+LOCATIONS = ['Seattle, WA', 'London, England, United Kingdom', 'Berlin, Germany', 'Toronto, ON', 'Remote']
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Search results</title></head>
+<body>
+<div class="search-results-container">
+<ul class="reusable-search__entity-result-list">
+{cards}
+</ul>
+</div>
+<div class="artdeco-pagination">
+<button aria-label="Next" class="artdeco-pagination__button--next{disabled_class}"{disabled} onclick="{onclick}">Next</button>
+</div>
+</body></html>
+"""
+
+CARD_TEMPLATE = """<li class="reusable-search__result-container">
+<div class="entity-result">
+<span class="entity-result__title-text"><a class="app-aware-link" href="{url}?miniProfileUrn=urn%3Ali%3Afs_miniProfile%3A{n}"><span aria-hidden="true">{name}</span><span class="visually-hidden">View {name}'s profile</span></a></span>
+{headline}{location}
+</div>
+</li>"""
+
+# A result container that is not a person (e.g. an ad or a "people also searched" block) has no profile link
+NON_PROFILE_CARD = """<li class="reusable-search__result-container"><div class="entity-result">Promoted</div></li>"""
+
+
+def render_page(page, pages=5, per_page=10, missing_rate=0.2, seed=0):
+    """
+    Render one search results page. The same arguments always give the same page.
+    :param page: 1-based page number; pages past `pages` have no result cards.
+    :param pages: Number of pages with results.
+    :param per_page: Result containers per page.
+    :param missing_rate: Fraction of cards lacking a headline or location (and of non-profile containers).
+    :param seed: Seed for the synthetic data.
+    """
+    rng = random.Random(f'{seed}-{page}')
+    cards = []
+    if 1 <= page <= pages:
+        for i in range(per_page):
+            if rng.random() < missing_rate / 4:
+                cards.append(NON_PROFILE_CARD)
+                continue
+            n = (page - 1) * per_page + i
+            name = f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+            headline = '' if rng.random() < missing_rate else \
+                f'<div class="entity-result__primary-subtitle">{html.escape(rng.choice(HEADLINES))}</div>\n'
+            location = '' if rng.random() < missing_rate else \
+                f'<div class="entity-result__secondary-subtitle">{html.escape(rng.choice(LOCATIONS))}</div>\n'
+            cards.append(CARD_TEMPLATE.format(
+                url=f'https://www.linkedin.com/in/{name.lower().replace(" ", "-")}-{n}',
+                n=n, name=html.escape(name), headline=headline, location=location))
+
+    last = page >= pages
+    return PAGE_TEMPLATE.format(
+        cards='\n'.join(cards),
+        disabled_class=' artdeco-button--disabled disabled' if last else '',
+        disabled=' disabled' if last else '',
+        onclick='' if last else f"location.search = location.search.replace(/([?&])page=\\d+/, '') + "
+                                f"(location.search ? '&' : '?') + 'page={page + 1}'",
+    )
+
+
+# Define the FixtureServer class
+class FixtureServer:
+    """
+    Serves render_page() output on 127.0.0.1 from a background thread.
+    `/search/results/people/?keywords=...&page=N` returns page N; use as a context manager.
+    """
+
+    def __init__(self, pages=5, per_page=10, missing_rate=0.2, seed=0, port=0):
+        """
+        :param port: Port to listen on (0 picks a free one).
+        Other parameters are passed to render_page.
+        """
+        options = {'pages': pages, 'per_page': per_page, 'missing_rate': missing_rate, 'seed': seed}
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                if parsed.path.rstrip('/') != SEARCH_PATH.rstrip('/'):
+                    self.send_error(404)
+                    return
+                query = parse_qs(parsed.query)
+                body = render_page(int(query.get('page', ['1'])[0]), **options).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep benchmark output readable
+
+        self.pages = pages
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def url(self, page=1, keyword='data scientist'):
+        """
+        URL of a results page, shaped like checkpoint.build_search_url.
+        """
+        url = f'{self.base_url}{SEARCH_PATH}?keywords={keyword.replace(" ", "%20")}'
+        return url + f'&page={page}' if page > 1 else url
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# Serve the fixture pages for manual inspection
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve synthetic LinkedIn search result pages locally.")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--pages', type=int, default=5, help="Pages with results")
+    parser.add_argument('--per-page', type=int, default=10, help="Result containers per page")
+    parser.add_argument('--missing-rate', type=float, default=0.2, help="Fraction of cards missing a field")
+    args = parser.parse_args()
+
+    server = FixtureServer(args.pages, args.per_page, args.missing_rate, port=args.port)
+    print(f"Serving {args.pages} pages at {server.url()}")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        server.server.server_close()
@@ -0,0 +1,82 @@
+# Direct page-number search URLs and resumable crawl checkpoints
+import json
+import os
+from urllib.parse import quote
+
+SEARCH_URL = 'https://www.linkedin.com/search/results/people/'
+
+
+def build_search_url(keyword, company='', page=1):
+    """
+    Build a people-search URL that opens a given results page directly.
+    :param keyword: Search keyword.
+    :param company: Optional current-company filter.
+    :param page: 1-based results page.
+    """
+    url = f'{SEARCH_URL}?keywords={quote(keyword)}'
+    if company:
+        url += f'&currentCompany={quote(company)}'
+    if page > 1:
+        url += f'&page={page}'
+    return url
+
+
+# Define the CrawlCheckpoint class
+class CrawlCheckpoint:
+    """
+    Remembers, per query, the last fully processed results page and how many
+    profiles it yielded, so an interrupted crawl resumes on the next page.
+    The file is small and rewritten atomically after every page.
+    """
+
+    def __init__(self, path='checkpoints.json'):
+        """
+        :param path: JSON file holding all query checkpoints.
+        """
+        self.path = path
+        try:
+            with open(path, 'r') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+
+    def resume_page(self, query):
+        """
+        Page to start a query on: one past the last completed page, or 1 for a new or finished crawl.
+        :param query: Query key (e.g. the page-1 search URL).
+        """
+        entry = self.entries.get(query)
+        if not entry or entry.get('done'):
+            return 1
+        return entry['last_page'] + 1
+
+    def profiles(self, query):
+        """
+        Profiles collected so far for a query (0 for a new or finished crawl).
+        """
+        entry = self.entries.get(query)
+        return entry['profiles'] if entry and not entry.get('done') else 0
+
+    def update(self, query, page, profiles, done=False, partial=False):
+        """
+        Record a processed page and save the checkpoint file.
+        :param query: Query key.
+        :param page: Page just processed.
+        :param profiles: Profiles collected for this query so far.
+        :param done: True when the query has no more pages.
+        :param partial: True if the crawl stopped before the page's last card (e.g. at max_profiles).
+                        The page then does not count as completed, so a resumed run reads it again;
+                        the cards already collected are skipped there by the dedup index.
+        """
+        self.entries[query] = {'last_page': page - 1 if partial else page, 'profiles': profiles, 'done': done}
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_path, self.path)  # Never leaves a half-written checkpoint
+
+    def finish(self, query):
+        """
+        Mark a query as fully crawled so the next run starts it fresh.
+        """
+        entry = self.entries.get(query, {'last_page': 0, 'profiles': 0})
+        self.update(query, entry['last_page'], entry['profiles'], done=True)
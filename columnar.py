@@ -0,0 +1,282 @@
+# Column-oriented profile files with dictionary-encoded strings, and a compact in-memory profile record
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+try:
+    import pyarrow  # Optional: Parquet output readable by pandas, DuckDB, Spark, ...
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+MAGIC = b'LPCOL1\n'  # Native format: magic, header length (uint32 LE), JSON header, then the column blobs
+PLAIN_RATIO = 0.5  # Columns with more distinct values than this fraction of rows are stored plain
+
+
+def _typecode(size):
+    """
+    Smallest unsigned array type holding codes 0..size.
+    """
+    for typecode in ('B', 'H', 'I', 'L', 'Q'):
+        if size < 2 ** (8 * array(typecode).itemsize):
+            return typecode
+    raise OverflowError(f"{size} distinct values")
+
+
+# Define the _Column class
+class _Column:
+    """
+    One column being built: a dictionary of distinct values and one code per row (0 = field absent).
+    """
+
+    def __init__(self):
+        self.values = {}  # Value -> code (codes start at 1)
+        self.codes = array('I')
+
+    def pad(self, rows):
+        # Rows without this field get code 0
+        if len(self.codes) < rows:
+            self.codes.extend(array('I', bytes(self.codes.itemsize * (rows - len(self.codes)))))
+
+    def add(self, row, value):
+        self.pad(row)
+        code = self.values.get(value)
+        if code is None:
+            code = self.values[value] = len(self.values) + 1
+        self.codes.append(code)
+
+    def decode(self):
+        dictionary = [None] + list(self.values)
+        return [dictionary[code] for code in self.codes]
+
+
+# Define the ColumnarSink class
+class ColumnarSink:
+    """
+    Collects profiles column by column and writes them on close, either as
+    Parquet (`.parquet`, needs pyarrow) or in the native format (any other
+    name). Each string column keeps every distinct value once plus a small
+    integer per row, so headlines and locations repeated across thousands
+    of profiles cost a byte or two each. Fields set to None are dropped.
+    The file is written to a temp file and renamed into place.
+    """
+
+    def __init__(self, path, compress=True):
+        """
+        :param path: Output file; `.parquet` selects Parquet.
+        :param compress: zlib-compress the native format's column blobs (Parquet always uses zstd).
+        """
+        if path.endswith('.parquet') and pyarrow is None:
+            raise ImportError("writing .parquet files requires pyarrow (pip install pyarrow)")
+        self.path = path
+        self.compress = compress
+        self.count = 0
+        self._columns = {}  # Field name -> _Column, in order of first appearance
+        self._closed = False
+
+    def write(self, profile):
+        for name, value in profile.items():
+            if value is None:
+                continue
+            column = self._columns.get(name)
+            if column is None:
+                column = self._columns[name] = _Column()
+            column.add(self.count, value)
+        self.count += 1
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        tmp_path = f'{self.path}.tmp'
+        if self.path.endswith('.parquet'):
+            self._write_parquet(tmp_path)
+        else:
+            self._write_native(tmp_path)
+        os.replace(tmp_path, self.path)
+
+    def _write_parquet(self, path):
+        for column in self._columns.values():
+            column.pad(self.count)
+        table = pyarrow.table({name: pyarrow.array(column.decode()) for name, column in self._columns.items()})
+        pyarrow.parquet.write_table(table, path, use_dictionary=True, compression='zstd')
+
+    def _write_native(self, path):
+        meta, blobs = [], []
+        for name, column in self._columns.items():
+            column.pad(self.count)
+            values, codes = list(column.values), column.codes
+            if len(values) > self.count * PLAIN_RATIO:
+                # Mostly unique (URLs, hashes): a dictionary would only add the codes
+                dictionary = [None] + values
+                parts = [json.dumps([dictionary[code] for code in codes], ensure_ascii=False).encode('utf-8')]
+                entry = {'name': name, 'encoding': 'plain'}
+            else:
+                typecode = _typecode(len(values))
+                packed = array(typecode, codes)
+                if sys.byteorder == 'big':
+                    packed.byteswap()  # Codes are stored little-endian
+                parts = [json.dumps(values, ensure_ascii=False).encode('utf-8'), packed.tobytes()]
+                entry = {'name': name, 'encoding': 'dict', 'typecode': typecode, 'width': packed.itemsize}
+            if self.compress:
+                parts = [zlib.compress(part) for part in parts]
+            entry['sizes'] = [len(part) for part in parts]
+            meta.append(entry)
+            blobs.extend(parts)
+
+        header = json.dumps({'rows': self.count, 'compressed': self.compress, 'columns': meta}).encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<I', len(header)))
+            f.write(header)
+            for blob in blobs:
+                f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def is_columnar(path):
+    """
+    Check whether a file is a Parquet or native columnar profile file.
+    """
+    if path.endswith('.parquet'):
+        return True
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _unpack_codes(blob, entry):
+    # Array item sizes differ between platforms, so find the local type with the stored width
+    typecode = next(t for t in ('B', 'H', 'I', 'L', 'Q') if array(t).itemsize == entry['width'])
+    codes = array(typecode)
+    codes.frombytes(blob)
+    if sys.byteorder == 'big':
+        codes.byteswap()
+    return codes
+
+
+def read_columns(path, fields=None):
+    """
+    Load a columnar file as whole columns. Only the requested columns are decoded.
+    In a dictionary column every row shares the same string object for the same value.
+    :param path: `.parquet` or native file.
+    :param fields: Column names to load (default: all).
+    :return: (number of rows, {name: list of values, None where a field is absent}).
+    """
+    if path.endswith('.parquet'):
+        if pyarrow is None:
+            raise ImportError("reading .parquet files requires pyarrow (pip install pyarrow)")
+        if fields is not None:
+            fields = [name for name in pyarrow.parquet.read_schema(path).names if name in fields]
+        table = pyarrow.parquet.read_table(path, columns=fields)
+        return table.num_rows, table.to_pydict()
+
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a columnar profile file")
+        header = json.loads(f.read(struct.unpack('<I', f.read(4))[0]))
+        columns = {}
+        for entry in header['columns']:
+            if fields is not None and entry['name'] not in fields:
+                f.seek(sum(entry['sizes']), os.SEEK_CUR)
+                continue
+            parts = [f.read(size) for size in entry['sizes']]
+            if header['compressed']:
+                parts = [zlib.decompress(part) for part in parts]
+            if entry['encoding'] == 'plain':
+                columns[entry['name']] = json.loads(parts[0])
+            else:
+                dictionary = [None] + json.loads(parts[0])
+                columns[entry['name']] = [dictionary[code] for code in _unpack_codes(parts[1], entry)]
+    return header['rows'], columns
+
+
+def iter_columnar(path, fields=None):
+    """
+    Stream the rows of a columnar file as profile dicts (absent fields are left out).
+    """
+    rows, columns = read_columns(path, fields)
+    if not columns:
+        yield from ({} for _ in range(rows))
+        return
+    names = list(columns)
+    for values in zip(*columns.values()):
+        yield {name: value for name, value in zip(names, values) if value is not None}
+
+
+# Define the ProfileRecord class
+class ProfileRecord:
+    """
+    Memory-lean profile: fixed slots instead of a per-record dict, and
+    interned headline/location strings so equal values share one object.
+    Holds main.py records; main2.py/main3.py `url` fields map to `profile_url`.
+    """
+
+    __slots__ = ('name', 'profile_url', 'headline', 'location', 'first_seen', 'last_seen', 'content_hash')
+
+    def __init__(self, name=None, profile_url=None, headline=None, location=None,
+                 first_seen=None, last_seen=None, content_hash=None):
+        self.name = name
+        self.profile_url = profile_url
+        self.headline = sys.intern(headline) if isinstance(headline, str) else headline
+        self.location = sys.intern(location) if isinstance(location, str) else location
+        self.first_seen = first_seen
+        self.last_seen = last_seen
+        self.content_hash = content_hash
+
+    @classmethod
+    def from_dict(cls, profile):
+        return cls(profile.get('name'), profile.get('profile_url') or profile.get('url'), profile.get('headline'),
+                   profile.get('location'), profile.get('first_seen'), profile.get('last_seen'),
+                   profile.get('content_hash'))
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__ if getattr(self, field) is not None}
+
+    def __eq__(self, other):
+        if not isinstance(other, ProfileRecord):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __repr__(self):
+        return f'ProfileRecord(name={self.name!r}, profile_url={self.profile_url!r})'
+
+
+def iter_profile_file(path):
+    """
+    Stream profile dicts from any output file: columnar, JSON lines, or a JSON array.
+    """
+    if is_columnar(path):
+        yield from iter_columnar(path)
+        return
+    from profile_store import ProfileStore
+    yield from ProfileStore(path)  # Also picks up a store's unflushed log
+
+
+def load_records(path):
+    """
+    Load a profile file as a list of ProfileRecord.
+    """
+    if not is_columnar(path):
+        return [ProfileRecord.from_dict(profile) for profile in iter_profile_file(path)]
+    rows, columns = read_columns(path, fields=list(ProfileRecord.__slots__) + ['url'])
+    url = columns.pop('url', None)
+    if url is not None:
+        own = columns.get('profile_url') or [None] * rows
+        columns['profile_url'] = [a or b for a, b in zip(own, url)]
+    if not columns:
+        return [ProfileRecord() for _ in range(rows)]
+    fields = list(columns)
+    return [ProfileRecord(**dict(zip(fields, values))) for values in zip(*columns.values())]
@@ -0,0 +1,237 @@
+# Canonical profile-URL dedup index backed by SQLite, with an optional Bloom-filter fast path
+import calendar
+import hashlib
+import json
+import math
+import os
+import sqlite3
+import time
+from urllib.parse import unquote, urlsplit
+
+
+def canonical_profile_slug(url):
+    """
+    Reduce a profile URL to a canonical key so variants of the same profile compare equal.
+    `https://de.linkedin.com/in/J%C3%B6rg-M/?trk=x`, `linkedin.com/in/jörg-m` and
+    `https://www.linkedin.com/in/jörg-m/` all become `in/jörg-m`.
+    :param url: Profile URL as found on the page.
+    :return: The canonical key (lowercase path without slashes, query or fragment).
+    """
+    url = url.strip()
+    if '://' not in url and not url.startswith('/'):
+        url = 'https://' + url  # Scheme-less 'linkedin.com/in/...'
+    path = unquote(urlsplit(url).path)  # Drops query, fragment, host (www vs locale subdomains)
+    parts = [part for part in path.lower().split('/') if part]
+    if len(parts) >= 2 and parts[0] in ('in', 'pub'):
+        return f'{parts[0]}/{parts[1]}'  # Ignore sub-pages like /in/<slug>/details/experience
+    return '/'.join(parts)
+
+
+# Fields that describe when a record was seen rather than what it says
+STAMP_FIELDS = ('first_seen', 'last_seen', 'content_hash')
+
+
+def content_hash(record):
+    """
+    Hash of a profile's content, ignoring its timestamps, so a re-scrape can tell whether anything changed.
+    :param record: Profile dict.
+    :return: Hex digest.
+    """
+    content = {key: value for key, value in record.items() if key not in STAMP_FIELDS}
+    return hashlib.blake2b(json.dumps(content, sort_keys=True, ensure_ascii=False).encode('utf-8'),
+                           digest_size=16).hexdigest()
+
+
+def _iso(timestamp):
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(timestamp))
+
+
+def _epoch(iso):
+    try:
+        return calendar.timegm(time.strptime(iso, '%Y-%m-%dT%H:%M:%SZ'))
+    except (TypeError, ValueError):
+        return None  # Missing or not written by _iso
+
+
+# Define the BloomFilter class
+class BloomFilter:
+    """
+    Fixed-size Bloom filter; `x in bf` is False only for keys that were never added.
+    """
+
+    def __init__(self, capacity=1_000_000, error_rate=0.001):
+        """
+        :param capacity: Expected number of keys.
+        :param error_rate: Target false-positive rate at that capacity.
+        """
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))  # Bits
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))  # Double hashing
+
+    def add(self, key):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+# Define the UrlIndex class
+class UrlIndex:
+    """
+    Set of seen profiles keyed by canonical slug and stored in SQLite, so it
+    never has to be loaded into memory or rewritten in full. Supports `in`,
+    `add` and `len` like the sets it replaces.
+
+    Each entry also remembers when the profile was first and last seen and a
+    hash of its content. With a `ttl`, only entries seen within the last `ttl`
+    seconds count as `in` the index, so stale profiles get re-extracted and
+    `stamp()` reports whether they actually changed.
+    """
+
+    def __init__(self, path='seen_urls.sqlite', bloom=False, capacity=1_000_000, error_rate=0.001, commit_every=100,
+                 ttl=None):
+        """
+        Open (or create) an index.
+        :param path: SQLite file, or ':memory:' for a per-run index.
+        :param bloom: Keep a Bloom filter in memory so most lookups of new URLs skip SQLite.
+        :param capacity: Expected number of URLs, used to size the Bloom filter.
+        :param error_rate: Bloom filter false-positive rate.
+        :param commit_every: Number of additions between commits.
+        :param ttl: Seconds after which a seen profile is stale and no longer counts as `in` (None: never).
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        if path != ':memory:':
+            self.conn.execute('PRAGMA journal_mode=WAL')  # Readers don't block the scraper's writes
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS urls (slug TEXT PRIMARY KEY, first_seen REAL, last_seen REAL, '
+                          'content_hash TEXT) WITHOUT ROWID')
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(urls)')}
+        for column, kind in (('first_seen', 'REAL'), ('last_seen', 'REAL'), ('content_hash', 'TEXT')):
+            if column not in columns:
+                self.conn.execute(f'ALTER TABLE urls ADD COLUMN {column} {kind}')  # Index from before stamping
+        self.commit_every = commit_every
+        self.ttl = ttl
+        self._pending = 0  # Additions since the last commit
+
+        self.bloom = None
+        if bloom:
+            self.bloom = BloomFilter(capacity, error_rate)
+            for (slug,) in self.conn.execute('SELECT slug FROM urls'):  # Streams rows, no big list
+                self.bloom.add(slug)
+
+    def __contains__(self, url):
+        slug = canonical_profile_slug(url)
+        if self.bloom is not None and slug not in self.bloom:
+            return False  # Definitely new
+        if self.ttl is None:
+            return self.conn.execute('SELECT 1 FROM urls WHERE slug = ?', (slug,)).fetchone() is not None
+        # Entries never stamped (imported from an old index) have no last_seen and count as stale
+        return self.conn.execute('SELECT 1 FROM urls WHERE slug = ? AND last_seen >= ?',
+                                 (slug, time.time() - self.ttl)).fetchone() is not None
+
+    def stamp(self, url, record=None):
+        """
+        Record a sighting of a profile.
+        When a record is given, its content hash is compared with the stored one and
+        `first_seen`, `last_seen` and `content_hash` are set on the record in place.
+        :param url: Profile URL.
+        :param record: Optional profile dict extracted for this URL.
+        :return: 'new', 'changed' or 'unchanged'. An entry migrated without a hash is 'unchanged':
+                 its hash is backfilled, since there is nothing to compare it with.
+        """
+        slug = canonical_profile_slug(url)
+        now = time.time()
+        digest = content_hash(record) if record is not None else None
+        row = self.conn.execute('SELECT first_seen, content_hash FROM urls WHERE slug = ?', (slug,)).fetchone()
+        if row is None:
+            status, first_seen = 'new', now
+            self.conn.execute('INSERT INTO urls (slug, first_seen, last_seen, content_hash) VALUES (?, ?, ?, ?)',
+                              (slug, now, now, digest))
+        else:
+            first_seen = row[0] or now
+            status = 'unchanged' if digest is None or row[1] is None or digest == row[1] else 'changed'
+            self.conn.execute('UPDATE urls SET first_seen = ?, last_seen = ?, content_hash = COALESCE(?, content_hash) '
+                              'WHERE slug = ?', (first_seen, now, digest, slug))
+        if self.bloom is not None:
+            self.bloom.add(slug)
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.commit()
+
+        if record is not None:
+            record.update(first_seen=_iso(first_seen), last_seen=_iso(now), content_hash=digest)
+        return status
+
+    def add(self, url):
+        """
+        Record a profile URL (refreshing its last-seen time if it is already known).
+        :return: True if the profile was not in the index yet.
+        """
+        return self.stamp(url) == 'new'
+
+    def add_many(self, urls):
+        """
+        Record many URLs in one transaction.
+        """
+        def slugs():
+            for url in urls:
+                slug = canonical_profile_slug(url)
+                if self.bloom is not None:
+                    self.bloom.add(slug)
+                yield (slug,)
+
+        self.conn.executemany('INSERT OR IGNORE INTO urls (slug) VALUES (?)', slugs())
+        self.commit()
+
+    def add_records(self, records, key='profile_url'):
+        """
+        Record stored profiles in one transaction, keeping their stamps and content hashes,
+        so a later refresh can tell which of them actually changed. For a repeated profile
+        the later record's hash and last-seen time win.
+        :param records: Profile dicts, e.g. streamed from a ProfileStore.
+        :param key: Field holding the profile URL.
+        """
+        def rows():
+            for record in records:
+                slug = canonical_profile_slug(record[key])
+                if self.bloom is not None:
+                    self.bloom.add(slug)
+                yield (slug, _epoch(record.get('first_seen')), _epoch(record.get('last_seen')),
+                       record.get('content_hash') or content_hash(record))
+
+        self.conn.executemany('INSERT INTO urls (slug, first_seen, last_seen, content_hash) VALUES (?, ?, ?, ?) '
+                              'ON CONFLICT(slug) DO UPDATE SET first_seen = COALESCE(urls.first_seen, '
+                              'excluded.first_seen), last_seen = COALESCE(excluded.last_seen, urls.last_seen), '
+                              'content_hash = excluded.content_hash', rows())
+        self.commit()
+
+    def import_json(self, path):
+        """
+        Import a legacy `cache.json` (a JSON list of URLs) if it exists.
+        :return: Number of URLs read.
+        """
+        if not os.path.exists(path):
+            return 0
+        with open(path, 'r') as f:
+            urls = json.load(f)
+        self.add_many(urls)
+        return len(urls)
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM urls').fetchone()[0]
+
+    def commit(self):
+        self.conn.commit()
+        self._pending = 0
+
+    def close(self):
+        self.commit()
+        self.conn.close()
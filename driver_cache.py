@@ -0,0 +1,149 @@
+# Cached, offline-capable chromedriver resolution and cold-start timing
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+
+# Where the resolved driver path and versions are remembered between runs
+DEFAULT_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'linkedin-scraper', 'chromedriver.json')
+
+# Chrome executables to probe for a version, in order
+CHROME_CANDIDATES = (
+    'google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+)
+
+VERSION_RE = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+
+
+def _run_version(executable):
+    """
+    Run `<executable> --version` and return the dotted version it prints, or None.
+    """
+    try:
+        out = subprocess.run([executable, '--version'], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_RE.search(out)
+    return match.group(0) if match else None
+
+
+def detect_chrome_version():
+    """
+    Find the installed Chrome version without touching the network.
+    :return: Version string like '120.0.6099.109', or None if Chrome was not found.
+    """
+    if sys.platform == 'win32':
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r'Software\Google\Chrome\BLBeacon') as key:
+                return winreg.QueryValueEx(key, 'version')[0]
+        except OSError:
+            return None
+
+    for candidate in CHROME_CANDIDATES:
+        executable = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+        if executable:
+            version = _run_version(executable)
+            if version:
+                return version
+    return None
+
+
+def _major(version):
+    return version.split('.')[0] if version else None
+
+
+def _load_cache(cache_file):
+    try:
+        with open(cache_file, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _save_cache(cache_file, entry):
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    tmp_path = f'{cache_file}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(entry, f, indent=2)
+    os.replace(tmp_path, cache_file)
+
+
+def resolve_chromedriver(cache_file=DEFAULT_CACHE_FILE, offline=None):
+    """
+    Return a chromedriver path matching the installed Chrome.
+
+    Order: cached path (if its major version still matches Chrome), a
+    matching chromedriver on PATH, then webdriver_manager (network).
+    :param cache_file: JSON file remembering the last resolved driver.
+    :param offline: Never fall back to webdriver_manager. Defaults to the
+        LINKEDIN_SCRAPER_OFFLINE environment variable.
+    :return: Path to a chromedriver executable.
+    """
+    if offline is None:
+        offline = os.environ.get('LINKEDIN_SCRAPER_OFFLINE', '') not in ('', '0', 'false')
+    chrome_version = detect_chrome_version()
+
+    # 1. Cached driver, valid while it exists and matches Chrome's major version
+    cached = _load_cache(cache_file)
+    if cached and os.path.isfile(cached.get('path', '')):
+        if chrome_version is None or _major(cached.get('driver_version')) == _major(chrome_version):
+            return cached['path']
+
+    # 2. A driver already on PATH (typical for air-gapped build images)
+    candidates = [shutil.which('chromedriver')]
+    if offline and cached:
+        candidates.append(cached.get('path'))  # Better a possibly stale driver than none
+    for path in candidates:
+        if path and os.path.isfile(path):
+            driver_version = _run_version(path)
+            if chrome_version is None or _major(driver_version) == _major(chrome_version) or offline:
+                _save_cache(cache_file, {'path': path, 'driver_version': driver_version,
+                                         'chrome_version': chrome_version})
+                return path
+
+    if offline:
+        raise RuntimeError(
+            f"No chromedriver matching Chrome {chrome_version} found in {cache_file} or on PATH (offline mode)"
+        )
+
+    # 3. Download a matching driver (needs network)
+    from webdriver_manager.chrome import ChromeDriverManager  # Imported lazily: it is only needed here
+    path = ChromeDriverManager().install()
+    _save_cache(cache_file, {'path': path, 'driver_version': _run_version(path), 'chrome_version': chrome_version})
+    return path
+
+
+# Define the ColdStartTimer class
+class ColdStartTimer:
+    """
+    Records how long each start-up phase took: driver resolution, browser launch and first navigation.
+    """
+
+    PHASES = ('driver_resolution', 'browser_launch', 'first_navigation')
+
+    def __init__(self):
+        self.phases = {}  # Phase name -> seconds
+        self._start = None
+
+    def start(self):
+        self._start = time.perf_counter()
+
+    def stop(self, phase):
+        """
+        Record the time since start() for a phase; later calls for the same phase are ignored.
+        """
+        if phase not in self.phases and self._start is not None:
+            self.phases[phase] = time.perf_counter() - self._start
+        self._start = None
+
+    def report(self):
+        """
+        Format the recorded phases as a one-line log message.
+        """
+        parts = [f"{phase.replace('_', ' ')} {self.phases[phase]:.2f}s" for phase in self.PHASES if phase in self.phases]
+        return f"⏱️ Cold start {sum(self.phases.values()):.2f}s: " + ', '.join(parts)
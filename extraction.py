@@ -0,0 +1,74 @@
+# Shared selectors and batch card extraction for the Selenium and Playwright scrapers
+
+# CSS selectors for a search result card and the fields read from it
+CARD_SELECTORS = {
+    'results': '.search-results-container',  # Container of the result list, watched for DOM churn
+    'card': '.reusable-search__result-container, .search-result__info',  # One result card
+    'link': 'a.app-aware-link',  # Profile link (href and fallback name)
+    'name': "span.entity-result__title-text > a > span[aria-hidden='true']",  # Visible profile name
+    'headline': '.entity-result__primary-subtitle',  # Job title / headline
+    'location': '.entity-result__secondary-subtitle',  # Location line
+}
+
+# In-browser function that reads every card on the page in a single call.
+# Returns {cards, count}: count is the number of card elements, so callers need no second
+# round trip to tally extraction failures. A card nested in another match of the selector
+# union (e.g. .search-result__info inside a result container) is the same result and is skipped.
+# Missing optional fields come back as null; cards without a profile link are skipped.
+EXTRACT_CARDS_JS = """
+(sel) => {
+    const text = (root, css) => {
+        const el = root.querySelector(css);
+        return el ? el.innerText.trim() : null;
+    };
+    const cards = [];
+    let count = 0;
+    for (const card of document.querySelectorAll(sel.card)) {
+        if (card.parentElement && card.parentElement.closest(sel.card)) continue;
+        count++;
+        const link = card.querySelector(sel.link);
+        if (!link || !link.href) continue;
+        cards.push({
+            name: text(card, sel.name) || link.innerText.trim(),
+            url: link.href.split('?')[0],
+            headline: text(card, sel.headline),
+            location: text(card, sel.location),
+        });
+    }
+    return {cards, count};
+}
+"""
+
+
+def extract_cards_selenium(driver, selectors=CARD_SELECTORS):
+    """
+    Extract all result cards on the current page with one WebDriver round trip.
+    :param driver: Selenium WebDriver showing a search results page.
+    :param selectors: Selector mapping (defaults to CARD_SELECTORS).
+    :return: (cards, card_count): dicts with name, url, headline and location (None when missing),
+        and the number of card elements on the page.
+    """
+    result = driver.execute_script(f"return ({EXTRACT_CARDS_JS})(arguments[0]);", selectors)
+    return result['cards'], result['count']
+
+
+def extract_cards_playwright(page, selectors=CARD_SELECTORS):
+    """
+    Extract all result cards on the current page with one Playwright evaluate call.
+    :param page: Playwright page showing a search results page.
+    :param selectors: Selector mapping (defaults to CARD_SELECTORS).
+    :return: (cards, card_count), as extract_cards_selenium.
+    """
+    result = page.evaluate(EXTRACT_CARDS_JS, selectors)
+    return result['cards'], result['count']
+
+
+async def extract_cards_playwright_async(page, selectors=CARD_SELECTORS):
+    """
+    Async counterpart of extract_cards_playwright for playwright.async_api pages.
+    :param page: Async Playwright page showing a search results page.
+    :param selectors: Selector mapping (defaults to CARD_SELECTORS).
+    :return: (cards, card_count), as extract_cards_selenium.
+    """
+    result = await page.evaluate(EXTRACT_CARDS_JS, selectors)
+    return result['cards'], result['count']
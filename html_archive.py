@@ -0,0 +1,255 @@
+# Raw-HTML archive of search result pages and an offline, browser-free extractor
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from extraction import CARD_SELECTORS
+
+try:
+    from selectolax.parser import HTMLParser as FastHTMLParser  # Optional fast parser
+except ImportError:
+    FastHTMLParser = None  # Fall back to the standard library parser below
+
+# Tags that never get a closing tag and must not be pushed on the parser stack
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+# Class names matched by the standard library parser (mirrors CARD_SELECTORS)
+CARD_CLASSES = {'reusable-search__result-container', 'search-result__info'}
+LINK_CLASS = 'app-aware-link'
+TITLE_CLASS = 'entity-result__title-text'
+HEADLINE_CLASS = 'entity-result__primary-subtitle'
+LOCATION_CLASS = 'entity-result__secondary-subtitle'
+
+
+# Define the HtmlArchive class
+class HtmlArchive:
+    """
+    Stores each scraped result page as a gzip-compressed HTML file so fields
+    can be re-extracted later without driving the browser again.
+    """
+
+    def __init__(self, directory):
+        """
+        Initialize the archive.
+        :param directory: Directory holding the archived pages (created if missing).
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._seq = 0  # Keeps file names unique within one run
+
+    def save(self, html, url=''):
+        """
+        Save one result page.
+        :param html: Full page HTML.
+        :param url: URL the page was loaded from, stored as a leading HTML comment.
+        :return: Path of the archived file.
+        """
+        self._seq += 1
+        path = os.path.join(self.directory, f'{int(time.time() * 1000)}-{self._seq:05d}.html.gz')
+        with gzip.open(path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            f.write(f'<!-- url: {url} -->\n')
+            f.write(html)
+        return path
+
+    def paths(self):
+        """
+        List archived page files in the order they were saved.
+        """
+        return sorted(
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith('.html.gz')
+        )
+
+
+# Define the CardParser class (standard library fallback)
+class CardParser(HTMLParser):
+    """
+    Streaming parser that pulls the same fields as EXTRACT_CARDS_JS out of
+    raw HTML using class names only.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.cards = []  # Extracted cards
+        self._stack = []  # Open elements: (tag, role)
+        self._card = None  # Card currently being parsed
+        self._buffers = {}  # Active text captures by role
+
+    def _open(self, role):
+        self._buffers[role] = []
+
+    def _close(self, role):
+        text = ' '.join(''.join(self._buffers.pop(role)).split())
+        if self._card is not None and self._card.get(role) is None:
+            self._card[role] = text
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = set((attrs.get('class') or '').split())
+        role = None
+
+        if self._card is None:
+            if classes & CARD_CLASSES:
+                self._card = {'name': None, 'url': None, 'link_text': None, 'headline': None, 'location': None}
+                role = 'card'
+        elif tag == 'a' and LINK_CLASS in classes and self._card['url'] is None and attrs.get('href'):
+            self._card['url'] = attrs['href'].split('?')[0]
+            role = 'link_text'
+        elif tag == 'span' and TITLE_CLASS in classes:
+            role = 'title'
+        elif (tag == 'span' and attrs.get('aria-hidden') == 'true' and len(self._stack) >= 2
+              and self._stack[-1][0] == 'a' and self._stack[-2][1] == 'title' and self._card['name'] is None):
+            role = 'name'
+        elif HEADLINE_CLASS in classes and self._card['headline'] is None:
+            role = 'headline'
+        elif LOCATION_CLASS in classes and self._card['location'] is None:
+            role = 'location'
+
+        if tag in VOID_TAGS:
+            return
+        if role in ('link_text', 'name', 'headline', 'location'):
+            self._open(role)
+        self._stack.append((tag, role))
+
+    def handle_endtag(self, tag):
+        # Pop up to the matching open tag, tolerating unclosed children
+        if not any(open_tag == tag for open_tag, _ in self._stack):
+            return
+        while self._stack:
+            open_tag, role = self._stack.pop()
+            if role in self._buffers:
+                self._close(role)
+            if role == 'card':
+                self._finish_card()
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        for buffer in self._buffers.values():
+            buffer.append(data)
+
+    def _finish_card(self):
+        card, self._card = self._card, None
+        self._buffers.clear()
+        if card['url']:
+            self.cards.append({
+                'name': card['name'] or card['link_text'] or '',
+                'url': card['url'],
+                'headline': card['headline'] or None,
+                'location': card['location'] or None,
+            })
+
+    def close(self):
+        super().close()
+        while self._stack:
+            self.handle_endtag(self._stack[-1][0])
+
+
+def parse_cards(html, base_url=''):
+    """
+    Extract all result cards from raw page HTML.
+    :param html: Page HTML.
+    :param base_url: URL the page was loaded from, used to resolve relative links like the browser does.
+    :return: A list of dicts with name, url, headline and location (None when missing).
+    """
+    if FastHTMLParser is not None:
+        tree = FastHTMLParser(html)
+        cards = []
+        for card in tree.css(CARD_SELECTORS['card']):
+            link = card.css_first(CARD_SELECTORS['link'])
+            if link is None or not link.attributes.get('href'):
+                continue
+            fields = {}
+            for field in ('name', 'headline', 'location'):
+                node = card.css_first(CARD_SELECTORS[field])
+                fields[field] = ' '.join(node.text().split()) if node is not None else None
+            cards.append({
+                'name': fields['name'] or ' '.join(link.text().split()),
+                'url': urljoin(base_url, link.attributes['href']).split('?')[0],
+                'headline': fields['headline'] or None,
+                'location': fields['location'] or None,
+            })
+        return cards
+
+    parser = CardParser()
+    parser.feed(html)
+    parser.close()
+    for card in parser.cards:
+        card['url'] = urljoin(base_url, card['url'])
+    return parser.cards
+
+
+def parse_archived_page(path):
+    """
+    Decompress and parse one archived page (runs inside a worker process).
+    :param path: Path to a `.html.gz` file.
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = f.readline()  # '<!-- url: ... -->' written by HtmlArchive.save
+        base_url = header[len('<!-- url: '):-len(' -->\n')] if header.startswith('<!-- url: ') else ''
+        return parse_cards(f.read(), base_url)
+
+
+def to_record(card, schema='profile'):
+    """
+    Convert an extracted card to the record format written by the scrapers.
+    :param card: Card dict from parse_cards.
+    :param schema: 'profile' for main.py records, 'url' for main2.py/main3.py records.
+    """
+    if schema == 'url':
+        return {'name': card['name'], 'url': card['url']}
+    return {
+        'name': card['name'],
+        'profile_url': card['url'],
+        'headline': card['headline'] or "N/A",
+        'location': card['location'] or "N/A"
+    }
+
+
+def extract_archive(directory, schema='profile', workers=None):
+    """
+    Parse every archived page in a process pool and stream deduplicated records.
+    :param directory: Archive directory.
+    :param schema: Output record format (see to_record).
+    :param workers: Number of worker processes (defaults to the CPU count).
+    """
+    paths = HtmlArchive(directory).paths()
+    visited = set()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Results come back in archive order, so dedup keeps the first sighting like the scrapers do
+        for cards in pool.map(parse_archived_page, paths, chunksize=8):
+            for card in cards:
+                if card['url'] in visited:
+                    continue
+                visited.add(card['url'])
+                yield to_record(card, schema)
+
+
+# Main script execution
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-extract profiles from archived result pages without a browser.")
+    parser.add_argument('archive_dir', help="Directory written by the scrapers' archive option")
+    parser.add_argument('-o', '--output', help="JSON lines output file (default: stdout)")
+    parser.add_argument('--schema', choices=['profile', 'url'], default='profile',
+                        help="Record format: 'profile' (main.py) or 'url' (main2.py/main3.py)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    count = 0
+    try:
+        for record in extract_archive(args.archive_dir, schema=args.schema, workers=args.workers):
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            count += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"✅ Extracted {count} profiles in {time.perf_counter() - start:.2f}s", file=sys.stderr)
@@ -0,0 +1,124 @@
+# Run many keyword/company searches on one logged-in browser session
+import argparse
+import csv
+import json
+import os
+import time
+
+from main import LinkedInScraper  # Selenium-based scraper
+from resource_policy import ResourcePolicy  # Blocks images, fonts, media and trackers
+from sinks import JsonArraySink, drain  # Streaming profile output
+
+
+def load_queries(path):
+    """
+    Load search queries from a CSV file (header: keyword,company,max_profiles),
+    a JSON lines file (.jsonl, one query object per line) or a JSON file (.json, an array of query objects).
+    :param path: Path to the queries file.
+    :return: A list of dicts with keyword, company and max_profiles.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            rows = [json.loads(line) for line in f if line.strip()]
+        elif path.endswith('.json'):
+            rows = json.load(f)
+            if not isinstance(rows, list):
+                raise ValueError(f"{path} must hold a JSON array of query objects")
+        else:
+            rows = list(csv.DictReader(f))
+
+    queries = []
+    for row in rows:
+        queries.append({
+            'keyword': row['keyword'],
+            'company': row.get('company') or '',
+            'max_profiles': int(row.get('max_profiles') or 50),
+        })
+    return queries
+
+
+def run_jobs(scraper, queries, log_file=None):
+    """
+    Run each query in turn on an already logged-in scraper.
+    Profiles seen in an earlier query are skipped because the scraper's visited-URL set is shared.
+    :param scraper: Logged-in LinkedInScraper.
+    :param queries: Queries as returned by load_queries.
+    :param log_file: Optional JSON lines file receiving one result entry per query.
+    :return: A list of per-query result entries.
+    """
+    results = []
+    log = open(log_file, 'a', encoding='utf-8') if log_file else None
+    try:
+        for i, query in enumerate(queries, 1):
+            print(f"🔍 [{i}/{len(queries)}] {query['keyword']} @ {query['company'] or 'any company'}")
+            start = time.perf_counter()
+            entry = dict(query)
+            entry['new_profiles'] = 0
+            try:
+                scraper.search_people(keyword=query['keyword'], company=query['company'])
+                # Profiles are cached as they stream by, so only the count is kept here
+                for _ in scraper.iter_profiles(max_profiles=query['max_profiles']):
+                    entry['new_profiles'] += 1
+                entry['status'] = 'ok'
+            except Exception as e:
+                # One failing search (no results, timeout) should not end the whole run
+                print(f"⚠️ Query failed: {str(e)}")
+                entry['status'] = 'error'
+                entry['error'] = str(e)
+
+            entry['seconds'] = round(time.perf_counter() - start, 3)
+            print(f"✅ {entry['new_profiles']} new profiles in {entry['seconds']:.1f}s")
+            results.append(entry)
+            if log:
+                log.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                log.flush()
+    finally:
+        if log:
+            log.close()
+    return results
+
+
+# Main script execution
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a file of LinkedIn searches on one browser session.")
+    parser.add_argument('queries', help="Queries: CSV (keyword,company,max_profiles), JSON lines (.jsonl) or a JSON array (.json)")
+    parser.add_argument('-o', '--output', default='linkedin_profiles.json', help="File to save all scraped profiles")
+    parser.add_argument('--log', default='job_log.jsonl', help="JSON lines file for per-query results and timing")
+    parser.add_argument('--headed', action='store_true', help="Show the browser window")
+    parser.add_argument('--paginate', choices=['click', 'url'], default='click',
+                        help="Follow the Next button or open each results page by its page number")
+    parser.add_argument('--checkpoint', default=None, help="Checkpoint file for resuming interrupted queries ('url' mode)")
+    parser.add_argument('--cookies', default='linkedin_cookies.json',
+                        help="Saved session cookies, reused while valid ('' to always log in)")
+    parser.add_argument('--refresh-days', type=float, default=None,
+                        help="Refresh mode: re-extract profiles last seen more than this many days ago")
+    args = parser.parse_args()
+
+    # Credentials come from the environment so they stay out of shell history
+    LINKEDIN_EMAIL = os.environ.get('LINKEDIN_EMAIL', 'yourlinkedinemail')
+    LINKEDIN_PASSWORD = os.environ.get('LINKEDIN_PASSWORD', 'yourlinkedinpassword')
+
+    queries = load_queries(args.queries)
+    scraper = LinkedInScraper(
+        headless=not args.headed,
+        max_profiles=sum(q['max_profiles'] for q in queries),
+        paginate=args.paginate,
+        checkpoint_file=args.checkpoint,
+        refresh_ttl=args.refresh_days * 86400 if args.refresh_days is not None else None,
+        cookie_file=args.cookies or None,
+        resource_policy=ResourcePolicy()  # Skip images, fonts, media and trackers
+    )
+
+    run_start = time.perf_counter()
+    try:
+        scraper.login(LINKEDIN_EMAIL, LINKEDIN_PASSWORD)  # Log in once for every query
+        results = run_jobs(scraper, queries, log_file=args.log)
+
+        # Save all cached profiles to a file, streamed from the store
+        drain(scraper.store.iter_unique(), JsonArraySink(args.output))
+
+        total_new = sum(r['new_profiles'] for r in results)
+        print(f"✅ {len(results)} queries, {total_new} new profiles in {time.perf_counter() - run_start:.1f}s "
+              f"-> {args.output}")
+    finally:
+        scraper.close()  # Close the browser once all queries are done
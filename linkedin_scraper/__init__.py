@@ -0,0 +1,2 @@
+# One entry point for all scraper backends; see cli.py (`python -m linkedin_scraper --help`)
+from .backends import BACKENDS, iter_profiles, validate
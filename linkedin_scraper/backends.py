@@ -0,0 +1,142 @@
+# The scrapers as interchangeable backends; a backend's browser library is imported only when it is used
+import os
+
+# Backend name -> what runs behind it
+BACKENDS = {
+    'selenium': "main.py: Chrome via Selenium, credential login, name/URL/headline/location, append-only profile store",
+    'selenium-lite': "main3.py: Chrome via Selenium, credential login, name and URL",
+    'playwright': "main2.py: Chromium via Playwright, reusing the login saved by save_login_state.py",
+}
+
+# Backends that log in with LINKEDIN_EMAIL / LINKEDIN_PASSWORD
+CREDENTIAL_BACKENDS = ('selenium', 'selenium-lite')
+
+
+def validate(backend, keyword, company='', max_profiles=50, paginate='click', refresh_ttl=None,
+             email=None, password=None, user_data_dir=None, cookie_file=None, chrome_profile=None, recycle=False, **_):
+    """
+    Check a scrape configuration without importing any browser library.
+    :param recycle: True if browser recycling was requested (--recycle-mb / --recycle-pages).
+    :return: A list of error messages (empty when the configuration is usable).
+    """
+    errors = []
+    if backend not in BACKENDS:
+        errors.append(f"unknown backend '{backend}' (choose from {', '.join(BACKENDS)})")
+    if not keyword or not keyword.strip():
+        errors.append("keyword must not be empty")
+    if max_profiles < 1:
+        errors.append("max profiles must be at least 1")
+    if paginate not in ('click', 'url'):
+        errors.append("paginate must be 'click' or 'url'")
+    if refresh_ttl is not None and refresh_ttl < 0:
+        errors.append("refresh TTL must not be negative")
+    saved_session = (cookie_file and os.path.isfile(cookie_file)) or (chrome_profile and os.path.isdir(chrome_profile))
+    if backend in CREDENTIAL_BACKENDS and not (email and password) and not saved_session:
+        errors.append(f"the {backend} backend logs in with credentials: set LINKEDIN_EMAIL and LINKEDIN_PASSWORD")
+    if backend == 'selenium-lite' and company:
+        errors.append("the selenium-lite backend has no company filter; use the selenium or playwright backend")
+    if backend == 'selenium-lite' and recycle:
+        errors.append("the selenium-lite backend cannot restart the browser; use the selenium or playwright backend")
+    if backend == 'playwright' and not os.path.isdir(user_data_dir or ''):
+        errors.append(f"no saved login in '{user_data_dir}': run save_login_state.py first")
+    return errors
+
+
+def iter_profiles(backend, keyword, company='', max_profiles=50, **options):
+    """
+    Run one search on the chosen backend and yield each new profile as it is extracted.
+    The browser is closed and the run metrics exported when the generator finishes or is closed.
+    :param backend: One of BACKENDS.
+    :param keyword: Search keyword.
+    :param company: Optional current-company filter.
+    :param max_profiles: Maximum number of new profiles.
+    :param options: headless, paginate, checkpoint_file, refresh_ttl, block_resources, metrics, email, password,
+                    cookie_file and chrome_profile (Selenium login reuse), dedup_db and user_data_dir (Playwright),
+                    recycler (BrowserRecycler; not supported by selenium-lite).
+    """
+    runners = {'selenium': _selenium, 'selenium-lite': _selenium_lite, 'playwright': _playwright}
+    return runners[backend](keyword, company, max_profiles, **options)
+
+
+def _resource_policy(block_resources):
+    from resource_policy import ResourcePolicy
+    return ResourcePolicy() if block_resources else None
+
+
+def _selenium(keyword, company, max_profiles, headless=True, paginate='click', checkpoint_file=None,
+              refresh_ttl=None, block_resources=True, metrics=None, email=None, password=None,
+              dedup_db=None, cache_file='profiles.jsonl', cookie_file=None, chrome_profile=None, recycler=None, **_):
+    from main import LinkedInScraper
+    from dedup_index import UrlIndex
+
+    scraper = LinkedInScraper(
+        headless=headless,
+        max_profiles=max_profiles,
+        cache_file=cache_file,
+        resource_policy=_resource_policy(block_resources),
+        dedup_index=UrlIndex(dedup_db) if dedup_db else None,
+        paginate=paginate,
+        checkpoint_file=checkpoint_file,
+        metrics=metrics,
+        refresh_ttl=refresh_ttl,
+        cookie_file=cookie_file,
+        user_data_dir=chrome_profile,
+        recycler=recycler,
+    )
+    try:
+        scraper.login(email, password)
+        yield from scraper.iter_profiles(keyword, company, max_profiles)
+    finally:
+        scraper.close()
+
+
+def _selenium_lite(keyword, company, max_profiles, headless=True, paginate='click', checkpoint_file=None,
+                   refresh_ttl=None, block_resources=True, metrics=None, email=None, password=None,
+                   dedup_db=None, cookie_file=None, chrome_profile=None, recycler=None, **_):
+    if recycler is not None:
+        raise ValueError("the selenium-lite backend cannot restart the browser")
+    from main3 import LinkedInScraper
+    from dedup_index import UrlIndex
+
+    dedup_index = UrlIndex(dedup_db, ttl=refresh_ttl) if dedup_db else None
+    scraper = LinkedInScraper(
+        email, password,
+        resource_policy=_resource_policy(block_resources),
+        dedup_index=dedup_index,
+        paginate=paginate,
+        checkpoint_file=checkpoint_file,
+        metrics=metrics,
+        headless=headless,
+        cookie_file=cookie_file,
+        user_data_dir=chrome_profile,
+    )
+    try:
+        scraper.login()
+        yield from scraper.iter_profiles(keyword, max_profiles)
+    finally:
+        scraper.close()
+
+
+def _playwright(keyword, company, max_profiles, headless=True, paginate='click', checkpoint_file=None,
+                refresh_ttl=None, block_resources=True, metrics=None, dedup_db=None,
+                user_data_dir='linkedin_user_data', recycler=None, **_):
+    import main2
+
+    # main2.py is configured through its module constants
+    main2.HEADLESS = headless
+    main2.PAGINATE = paginate
+    main2.CHECKPOINT_FILE = checkpoint_file
+    main2.REFRESH_TTL = refresh_ttl
+    main2.RESOURCE_POLICY = _resource_policy(block_resources)
+    main2.USER_DATA_DIR = user_data_dir
+    if dedup_db:
+        main2.DEDUP_DB = dedup_db
+    if metrics is not None:
+        main2.METRICS = metrics
+    if recycler is not None:
+        recycler.metrics = recycler.metrics or main2.METRICS
+        main2.RECYCLER = recycler
+    try:
+        yield from main2.iter_profiles(keyword, max_profiles, company)
+    finally:
+        main2.finish_run()
@@ -0,0 +1,300 @@
+# Command-line entry point: `python -m linkedin_scraper <command> ...`
+# Only the standard library is imported up front; each command imports what it needs when it runs.
+import argparse
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+from .backends import BACKENDS, iter_profiles, validate
+
+
+def _add_browser_options(parser):
+    parser.add_argument('--headed', action='store_true', help="Show the browser window")
+    parser.add_argument('--paginate', choices=['click', 'url'], default='click',
+                        help="Follow the Next button or open each results page by its page number")
+    parser.add_argument('--checkpoint', default=None, help="Checkpoint file for resuming interrupted queries ('url' mode)")
+    parser.add_argument('--refresh-days', type=float, default=None,
+                        help="Refresh mode: re-extract profiles last seen more than this many days ago")
+    parser.add_argument('--no-block', action='store_true', help="Load images, fonts, media and trackers")
+    parser.add_argument('--metrics-json', default='run_summary.json', help="Run summary file ('' to skip)")
+    parser.add_argument('--metrics-prom', default='run_metrics.prom', help="Prometheus textfile ('' to skip)")
+    parser.add_argument('--cookies', default='linkedin_cookies.json',
+                        help="Selenium: saved session cookies, reused while valid ('' to always log in)")
+    parser.add_argument('--chrome-profile', default=None, help="Selenium: persistent Chrome profile directory")
+    parser.add_argument('--recycle-mb', type=float, default=None,
+                        help="Restart the browser between pages once its processes use more than this many MB")
+    parser.add_argument('--recycle-pages', type=int, default=None, help="Restart the browser every N result pages")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='linkedin_scraper', description="LinkedIn people-search scraper.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    scrape = commands.add_parser('scrape', help="Run one search and stream the profiles to a file or stdout",
+                                 description="Backends: " + '; '.join(f'{k}: {v}' for k, v in BACKENDS.items()))
+    scrape.add_argument('keyword', help="Search keyword")
+    scrape.add_argument('--company', default='', help="Current-company filter")
+    scrape.add_argument('-b', '--backend', choices=list(BACKENDS), default='selenium')
+    scrape.add_argument('-n', '--max-profiles', type=int, default=50, help="New profiles to collect")
+    scrape.add_argument('-o', '--output', default='profiles_out.jsonl',
+                        help="Output file: .jsonl, .csv, .json, .parquet or .lpc, or '-' for JSON lines on stdout")
+    scrape.add_argument('--dedup-db', default=None, help="Shared dedup index (SQLite) across backends and runs")
+    scrape.add_argument('--user-data-dir', default='linkedin_user_data',
+                        help="Saved browser profile for the playwright backend")
+    scrape.add_argument('--index', default=None, help="Also add each profile to this search index (SQLite)")
+    scrape.add_argument('--check', action='store_true', help="Validate the configuration and exit")
+    _add_browser_options(scrape)
+    scrape.set_defaults(handler=cmd_scrape)
+
+    jobs = commands.add_parser('jobs', help="Run a file of searches on one logged-in session (selenium backend)")
+    jobs.add_argument('queries', help="Queries: CSV (keyword,company,max_profiles), JSON lines (.jsonl) or a JSON array (.json)")
+    jobs.add_argument('-o', '--output', default='linkedin_profiles.json', help="File to save all scraped profiles")
+    jobs.add_argument('--log', default='job_log.jsonl', help="JSON lines file for per-query results and timing")
+    _add_browser_options(jobs)
+    jobs.set_defaults(handler=cmd_jobs)
+
+    extract = commands.add_parser('extract', help="Re-extract profiles from an HTML archive without a browser")
+    extract.add_argument('archive_dir', help="Directory written by the scrapers' archive option")
+    extract.add_argument('-o', '--output', default='-', help="Output file (.jsonl, .csv, .json) or '-' for stdout")
+    extract.add_argument('--schema', choices=['profile', 'url'], default='profile',
+                         help="Record format: 'profile' (main.py) or 'url' (main2.py/main3.py)")
+    extract.add_argument('-j', '--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    extract.set_defaults(handler=cmd_extract)
+
+    export = commands.add_parser('export', help="Convert profile files to or from the columnar formats",
+                                 description="Reads JSON arrays, JSON lines, .lpc and .parquet files; the output "
+                                             "format follows its extension (.lpc: native dictionary-encoded "
+                                             "columns, .parquet: needs pyarrow).")
+    export.add_argument('inputs', nargs='+', help="Profile files, e.g. profiles.jsonl linkedin_profiles.json")
+    export.add_argument('-o', '--output', default='profiles.lpc', help="Output file (.lpc, .parquet, .jsonl, .csv, "
+                                                                       ".json) or '-' for stdout")
+    export.add_argument('--no-compress', action='store_true', help="Store .lpc columns uncompressed (faster loads)")
+    export.set_defaults(handler=cmd_export)
+
+    merge = commands.add_parser('merge', help="Merge and deduplicate output files of any scraper",
+                                description="Accepts main.py profile files, main2.py/main3.py output.json, main2.py "
+                                            "cache.json URL lists, JSON lines, .lpc and .parquet; deduplicates by "
+                                            "canonical profile URL.")
+    merge.add_argument('inputs', nargs='+', help="Files to merge")
+    merge.add_argument('-o', '--output', default='profiles_merged.jsonl',
+                       help="Output file (.jsonl, .json, .csv, .lpc, .parquet) or '-' for stdout")
+    merge.add_argument('--stats', default=None, help="Also write the merge statistics to this JSON file")
+    merge.add_argument('-j', '--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    merge.add_argument('--memory-limit-mb', type=float, default=512,
+                       help="Total input size above which sorted runs are spilled to disk")
+    merge.add_argument('--tmp-dir', default=None, help="Directory for spilled runs (default: system temp)")
+    merge.set_defaults(handler=cmd_merge)
+
+    index = commands.add_parser('index', help="Add profile files to the search index")
+    index.add_argument('inputs', nargs='+', help="Profile files (any format 'merge' reads)")
+    index.add_argument('--index', default='profiles_index.sqlite', help="Index file")
+    index.set_defaults(handler=cmd_index)
+
+    query = commands.add_parser('query', help="Search the index: words are ANDed, `eng*` is a prefix, "
+                                              "`location:seattle` limits a word to one field")
+    query.add_argument('query', help="E.g. 'ml engineer location:seattle'")
+    query.add_argument('--index', default='profiles_index.sqlite', help="Index file")
+    query.add_argument('-n', '--limit', type=int, default=20, help="Maximum number of results")
+    query.add_argument('--offset', type=int, default=0, help="Matches to skip (paging)")
+    query.add_argument('--json', action='store_true', help="Print JSON lines instead of a table")
+    query.set_defaults(handler=cmd_query)
+    return parser
+
+
+def _credentials():
+    return os.environ.get('LINKEDIN_EMAIL'), os.environ.get('LINKEDIN_PASSWORD')
+
+
+def _metrics(args):
+    from metrics import Metrics
+    return Metrics(args.metrics_json or None, args.metrics_prom or None)
+
+
+def _recycler(args, metrics):
+    if args.recycle_mb is None and args.recycle_pages is None:
+        return None
+    from recycling import BrowserRecycler
+    return BrowserRecycler(max_rss_mb=args.recycle_mb, max_pages=args.recycle_pages, metrics=metrics)
+
+
+def _refresh_ttl(args):
+    return args.refresh_days * 86400 if args.refresh_days is not None else None
+
+
+def cmd_scrape(args):
+    email, password = _credentials()
+    config = {
+        'company': args.company,
+        'max_profiles': args.max_profiles,
+        'headless': not args.headed,
+        'paginate': args.paginate,
+        'checkpoint_file': args.checkpoint,
+        'refresh_ttl': _refresh_ttl(args),
+        'block_resources': not args.no_block,
+        'email': email,
+        'password': password,
+        'dedup_db': args.dedup_db,
+        'user_data_dir': args.user_data_dir,
+        'cookie_file': args.cookies or None,
+        'chrome_profile': args.chrome_profile,
+    }
+    recycle = args.recycle_mb is not None or args.recycle_pages is not None
+    errors = validate(args.backend, args.keyword, recycle=recycle, **config)
+    output_dir = os.path.dirname(os.path.abspath(args.output)) if args.output != '-' else '.'
+    if not os.path.isdir(output_dir):
+        errors.append(f"output directory '{output_dir}' does not exist")
+    if args.checkpoint and args.output.endswith(('.json', '.csv', '.lpc', '.parquet')):
+        # These files are rewritten on close; a resumed run would replace the checkpointed pages' profiles
+        errors.append("--checkpoint needs an append-only output: use a .jsonl file or '-'")
+    if errors:
+        for error in errors:
+            print(f"❌ {error}", file=sys.stderr)
+        return 2
+    if args.check:
+        print(f"✅ Configuration OK ({args.backend}: {BACKENDS[args.backend]})", file=sys.stderr)
+        return 0
+
+    from sinks import JsonlSink, drain, open_sink
+
+    start = time.perf_counter()
+    if args.checkpoint and args.output != '-':
+        sinks = [JsonlSink(args.output, durable=True)]  # On disk before the checkpoint marks the page as done
+    else:
+        sinks = [open_sink(args.output)]  # Bound to the real stdout before progress messages are redirected
+    if args.index:
+        from search_index import IndexSink
+        sinks.append(IndexSink(args.index))
+    metrics = _metrics(args)
+    with redirect_stdout(sys.stderr):  # Progress messages must not mix with JSON lines on stdout
+        profiles = iter_profiles(args.backend, args.keyword, metrics=metrics, recycler=_recycler(args, metrics),
+                                 **config)
+        count = drain(profiles, *sinks)
+    print(f"✅ {count} profiles in {time.perf_counter() - start:.1f}s -> {args.output}", file=sys.stderr)
+    return 0
+
+
+def cmd_jobs(args):
+    email, password = _credentials()
+    if not (email and password):
+        print("❌ set LINKEDIN_EMAIL and LINKEDIN_PASSWORD", file=sys.stderr)
+        return 2
+
+    from job_runner import load_queries, run_jobs
+    from main import LinkedInScraper
+    from resource_policy import ResourcePolicy
+    from sinks import JsonArraySink, drain
+
+    queries = load_queries(args.queries)
+    metrics = _metrics(args)
+    scraper = LinkedInScraper(
+        headless=not args.headed,
+        max_profiles=sum(q['max_profiles'] for q in queries),
+        paginate=args.paginate,
+        checkpoint_file=args.checkpoint,
+        resource_policy=None if args.no_block else ResourcePolicy(),
+        refresh_ttl=_refresh_ttl(args),
+        metrics=metrics,
+        cookie_file=args.cookies or None,
+        user_data_dir=args.chrome_profile,
+        recycler=_recycler(args, metrics),
+    )
+    try:
+        scraper.login(email, password)  # Log in once for every query
+        results = run_jobs(scraper, queries, log_file=args.log)
+        drain(scraper.store.iter_unique(), JsonArraySink(args.output))  # All cached profiles, streamed
+        print(f"✅ {len(results)} queries, {sum(r['new_profiles'] for r in results)} new profiles -> {args.output}")
+    finally:
+        scraper.close()
+    return 0
+
+
+def cmd_extract(args):
+    from html_archive import extract_archive
+    from sinks import drain, open_sink
+
+    start = time.perf_counter()
+    count = drain(extract_archive(args.archive_dir, schema=args.schema, workers=args.workers), open_sink(args.output))
+    print(f"✅ Extracted {count} profiles in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+    return 0
+
+
+def cmd_export(args):
+    from itertools import chain
+    from columnar import ColumnarSink, iter_profile_file
+    from sinks import drain, open_sink
+
+    start = time.perf_counter()
+    try:
+        sink = ColumnarSink(args.output, compress=not args.no_compress) if args.output.endswith('.lpc') \
+            else open_sink(args.output)
+    except ImportError as e:
+        print(f"❌ {e}", file=sys.stderr)  # .parquet without pyarrow
+        return 2
+    count = drain(chain.from_iterable(iter_profile_file(path) for path in args.inputs), sink)
+    size = os.path.getsize(args.output) if args.output != '-' else 0
+    print(f"✅ Exported {count} profiles in {time.perf_counter() - start:.2f}s -> {args.output} ({size:,} bytes)",
+          file=sys.stderr)
+    return 0
+
+
+def cmd_merge(args):
+    import json
+    from merge import merge_files
+    from sinks import open_sink
+
+    missing = [path for path in args.inputs if not os.path.isfile(path)]
+    if missing:
+        print(f"❌ no such file: {', '.join(missing)}", file=sys.stderr)
+        return 2
+    stats = merge_files(args.inputs, open_sink(args.output), workers=args.workers,
+                        memory_limit_mb=args.memory_limit_mb, tmp_dir=args.tmp_dir)
+    print(f"✅ Merged {stats['records']} records from {stats['input_files']} files into {stats['unique']} profiles "
+          f"({stats['duplicates']} duplicates, {stats['invalid']} invalid, {stats['mode']} mode) "
+          f"in {stats['seconds']}s -> {args.output}", file=sys.stderr)
+    if args.stats:
+        with open(args.stats, 'w') as f:
+            json.dump(stats, f, indent=2)
+    return 0
+
+
+def cmd_index(args):
+    from search_index import SearchIndex, index_files
+
+    missing = [path for path in args.inputs if not os.path.isfile(path)]
+    if missing:
+        print(f"❌ no such file: {', '.join(missing)}", file=sys.stderr)
+        return 2
+    start = time.perf_counter()
+    with SearchIndex(args.index) as index:
+        counts = index_files(index, args.inputs)
+        total = len(index)
+    print(f"✅ Indexed {counts['new']} new and {counts['changed']} changed profiles ({counts['unchanged']} unchanged, "
+          f"{counts['invalid']} invalid) in {time.perf_counter() - start:.2f}s; {total} in {args.index}",
+          file=sys.stderr)
+    return 0
+
+
+def cmd_query(args):
+    import json
+    from search_index import SearchIndex
+
+    if not os.path.isfile(args.index):
+        print(f"❌ no index at '{args.index}': run the index command first", file=sys.stderr)
+        return 2
+    start = time.perf_counter()
+    with SearchIndex(args.index) as index:
+        profiles = index.search(args.query, limit=args.limit, offset=args.offset)
+        total = index.count(args.query)
+    for profile in profiles:
+        if args.json:
+            print(json.dumps(profile, ensure_ascii=False))
+        else:
+            print(f"{profile['name']} | {profile['headline']} | {profile['location']} | {profile['profile_url']}")
+    print(f"({total} matches, {(time.perf_counter() - start) * 1000:.1f} ms)", file=sys.stderr)
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
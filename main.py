@@ -1,31 +1,100 @@
 # Import necessary libraries
 import json
 import time
-import random
 from selenium import webdriver  # For browser automation
 from selenium.webdriver.common.by import By  # For locating elements
 from selenium.webdriver.chrome.service import Service  # To manage ChromeDriver
 from selenium.webdriver.support.ui import WebDriverWait  # For explicit waits
 from selenium.webdriver.support import expected_conditions as EC  # For wait conditions
 from selenium.common.exceptions import NoSuchElementException, TimeoutException  # For exception handling
-from webdriver_manager.chrome import ChromeDriverManager  # To automatically manage ChromeDriver
-from urllib.parse import quote  # For URL encoding
-from selenium.webdriver.common.action_chains import ActionChains  # For advanced interactions
+from profile_store import ProfileStore  # Append-only profile storage
+from extraction import CARD_SELECTORS, extract_cards_selenium  # Shared selectors and batch extraction
+from html_archive import HtmlArchive  # Compressed raw-HTML page archive
+from resource_policy import ResourcePolicy  # Blocks images, fonts, media and trackers
+from pacing import RatePolicy, wait_for_results_selenium  # Navigation pacing and page readiness
+from driver_cache import ColdStartTimer, resolve_chromedriver  # Cached ChromeDriver lookup
+from dedup_index import UrlIndex  # Canonical profile-URL dedup index
+from checkpoint import CrawlCheckpoint, build_search_url  # Page-number URLs and resumable crawls
+from metrics import Metrics, record_cards, warn_failing_selectors, timed  # Phase timings and counters
+from session import SeleniumSession  # Saved login reuse
 
 # Define the LinkedInScraper class
 class LinkedInScraper:
-    def __init__(self, headless=True, max_profiles=200, cache_file='profiles.json'):
+    def __init__(self, headless=True, max_profiles=200, cache_file='profiles.jsonl', fsync_interval=20,
+                 batch_extract=True, archive_dir=None, resource_policy=None,
+                 rate_policy=None, dedup_index=None, paginate='click', checkpoint_file=None,
+                 metrics=None, refresh_ttl=None, cookie_file=None, user_data_dir=None, recycler=None,
+                 search_index=None):
         """
         Initialize the LinkedInScraper with options for headless mode, maximum profiles to scrape, and cache file.
+        :param fsync_interval: Number of cached profiles between fsyncs of the cache log.
+        :param batch_extract: Read all cards on a page with one in-browser script call instead of per-field lookups.
+        :param archive_dir: If set, save each result page's HTML there for offline re-extraction.
+        :param resource_policy: Optional ResourcePolicy deciding which requests to block.
+        :param rate_policy: RatePolicy pacing page loads (default: 12 per minute with jitter).
+        :param dedup_index: UrlIndex of seen profiles, shareable with other scrapers (default: `<cache_file>.urls.sqlite`).
+        :param paginate: 'click' to use the Next button, 'url' to open each page directly by its page number.
+        :param checkpoint_file: If set, record progress per query after every page so a restart resumes there ('url' mode).
+        :param metrics: Metrics collecting phase timings and counters; exported by close().
+        :param refresh_ttl: Refresh mode: re-extract profiles last seen more than this many seconds ago and
+                            store them again only if their content changed (None: never re-extract).
+        :param cookie_file: If set, save the session cookies there after a login and reuse them on the next run.
+        :param user_data_dir: If set, keep Chrome's profile (and with it the login) in this directory.
+        :param recycler: Optional BrowserRecycler; Chrome is restarted between pages when it says so.
+        :param search_index: Optional SearchIndex that every stored profile is added to as it is scraped.
         """
         self.cache_file = cache_file  # File to store scraped profiles
+        self.metrics = metrics or Metrics()  # Phase timings and counters
+        self.batch_extract = batch_extract  # Use single-round-trip card extraction
+        self.archive = HtmlArchive(archive_dir) if archive_dir else None  # Optional raw-HTML archive
+        self.resource_policy = resource_policy  # Optional request blocking
+        self.rate_policy = rate_policy or RatePolicy()  # Minimum interval between navigations
+        self.paginate = paginate  # 'click' or 'url'
+        self.checkpoint = CrawlCheckpoint(checkpoint_file) if checkpoint_file else None  # Optional resume points
+        self.search = None  # Current query: keyword, company, key, page and profiles collected
+        self.session = SeleniumSession(cookie_file, user_data_dir) if cookie_file or user_data_dir else None
+        self.store = ProfileStore(cache_file, fsync_interval=fsync_interval)  # Append-only cache storage
+        if cache_file.endswith('.jsonl'):
+            # Adopt the cache of older versions, which wrote the same profiles to `profiles.json`
+            migrated = self.store.migrate_from(cache_file[:-1])
+            if migrated:
+                print(f"📦 Migrated {migrated} cached profiles from {cache_file[:-1]} to {cache_file}")
         self.max_profiles = max_profiles  # Maximum number of profiles to scrape
-        self.scraped_data = self._load_cache()  # Load previously scraped profiles from cache
-        self.visited_urls = set(entry['profile_url'] for entry in self.scraped_data)  # Track visited profile URLs
+        self.run_profiles = 0  # Profiles yielded by this scraper so far, counted against max_profiles
+        self.scraped_data = None  # All cached profiles, loaded by scrape_profiles() only (iter_profiles streams)
+        # Track visited profiles by canonical slug in an on-disk index
+        self.visited_urls = dedup_index if dedup_index is not None else UrlIndex(f'{cache_file}.urls.sqlite')
+        if len(self.visited_urls) == 0:
+            self.visited_urls.add_records(self.store)  # One-time migration (streamed), keeping stamps and hashes
+        self.refresh_ttl = refresh_ttl
+        if refresh_ttl is not None:
+            self.visited_urls.ttl = refresh_ttl  # Stale profiles no longer count as visited
+        self.headless = headless
+        self.recycler = recycler  # Restarts Chrome when it grows too large
+        if recycler is not None and recycler.metrics is None:
+            recycler.metrics = self.metrics
+        self._credentials = None  # Kept by login() so a restarted browser can log in again
+        self.search_index = search_index  # Keeps the keyword index in step with the cache
 
+        # Resolve ChromeDriver from the local cache (webdriver_manager only on a version mismatch)
+        self.cold_start = ColdStartTimer()
+        self.cold_start.start()
+        self.driver_path = resolve_chromedriver()
+        self.cold_start.stop('driver_resolution')
+
+        # Initialize the Chrome WebDriver
+        self.cold_start.start()
+        self.driver = self._start_driver()
+        self.cold_start.stop('browser_launch')
+
+    def _start_driver(self):
+        """
+        Launch Chrome with the scraper's options.
+        :return: The new WebDriver.
+        """
         # Configure Chrome options
         options = webdriver.ChromeOptions()
-        if headless:
+        if self.headless:
             options.add_argument('--headless=new')  # Run in headless mode (no GUI)
 
         # Add browser options to improve performance and bypass detection
@@ -36,37 +105,97 @@ class LinkedInScraper:
         options.add_argument("--no-default-browser-check")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
+        if self.resource_policy:
+            self.resource_policy.apply_chrome_options(options)  # Image blocking and network logging
+        if self.session:
+            self.session.apply_chrome_options(options)  # Persistent Chrome profile
 
-        # Initialize the Chrome WebDriver
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),  # Automatically install ChromeDriver
+        driver = webdriver.Chrome(
+            service=Service(self.driver_path),
             options=options
         )
-        self.driver.implicitly_wait(10)  # Set an implicit wait for element loading
+        # No implicit wait: results are awaited explicitly once per page, so a card
+        # missing an optional field must fail its lookup immediately, not after 10s
+        driver.implicitly_wait(0)
+        if self.resource_policy:
+            self.resource_policy.install_selenium(driver)  # Block heavy resources via CDP
+        return driver
+
+    def _recycle_browser(self):
+        """
+        Restart Chrome between two result pages, log in again and open the next page of the current search.
+        Profiles and seen URLs are flushed first, so nothing is lost or collected twice.
+        :return: True if the next page shows results, False if the search has no more pages.
+        """
+        self.store.sync()
+        self.visited_urls.commit()
+        try:
+            self.driver.quit()
+        except Exception:
+            pass  # A crashed browser is what we are replacing anyway
+        self.driver = self._start_driver()
+        if self._credentials:
+            self.login(*self._credentials)  # Reuses the saved session when there is one
+        elif not (self.session and self.session.restore(self.driver, navigate=self._navigate)):
+            # login() never ran (e.g. an already logged-in Chrome profile) and the session did not carry over
+            self.recycler.recycled()
+            raise RuntimeError("The restarted browser is not logged in and no credentials are known; call login() first")
+
+        self.search['page'] += 1
+        self._navigate(build_search_url(self.search['keyword'], self.search['company'], self.search['page']))
+        try:
+            wait_for_results_selenium(self.driver)
+        except TimeoutException:
+            return False  # Past the last page there are no result cards
+        finally:
+            self.recycler.recycled()  # Logs the memory freed
+        return True
 
     def _load_cache(self):
         """
-        Load previously scraped profiles from the cache file.
+        Load previously scraped profiles by streaming the cache snapshot and log.
         :return: A list of cached profiles.
         """
-        try:
-            with open(self.cache_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []  # Return an empty list if the cache file doesn't exist or is invalid
+        return self.store.load()  # Returns an empty list if nothing has been cached yet
 
-    def _save_to_cache(self):
+    def _save_to_cache(self, profile):
         """
-        Save the current scraped profiles to the cache file.
+        Append a newly scraped profile to the cache log, compacting it when it grows large.
+        :param profile: The profile dictionary that was just scraped.
         """
-        with open(self.cache_file, 'w') as f:
-            json.dump(self.scraped_data, f, indent=2, ensure_ascii=False)
+        with self.metrics.timer('persist'):
+            self.store.append(profile)
+            if self.search_index is not None:
+                self.search_index.add(profile)
+            if self.store.should_compact():
+                self.store.compact()  # Streams the store; profiles are never all held in memory
 
+    def _navigate(self, url):
+        """
+        Open a URL, respecting the navigation rate limit.
+        """
+        self.metrics.observe('pacing', self.rate_policy.wait())  # Respect the navigation rate limit
+        first = 'first_navigation' not in self.cold_start.phases
+        if first:
+            self.cold_start.start()
+        with self.metrics.timer('navigate'):
+            self.driver.get(url)
+        if first:
+            self.cold_start.stop('first_navigation')
+            print(self.cold_start.report())  # Driver resolution, browser launch and first navigation
+
+    @timed('login')
     def login(self, email, password):
         """
         Log in to LinkedIn using the provided email and password.
+        A saved session is reused instead when it is still valid, so the form is only filled in when needed.
         """
-        self.driver.get('https://www.linkedin.com/login')  # Open the LinkedIn login page
+        self._credentials = (email, password)
+        if self.session and self.session.restore(self.driver, navigate=self._navigate):
+            print("🔓 Reusing the saved LinkedIn session")
+            return
+
+        self._navigate('https://www.linkedin.com/login')  # Open the LinkedIn login page
         try:
             # Wait for the login form to load and enter credentials
             WebDriverWait(self.driver, 15).until(
@@ -80,116 +209,262 @@ class LinkedInScraper:
             WebDriverWait(self.driver, 30).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, '.global-nav__me'))
             )
-            time.sleep(random.uniform(3, 5))  # Add a random delay to mimic human behavior
+            if self.session:
+                self.session.save(self.driver)  # Next run can skip this form
         except TimeoutException:
             print("❌ Login failed! Check credentials or solve CAPTCHA manually")
             self.driver.quit()
             exit()
 
+    @timed('search')
     def search_people(self, keyword='software engineer', company='Google'):
         """
         Search for people on LinkedIn based on a keyword and company.
         """
-        # Encode the keyword and company for use in the URL
-        encoded_keyword = quote(keyword)
-        encoded_company = quote(company)
-        
-        # Construct the search URL
-        search_url = f'https://www.linkedin.com/search/results/people/?keywords={encoded_keyword}&currentCompany={encoded_company}'
-        self.driver.get(search_url)  # Navigate to the search page
+        # Resume an interrupted crawl of the same query when jumping to pages by number
+        key = build_search_url(keyword, company)  # Page-1 URL identifies the query
+        page = 1
+        if self.checkpoint and self.paginate == 'url':
+            page = self.checkpoint.resume_page(key)
+        self.search = {
+            'keyword': keyword,
+            'company': company,
+            'key': key,
+            'page': page,
+            'profiles': self.checkpoint.profiles(key) if page > 1 else 0,
+        }
+        if page > 1:
+            print(f"⏩ Resuming '{keyword}' at page {page}")
+
+        self._navigate(build_search_url(keyword, company, page))  # Navigate to the search page
         
-        # Wait for the search results to load
-        WebDriverWait(self.driver, 30).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '.search-results-container'))
-        )
-        time.sleep(random.uniform(3, 5))  # Add a delay to ensure the page is fully loaded
+        # Wait for the search results to appear and stop changing
+        try:
+            wait_for_results_selenium(self.driver, timeout=30)
+        except TimeoutException:
+            if page == 1:
+                raise
+            print("✅ This query was already crawled to its last page.")  # Resumed past the end
+            self._finish_search()
+            self.search['done'] = True
 
-    def scrape_profiles(self):
+    def _finish_search(self):
         """
-        Scrape LinkedIn profiles from the search results.
-        :return: A list of scraped profiles.
+        Mark the current query as fully crawled in the checkpoint file.
         """
+        if self.checkpoint and self.search:
+            self.checkpoint.finish(self.search['key'])
+
+    def _extract_card(self, result):
+        """
+        Extract one profile card field by field (one WebDriver call per lookup).
+        Lookups use find_elements, which returns an empty list at once when a field is missing.
+        :param result: The result card element.
+        :return: A dict with name, url, headline and location, or None if the card has no profile link.
+        """
+        # Extract profile details (name, URL, headline, location)
+        links = result.find_elements(By.CSS_SELECTOR, CARD_SELECTORS['link'])
+        if not links or not links[0].get_attribute('href'):
+            return None  # Not a profile (e.g. a promoted or grouped result)
+        url = links[0].get_attribute('href').split('?')[0]
+        # Same lookup as EXTRACT_CARDS_JS: the link's own text also holds the hidden "View X's profile" label
+        names = result.find_elements(By.CSS_SELECTOR, CARD_SELECTORS['name'])
+        name = names[0].get_attribute('innerText').strip() if names else ''
+        name = name or links[0].get_attribute('innerText').strip()
+
+        headline = result.find_elements(By.CSS_SELECTOR, CARD_SELECTORS['headline'])
+        location = result.find_elements(By.CSS_SELECTOR, CARD_SELECTORS['location'])
+        return {
+            'name': name,
+            'url': url,
+            'headline': headline[0].text.strip() if headline else None,
+            'location': location[0].text.strip() if location else None,
+        }
+
+    def iter_profiles(self, keyword=None, company='', max_profiles=None):
+        """
+        Yield new profiles from the search results one at a time, as soon as each is extracted and cached.
+        Nothing is accumulated in memory, so consumers (see sinks.py) can process profiles while the crawl runs.
+        :param keyword: If given, run search_people(keyword, company) first; otherwise continue the current search.
+        :param max_profiles: Number of new profiles to yield (default: what is left of self.max_profiles
+                             after the profiles this scraper already yielded in this run).
+        """
+        if keyword is not None:
+            self.search_people(keyword=keyword, company=company)
+        if self.search and self.search.get('done'):
+            return  # Nothing left to crawl for this query
+
+        if max_profiles:
+            limit = max_profiles
+        else:
+            # Only this run's profiles count: the dedup index may be shared or hold earlier runs and merged data
+            limit = max(0, self.max_profiles - self.run_profiles)
+        yielded = 0
         step_counter = 0  # Track the number of steps (pages visited)
-        max_steps = self.max_profiles * 2  # Set a limit to avoid infinite loops
-        
-        while len(self.scraped_data) < self.max_profiles and step_counter < max_steps:
-            step_counter += 1
-            try:
-                # Wait for the profile containers to load
-                WebDriverWait(self.driver, 20).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.reusable-search__result-container, .search-result__info'))
-                )  
-
-                # Find all profile cards on the current page
-                results = self.driver.find_elements(By.CSS_SELECTOR, '.reusable-search__result-container, .search-result__info')
-
-                for result in results:
-                    if len(self.scraped_data) >= self.max_profiles:
-                        break
-                    try:
-                        # Extract profile details (name, URL, headline, location)
-                        link_element = result.find_element(By.CSS_SELECTOR, '.app-aware-link')
-                        name = link_element.get_attribute('innerText').strip()
-                        url = link_element.get_attribute('href').split('?')[0]
-
-                        if url not in self.visited_urls:  # Avoid duplicates
-                            try:
-                                headline = result.find_element(
-                                    By.CSS_SELECTOR, '.entity-result__primary-subtitle'
-                                ).text.strip()
-                            except NoSuchElementException:
-                                headline = "N/A"
-
-                            try:
-                                location = result.find_element(
-                                    By.CSS_SELECTOR, '.entity-result__secondary-subtitle'
-                                ).text.strip()
-                            except NoSuchElementException:
-                                location = "N/A"
-
-                            # Add the profile to the scraped data
-                            self.scraped_data.append({
-                                'name': name,
-                                'profile_url': url,
-                                'headline': headline,
-                                'location': location
-                            })
-                            self.visited_urls.add(url)  # Mark the URL as visited
-                            self._save_to_cache()  # Save the updated cache
-                            
-                    except NoSuchElementException:
-                        continue
+        max_steps = limit * 2  # Set a limit to avoid infinite loops
 
-                # Handle pagination (navigate to the next page)
+        try:
+            while yielded < limit and step_counter < max_steps:
+                step_counter += 1
                 try:
-                    next_btn = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Next']")
+                    # Wait for the profile containers to load
+                    with self.metrics.timer('wait'):
+                        WebDriverWait(self.driver, 20).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, CARD_SELECTORS['card']))
+                        )
+
+                    if self.archive:
+                        self.archive.save(self.driver.page_source, self.driver.current_url)  # Keep the raw page
+
+                    # Find all profile cards on the current page
+                    with self.metrics.timer('extract'):
+                        results = self.driver.find_elements(By.CSS_SELECTOR, CARD_SELECTORS['card'])
+                        if self.batch_extract:
+                            cards, card_count = extract_cards_selenium(self.driver)  # One round trip for the whole page
+                        else:
+                            cards, card_count = [self._extract_card(result) for result in results], len(results)
+                        cards = record_cards(self.metrics, cards, card_count)  # Count pages, cards and failed selectors
+
+                    added = 0  # New profiles on this page
+                    partial = False  # Stopped before the page's last card
+                    for card in cards:
+                        if yielded >= limit:
+                            partial = True  # The rest of the page is left for a resumed run
+                            break
+                        if card['url'] in self.visited_urls:  # Avoid duplicates
+                            self.metrics.inc('duplicates_skipped')
+                            continue
+
+                        # Build the profile record
+                        profile = {
+                            'name': card['name'],
+                            'profile_url': card['url'],
+                            'headline': card['headline'] or "N/A",
+                            'location': card['location'] or "N/A"
+                        }
+                        # Mark the URL as visited and stamp the profile with first/last seen and a content hash
+                        status = self.visited_urls.stamp(card['url'], profile)
+                        if status == 'unchanged':
+                            self.metrics.inc('refresh_unchanged')  # Stale but identical: only the index stamp moves
+                            continue
+                        if status == 'changed':
+                            self.metrics.inc('refresh_changed')
+                        self._save_to_cache(profile)  # Append the profile to the cache log (replaces an older version)
+                        added += 1
+                        yielded += 1
+                        self.run_profiles += 1
+                        yield profile
+
+                    if self.resource_policy:
+                        print(self.resource_policy.summary(self.resource_policy.collect_selenium(self.driver)))
+
+                    # Record the finished page so an interrupted run can resume after it
+                    self.search['profiles'] += added
+                    if self.checkpoint:
+                        self.store.sync()  # Profiles must be durable before the page counts as done
+                        self.checkpoint.update(self.search['key'], self.search['page'], self.search['profiles'],
+                                               partial=partial)
+
+                    if yielded >= limit:
+                        break  # No need to load another page
+
+                    # Restart a bloated browser here, between pages, where no profile is half processed
+                    if self.recycler:
+                        self.recycler.page_loaded()
+                        if self.recycler.should_recycle():
+                            if not self._recycle_browser():
+                                print("✅ No more pages to scrape.")
+                                self._finish_search()
+                                break
+                            continue
+
+                    # Handle pagination by page number (no scrolling, clicking or staleness wait)
+                    if self.paginate == 'url':
+                        self.search['page'] += 1
+                        try:
+                            with self.metrics.timer('pagination'):
+                                self._navigate(build_search_url(self.search['keyword'], self.search['company'],
+                                                                self.search['page']))
+                                wait_for_results_selenium(self.driver)
+                        except TimeoutException:
+                            print("✅ No more pages to scrape.")  # Past the last page there are no result cards
+                            self._finish_search()
+                            break
+                        continue
+
+                    # Handle pagination (navigate to the next page)
+                    pagination_start = time.perf_counter()
+                    try:
+                        next_btn = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Next']")
                     
-                    if 'disabled' in next_btn.get_attribute('class'):  # Check if the "Next" button is disabled
-                        print("✅ No more pages to scrape.")
-                        break
+                        if 'disabled' in next_btn.get_attribute('class'):  # Check if the "Next" button is disabled
+                            print("✅ No more pages to scrape.")
+                            self._finish_search()
+                            break
 
-                    # Scroll to the "Next" button and click it
-                    self.driver.execute_script("arguments[0].scrollIntoView();", next_btn)
-                    time.sleep(random.uniform(1, 2))
-                    next_btn.click()
+                        # Scroll to the "Next" button and click it
+                        self.driver.execute_script("arguments[0].scrollIntoView();", next_btn)
+                        self.metrics.observe('pacing', self.rate_policy.wait())  # Respect the navigation rate limit
+                        next_btn.click()
+                        self.search['page'] += 1
 
-                    # Wait for the next page to load
-                    WebDriverWait(self.driver, 20).until(
-                        EC.staleness_of(results[0])
-                    )
-                    time.sleep(random.uniform(3, 5))  # Add a delay for loading
+                        # Wait for the old results to go stale and the new ones to settle
+                        wait_for_results_selenium(self.driver, previous=results[0])
+                        self.metrics.observe('pagination', time.perf_counter() - pagination_start)
                     
-                except Exception as e:
-                    print(f"⚠️ Pagination error: {str(e)}")
-                    break
+                    except Exception as e:
+                        print(f"⚠️ Pagination error: {str(e)}")
+                        break
                 
-            except (NoSuchElementException, TimeoutException) as e:
-                print(f"⚠️ Scraping error: {str(e)}")
-                break
-        
-        self.driver.quit()  # Close the browser
+                except (NoSuchElementException, TimeoutException) as e:
+                    print(f"⚠️ Scraping error: {str(e)}")
+                    break
+        finally:
+            self.store.sync()  # Make sure this search's profiles are on disk, even if the consumer stopped early
+            self.visited_urls.commit()
+            if self.search_index is not None:
+                self.search_index.commit()
+
+    @timed('scrape')
+    def scrape_profiles(self, max_profiles=None):
+        """
+        Scrape LinkedIn profiles from the search results.
+        The browser stays open so several searches can share one session; call close() when done.
+        :param max_profiles: Number of new profiles to collect in this call (default: fill up to self.max_profiles
+                             for this run).
+        :return: A list of all cached profiles, including the new ones. Use iter_profiles() to keep memory flat.
+        """
+        profiles = list(self.iter_profiles(max_profiles=max_profiles))
+        if self.scraped_data is None or self.refresh_ttl is not None:
+            self.scraped_data = self._load_cache()  # First use, or changed profiles replace their older versions
+        else:
+            self.scraped_data.extend(profiles)
         return self.scraped_data
 
+    def close(self):
+        """
+        Compact the cache, export the run metrics and close the browser.
+        """
+        with self.metrics.timer('persist'):
+            self.store.compact()  # Fold the cache log into a fresh snapshot, streaming
+            self.store.close()
+            self.visited_urls.commit()
+            if self.search_index is not None:
+                self.search_index.commit()
+
+        # Add pacing, cold start and blocking totals to the run summary
+        self.metrics.info['pacing'] = self.rate_policy.stats()
+        self.metrics.info['cold_start_s'] = {phase: round(t, 3) for phase, t in self.cold_start.phases.items()}
+        if self.resource_policy:
+            self.metrics.info['resources'] = self.resource_policy.total
+        warn_failing_selectors(self.metrics)  # Per-selector hit/miss tally, with a warning for failing ones
+        self.metrics.export()
+
+        try:
+            self.driver.quit()  # Close the browser
+        except Exception:
+            pass  # Already closed, e.g. after a failed login
+
 # Main script execution
 if __name__ == "__main__":
     HEADLESS = True  # Run in headless mode
@@ -201,7 +476,10 @@ if __name__ == "__main__":
     # Initialize the scraper
     scraper = LinkedInScraper(
         headless=HEADLESS,
-        max_profiles=MAX_PROFILES
+        max_profiles=MAX_PROFILES,
+        resource_policy=ResourcePolicy(),  # Skip images, fonts, media and trackers
+        metrics=Metrics('run_summary.json', 'run_metrics.prom'),  # Timing and counter exports
+        cookie_file='linkedin_cookies.json'  # Reuse the login on the next run
     )
     
     try:
@@ -220,6 +498,7 @@ if __name__ == "__main__":
         
     except Exception as e:
         print(f"❌ Critical error: {str(e)}")
-        scraper.driver.quit()  # Ensure the browser is closed in case of an error
+    finally:
+        scraper.close()  # Ensure the browser is closed
 
 
@@ -1,14 +1,41 @@
 # Import necessary libraries
 from playwright.sync_api import sync_playwright  # Playwright for browser automation
-import json, time, random  # For JSON handling, delays, and randomness
 from pathlib import Path  # For file path handling
+from extraction import CARD_SELECTORS, extract_cards_playwright  # Shared selectors and batch extraction
+from html_archive import HtmlArchive  # Compressed raw-HTML page archive
+from resource_policy import ResourcePolicy  # Blocks images, fonts, media and trackers
+from pacing import RatePolicy, wait_for_results_playwright  # Navigation pacing and page readiness
+from dedup_index import UrlIndex  # Canonical profile-URL dedup index
+from checkpoint import CrawlCheckpoint, build_search_url  # Page-number URLs and resumable crawls
+from metrics import Metrics, record_cards, warn_failing_selectors  # Phase timings and counters
+from sinks import JsonArraySink, JsonlSink, drain  # Streaming profile output
 
 # Constants
-CACHE_FILE = "cache.json"  # File to store cached profile URLs
+CACHE_FILE = "cache.json"  # Legacy list of cached profile URLs, imported into DEDUP_DB once
+DEDUP_DB = "cache.sqlite"  # On-disk index of cached profiles (canonical slugs)
 OUTPUT_FILE = "output.json"  # File to save collected profile data
+RESUMABLE_OUTPUT_FILE = "output.jsonl"  # Append-only output used with CHECKPOINT_FILE, so a resumed run adds to it
 USER_DATA_DIR = "linkedin_user_data"  # Directory for persistent login session
+HEADLESS = False  # Show the browser window (useful for debugging and manual checks)
 MAX_PROFILES = 200  # Maximum number of profiles to scrape
 MAX_ITERATIONS = 20  # Maximum number of iterations (pages) to scan
+BATCH_EXTRACT = True  # Read all cards on a page with one page.evaluate call
+ARCHIVE_DIR = None  # Set to a directory to save each result page's HTML for offline re-extraction
+RESOURCE_POLICY = ResourcePolicy()  # Requests to block; set to None to load pages in full
+RATE_POLICY = RatePolicy(max_per_minute=12, jitter=0.25)  # Page loads per minute, with random jitter
+SEARCH_KEYWORD = "data scientist"  # Search query
+PAGINATE = "click"  # "click" uses the Next button, "url" opens each page directly by its page number
+CHECKPOINT_FILE = None  # Set to e.g. "checkpoints.json" to resume interrupted crawls ("url" mode)
+REFRESH_TTL = None  # Set to e.g. 7 * 86400 to re-extract profiles last seen over a week ago (refresh mode)
+METRICS = Metrics("run_summary.json", "run_metrics.prom")  # Phase timings and counters, exported at the end
+RECYCLER = None  # Set to e.g. recycling.BrowserRecycler(max_rss_mb=1500, metrics=METRICS) to restart Chromium during long crawls
+
+# Chromium flags for the persistent context
+BROWSER_ARGS = [
+    "--disable-blink-features=AutomationControlled",  # Bypass automation detection
+    "--disable-features=site-per-process",  # Disable site isolation
+    "--disable-popup-blocking"  # Disable popup blocking
+]
 
 # Custom User-Agent to Bypass Bot Detection
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
@@ -16,114 +43,230 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTM
 # ⏳ Load Cached Profiles to Avoid Duplicates
 def load_cache():
     """
-    Load cached profile URLs from the cache file to avoid scraping duplicates.
-    :return: A set of cached profile URLs.
+    Open the on-disk index of cached profiles to avoid scraping duplicates.
+    :return: A UrlIndex that supports `in`, `add` and `len` like a set of URLs.
     """
-    if Path(CACHE_FILE).exists():  # Check if the cache file exists
-        with open(CACHE_FILE, "r") as f:
-            return set(json.load(f))  # Load and return the cached URLs as a set
-    return set()  # Return an empty set if the cache file doesn't exist
+    cache = UrlIndex(DEDUP_DB, ttl=REFRESH_TTL)  # Profiles older than the TTL count as unseen
+    if len(cache) == 0 and Path(CACHE_FILE).exists():
+        cache.import_json(CACHE_FILE)  # One-time migration from the old JSON list
+    return cache
 
 # 💾 Save Cache to File
 def save_cache(cache):
     """
-    Save the updated cache of profile URLs to the cache file.
-    :param cache: A set of profile URLs to save.
+    Commit the profile index to disk; only new entries are written.
+    :param cache: The UrlIndex returned by load_cache.
     """
-    with open(CACHE_FILE, "w") as f:
-        json.dump(list(cache), f)  # Save the cache as a JSON list
+    with METRICS.timer("persist"):
+        cache.commit()
 
-# 🔄 Save Collected Profiles
-def save_profiles(profiles):
+# 🌐 Launch the Browser
+def launch_browser(p):
     """
-    Save the collected profile data to the output file.
-    :param profiles: A list of profile data dictionaries to save.
+    Launch the persistent browser context (the saved login lives in USER_DATA_DIR).
+    :param p: The sync_playwright instance.
+    :return: The context and a new page in it.
     """
-    with open(OUTPUT_FILE, "w") as f:
-        json.dump(profiles, f, indent=2)  # Save profiles with indentation for readability
-    print(f"✅ Saved {len(profiles)} profiles to '{OUTPUT_FILE}'")  # Log the save operation
+    # Launch a persistent browser context with anti-detection settings
+    browser = p.chromium.launch_persistent_context(
+        USER_DATA_DIR,  # Use the persistent login directory
+        headless=HEADLESS,
+        args=BROWSER_ARGS,
+        user_agent=USER_AGENT  # Set a custom User-Agent to mimic a real browser
+    )
+    if RESOURCE_POLICY:
+        RESOURCE_POLICY.install_playwright(browser)  # Skip images, fonts, media and trackers
+    return browser, browser.new_page()  # Open a new page in the browser
 
-# 🚀 Main Scraper Function
-def run_scraper():
+# 🧩 Parse a Single Card
+def parse_card(card):
     """
-    Main function to scrape LinkedIn profiles using Playwright.
+    Extract the name and URL from one profile card, one query at a time.
+    :param card: Playwright element handle for the result card.
+    :return: A dict with name and url, or None if the card could not be parsed.
+    """
+    try:
+        # Extract the profile name and URL from the card
+        name_el = card.query_selector(CARD_SELECTORS["name"])
+        link_el = card.query_selector(CARD_SELECTORS["link"])
+        if name_el and link_el:  # Ensure both elements exist
+            name = name_el.inner_text().strip()  # Get the profile name
+            url = link_el.get_attribute("href").split("?")[0]  # Get the profile URL (without query params)
+            return {"name": name, "url": url}
+    except Exception as e:
+        # Handle errors while parsing a profile card
+        print("⚠️ Error parsing card:", e)
+    return None
+
+# 🔁 Stream Profiles
+def iter_profiles(keyword=SEARCH_KEYWORD, max_profiles=MAX_PROFILES, company=""):
+    """
+    Yield new LinkedIn profiles for a search keyword one at a time, as soon as each is extracted.
+    Nothing is accumulated in memory, so consumers (see sinks.py) can process profiles while the crawl runs.
+    :param keyword: Search query.
+    :param max_profiles: Maximum number of new profiles to yield.
+    :param company: Optional current-company filter.
     """
     # Load cached profiles to avoid duplicates
     cache = load_cache()
-    collected = []  # List to store collected profiles
+    collected = 0  # Number of profiles yielded so far
+    archive = HtmlArchive(ARCHIVE_DIR) if ARCHIVE_DIR else None  # Optional raw-HTML archive
+    checkpoint = CrawlCheckpoint(CHECKPOINT_FILE) if CHECKPOINT_FILE else None  # Optional resume points
+    query = build_search_url(keyword, company)  # Page-1 URL identifies the query
+    page_number = checkpoint.resume_page(query) if checkpoint and PAGINATE == "url" else 1
+    earlier = checkpoint.profiles(query) if page_number > 1 else 0  # Profiles from earlier runs
     print(f"⚡ Loaded {len(cache)} profiles from cache...")  # Log the number of cached profiles
 
-    # Use Playwright for browser automation
-    with sync_playwright() as p:
-        # Launch a persistent browser context with anti-detection settings
-        browser = p.chromium.launch_persistent_context(
-            USER_DATA_DIR,  # Use the persistent login directory
-            headless=False,  # Run the browser in non-headless mode for debugging
-            args=[
-                "--disable-blink-features=AutomationControlled",  # Bypass automation detection
-                "--disable-features=site-per-process",  # Disable site isolation
-                "--disable-popup-blocking"  # Disable popup blocking
-            ],
-            user_agent=USER_AGENT  # Set a custom User-Agent to mimic a real browser
-        )
-        page = browser.new_page()  # Open a new page in the browser
-
-        print("🔍 Opening LinkedIn search page...")
-        # Navigate to the LinkedIn search page with the keyword "data scientist"
-        page.goto("https://www.linkedin.com/search/results/people/?keywords=data%20scientist")
-
-        try:
-            # Wait for the search results to load (timeout after 30 seconds)
-            page.wait_for_selector("div.reusable-search__result-container", timeout=30000)
-        except:
-            # Handle timeout if the search results don't load
-            print("❌ Timeout: Search results didn't load.")
-            return
-
-        iteration = 0  # Track the number of iterations (pages scanned)
-        while len(collected) < MAX_PROFILES and iteration < MAX_ITERATIONS:
-            print(f"🔄 Scanning page {iteration + 1}... (So far: {len(collected)})")
-            # Get all profile cards on the current page
-            cards = page.query_selector_all("div.reusable-search__result-container")
-
-            for card in cards:
-                try:
-                    # Extract the profile name and URL from each card
-                    name_el = card.query_selector("span.entity-result__title-text > a > span[aria-hidden='true']")
-                    link_el = card.query_selector("a.app-aware-link")
-                    if name_el and link_el:  # Ensure both elements exist
-                        name = name_el.inner_text().strip()  # Get the profile name
-                        url = link_el.get_attribute("href").split("?")[0]  # Get the profile URL (without query params)
-                        if url not in cache:  # Check if the profile is already cached
-                            collected.append({"name": name, "url": url})  # Add to collected profiles
-                            cache.add(url)  # Add to cache
-                except Exception as e:
-                    # Handle errors while parsing a profile card
-                    print("⚠️ Error parsing card:", e)
+    try:
+        # Use Playwright for browser automation
+        with sync_playwright() as p:
+            browser, page = launch_browser(p)
 
-            # 🚦 Handle Pagination (Next Page)
+            print(f"🔍 Opening LinkedIn search page {page_number}...")
+            # Navigate to the LinkedIn search page for the keyword (or the page to resume on)
+            METRICS.observe("pacing", RATE_POLICY.wait())  # Respect the navigation rate limit
             try:
-                # Find and click the "Next" button to go to the next page
-                next_button = page.query_selector("button[aria-label='Next']")
-                if next_button and next_button.is_enabled():  # Check if the button exists and is enabled
-                    next_button.click()  # Click the "Next" button
-                    time.sleep(random.uniform(3, 6))  # Add a random delay to mimic human behavior
-                else:
-                    # Stop if there are no more pages to navigate
-                    print("🚦 No more pages to navigate.")
+                with METRICS.timer("search"):
+                    page.goto(build_search_url(keyword, company, page_number))
+                    # Wait for the search results to load and settle (timeout after 30 seconds)
+                    wait_for_results_playwright(page, timeout=30)
+            except:
+                # Handle timeout if the search results don't load
+                print("❌ Timeout: Search results didn't load.")
+                return
+
+            iteration = 0  # Track the number of iterations (pages scanned)
+            while collected < max_profiles and iteration < MAX_ITERATIONS:
+                print(f"🔄 Scanning page {page_number}... (So far: {collected})")
+                if archive:
+                    archive.save(page.content(), page.url)  # Keep the raw page
+
+                # Get all profile cards on the current page
+                with METRICS.timer("extract"):
+                    if BATCH_EXTRACT:
+                        cards, card_count = extract_cards_playwright(page)  # One round trip for the whole page
+                    else:
+                        elements = page.query_selector_all(CARD_SELECTORS["card"])
+                        cards = [parse_card(card) for card in elements]
+                        card_count = len(elements)
+                    cards = record_cards(METRICS, cards, card_count)  # Count pages, cards and failed selectors
+
+                partial = False  # Stopped before the page's last card
+                for card in cards:
+                    if collected >= max_profiles:
+                        partial = True  # The rest of the page is left for a resumed run
+                        break
+                    if card["url"] in cache:  # Check if the profile is already cached
+                        METRICS.inc("duplicates_skipped")
+                        continue
+                    profile = {"name": card["name"], "url": card["url"]}
+                    if cache.stamp(card["url"], profile) == "unchanged":  # Add to cache with first/last seen and hash
+                        METRICS.inc("refresh_unchanged")  # Stale but identical, nothing to hand out
+                        continue
+                    collected += 1
+                    yield profile  # Hand the profile to the consumer
+
+                if RESOURCE_POLICY:
+                    print(RESOURCE_POLICY.summary(RESOURCE_POLICY.end_page()))
+
+                # 📍 Record the finished page so an interrupted run can resume after it
+                if checkpoint:
+                    save_cache(cache)  # Seen URLs must be durable before the page counts as done
+                    checkpoint.update(query, page_number, earlier + collected, partial=partial)
+
+                # ♻️ Restart a bloated browser between pages; the login survives in USER_DATA_DIR
+                if RECYCLER and collected < max_profiles:
+                    RECYCLER.page_loaded()
+                    if RECYCLER.should_recycle():
+                        save_cache(cache)  # Seen URLs must be on disk before the old browser goes
+                        browser.close()
+                        browser, page = launch_browser(p)
+                        page_number += 1
+                        METRICS.observe("pacing", RATE_POLICY.wait())  # Respect the navigation rate limit
+                        try:
+                            page.goto(build_search_url(keyword, company, page_number))
+                            wait_for_results_playwright(page)
+                        except Exception:
+                            # A page past the last one shows no result cards
+                            print("🚦 No more pages to navigate.")
+                            if checkpoint:
+                                checkpoint.finish(query)
+                            break
+                        finally:
+                            RECYCLER.recycled()  # Logs the memory freed
+                        iteration += 1
+                        continue
+
+                # 🚦 Handle Pagination (Next Page)
+                if PAGINATE == "url":
+                    # Open the next page directly (no clicking or staleness wait)
+                    page_number += 1
+                    METRICS.observe("pacing", RATE_POLICY.wait())  # Respect the navigation rate limit
+                    try:
+                        with METRICS.timer("pagination"):
+                            page.goto(build_search_url(keyword, company, page_number))
+                            wait_for_results_playwright(page)
+                    except Exception:
+                        # A page past the last one shows no result cards
+                        print("🚦 No more pages to navigate.")
+                        if checkpoint:
+                            checkpoint.finish(query)
+                        break
+                    iteration += 1
+                    continue
+
+                try:
+                    # Find and click the "Next" button to go to the next page
+                    next_button = page.query_selector("button[aria-label='Next']")
+                    if next_button and next_button.is_enabled():  # Check if the button exists and is enabled
+                        previous = page.query_selector(CARD_SELECTORS["card"])  # Must detach before the next page counts as loaded
+                        METRICS.observe("pacing", RATE_POLICY.wait())  # Respect the navigation rate limit
+                        with METRICS.timer("pagination"):
+                            next_button.click()  # Click the "Next" button
+                            page_number += 1
+                            wait_for_results_playwright(page, previous=previous)  # Wait for the new results to settle
+                    else:
+                        # Stop if there are no more pages to navigate
+                        print("🚦 No more pages to navigate.")
+                        if checkpoint:
+                            checkpoint.finish(query)
+                        break
+                except Exception as e:
+                    # Handle errors while clicking the "Next" button
+                    print("⚠️ Couldn't click next:", e)
                     break
-            except Exception as e:
-                # Handle errors while clicking the "Next" button
-                print("⚠️ Couldn't click next:", e)
-                break
 
-            iteration += 1  # Increment the iteration count
+                iteration += 1  # Increment the iteration count
+
+            browser.close()  # Close the browser after scraping is complete
+    finally:
+        save_cache(cache)  # Commit seen URLs even if the consumer stopped early or the crawl failed
 
-        browser.close()  # Close the browser after scraping is complete
+# 🚀 Main Scraper Function
+def run_scraper(sinks=None):
+    """
+    Main function to scrape LinkedIn profiles using Playwright.
+    :param sinks: Sinks from sinks.py receiving each profile (default: a JSON array in OUTPUT_FILE, or
+                  with CHECKPOINT_FILE, JSON lines appended to RESUMABLE_OUTPUT_FILE and fsynced as they come,
+                  so the profiles of checkpointed pages survive a crash and a resumed run keeps them).
+    """
+    if not sinks:
+        sinks = [JsonlSink(RESUMABLE_OUTPUT_FILE, durable=True) if CHECKPOINT_FILE else JsonArraySink(OUTPUT_FILE)]
+    total = drain(iter_profiles(), *sinks)
+    print(f"✅ Saved {total} profiles")
+    finish_run()
 
-    # Save the updated cache and collected profiles
-    save_cache(cache)
-    save_profiles(collected)
+# 📊 Write the Run Summary
+def finish_run():
+    """
+    Add pacing, blocking and selector totals to the run metrics and export them.
+    """
+    # Add pacing and blocking totals to the run summary and write it out
+    METRICS.info["pacing"] = RATE_POLICY.stats()
+    if RESOURCE_POLICY:
+        METRICS.info["resources"] = RESOURCE_POLICY.total
+    warn_failing_selectors(METRICS)  # Per-selector hit/miss tally, with a warning for failing ones
+    METRICS.export()
 
 # Entry point of the script
 if __name__ == "__main__":
@@ -4,18 +4,51 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-import time, json, random
+from extraction import CARD_SELECTORS, extract_cards_selenium  # Shared selectors and batch extraction
+from html_archive import HtmlArchive  # Compressed raw-HTML page archive
+from resource_policy import ResourcePolicy  # Blocks images, fonts, media and trackers
+from pacing import RatePolicy, wait_for_results_selenium  # Navigation pacing and page readiness
+from dedup_index import UrlIndex  # Canonical profile-URL dedup index
+from checkpoint import CrawlCheckpoint, build_search_url  # Page-number URLs and resumable crawls
+from metrics import Metrics, record_cards, warn_failing_selectors, timed  # Phase timings and counters
+from sinks import JsonArraySink, JsonlSink, drain  # Streaming profile output
+from session import SeleniumSession  # Saved login reuse
 
 # Define a class for LinkedIn scraping functionality
 class LinkedInScraper:
-    def __init__(self, email, password):
+    def __init__(self, email, password, batch_extract=True, archive_dir=None, resource_policy=None,
+                 rate_policy=None, dedup_index=None, paginate="click", checkpoint_file=None,
+                 metrics=None, headless=False, cookie_file=None, user_data_dir=None):
         """
         Initialize the LinkedInScraper with user credentials and set up the web driver.
+        :param batch_extract: Read all cards on a page with one in-browser script call instead of per-field lookups.
+        :param archive_dir: If set, save each result page's HTML there for offline re-extraction.
+        :param resource_policy: Optional ResourcePolicy deciding which requests to block.
+        :param rate_policy: RatePolicy pacing page loads (default: 12 per minute with jitter).
+        :param dedup_index: UrlIndex shared across runs or scrapers (default: a fresh in-memory index per search).
+                            Give it a `ttl` to re-extract stale profiles and keep only the changed ones.
+        :param paginate: "click" to use the Next button, "url" to open each page directly by its page number.
+        :param checkpoint_file: If set, record progress per query after every page so a restart resumes there ("url" mode).
+        :param metrics: Metrics collecting phase timings and counters; exported when scraping finishes.
+        :param headless: Run Chrome without a window.
+        :param cookie_file: If set, save the session cookies there after a login and reuse them on the next run.
+        :param user_data_dir: If set, keep Chrome's profile (and with it the login) in this directory.
         """
         self.email = email  # LinkedIn email
+        self.metrics = metrics or Metrics()  # Phase timings and counters
         self.password = password  # LinkedIn password
+        self.batch_extract = batch_extract  # Use single-round-trip card extraction
+        self.archive = HtmlArchive(archive_dir) if archive_dir else None  # Optional raw-HTML archive
+        self.resource_policy = resource_policy  # Optional request blocking
+        self.rate_policy = rate_policy or RatePolicy()  # Minimum interval between navigations
+        self.dedup_index = dedup_index  # Optional persistent dedup index
+        self.paginate = paginate  # "click" or "url"
+        self.checkpoint = CrawlCheckpoint(checkpoint_file) if checkpoint_file else None  # Optional resume points
+        self.headless = headless  # Run without a browser window
+        self.session = SeleniumSession(cookie_file, user_data_dir) if cookie_file or user_data_dir else None
         self.driver = self.init_driver()  # Initialize the Selenium WebDriver
         self.output_file = "output.json"  # File to save scraped data
+        self.resumable_output_file = "output.jsonl"  # Append-only output used with a checkpoint
 
     def init_driver(self):
         """
@@ -26,16 +59,38 @@ class LinkedInScraper:
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_argument("--disable-popup-blocking")
         options.add_argument("--start-maximized")  # Start browser maximized
+        if self.headless:
+            options.add_argument("--headless=new")
         # Prevent detection of automation
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
-        return webdriver.Chrome(options=options)  # Return the configured WebDriver
+        if self.resource_policy:
+            self.resource_policy.apply_chrome_options(options)  # Image blocking and network logging
+        if self.session:
+            self.session.apply_chrome_options(options)  # Persistent Chrome profile
+        driver = webdriver.Chrome(options=options)
+        if self.resource_policy:
+            self.resource_policy.install_selenium(driver)  # Block heavy resources via CDP
+        return driver  # Return the configured WebDriver
 
+    def navigate(self, url):
+        """
+        Open a URL, respecting the navigation rate limit.
+        """
+        self.metrics.observe("pacing", self.rate_policy.wait())  # Respect the navigation rate limit
+        self.driver.get(url)
+
+    @timed("login")
     def login(self):
         """
         Log in to LinkedIn using the provided credentials.
+        A saved session is reused instead when it is still valid, so the form is only filled in when needed.
         """
-        self.driver.get('https://www.linkedin.com/login')  # Open LinkedIn login page
+        if self.session and self.session.restore(self.driver, navigate=self.navigate):
+            print("🔓 Reusing the saved LinkedIn session")
+            return
+
+        self.navigate('https://www.linkedin.com/login')  # Open LinkedIn login page
         try:
             # Wait for the username field to load and enter the email
             WebDriverWait(self.driver, 15).until(
@@ -50,90 +105,173 @@ class LinkedInScraper:
             WebDriverWait(self.driver, 30).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, '.global-nav__me'))
             )
-            time.sleep(random.uniform(2, 4))  # Add a random delay to mimic human behavior
+            if self.session:
+                self.session.save(self.driver)  # Next run can skip this form
         except TimeoutException:
             # Handle login failure (e.g., incorrect credentials or CAPTCHA)
             print("❌ Login failed! Check credentials or solve CAPTCHA manually")
             self.driver.quit()  # Close the browser
             exit()  # Exit the program
 
-    def scrape_profiles(self, keyword="data scientist", max_profiles=200, max_pages=20):
+    def extract_card(self, card):
+        """
+        Extract the name and URL from one profile card, field by field.
+        :param card: The result card element.
+        :return: A dict with name and url, or None if the card could not be parsed.
+        """
+        try:
+            name_el = card.find_element(By.CSS_SELECTOR, CARD_SELECTORS["name"])
+            url_el = card.find_element(By.CSS_SELECTOR, CARD_SELECTORS["link"])
+            name = name_el.text.strip()  # Get the profile name
+            url = url_el.get_attribute("href").split("?")[0]  # Get the profile URL (without query params)
+            return {"name": name, "url": url}
+        except:
+            # Skip profiles that fail to load or parse
+            return None
+
+    def iter_profiles(self, keyword="data scientist", max_profiles=200, max_pages=20):
         """
-        Scrape LinkedIn profiles based on a search keyword.
+        Yield new profiles for a search keyword one at a time, as soon as each is extracted.
+        Nothing is accumulated in memory, so consumers (see sinks.py) can process profiles while the crawl runs.
         :param keyword: The search term to find profiles (default: "data scientist").
-        :param max_profiles: Maximum number of profiles to scrape (default: 200).
+        :param max_profiles: Maximum number of profiles to yield (default: 200).
         :param max_pages: Maximum number of search result pages to scan (default: 20).
         """
-        collected = []  # List to store collected profile data
-        visited = set()  # Set to track visited profile URLs
+        collected = 0  # Number of profiles yielded so far
+        # Track visited profiles by canonical slug
+        visited = self.dedup_index if self.dedup_index is not None else UrlIndex(':memory:')
 
         # Construct the LinkedIn search URL with the given keyword
-        search_url = f"https://www.linkedin.com/search/results/people/?keywords={keyword.replace(' ', '%20')}"
-        self.driver.get(search_url)  # Open the search results page
-        time.sleep(3)  # Wait for the page to load
-
-        for page in range(max_pages):
-            print(f"🔄 Scanning page {page + 1}... Collected so far: {len(collected)}")
-            try:
-                # Wait for the profile cards to load on the page
-                cards = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.reusable-search__result-container"))
-                )
-            except:
-                # Handle case where results fail to load (e.g., rate-limiting or blocking)
-                print("❌ Couldn't load results, possibly blocked.")
-                break
-
-            for card in cards:
+        search_url = build_search_url(keyword)
+        start_page = 1
+        if self.checkpoint and self.paginate == "url":
+            start_page = self.checkpoint.resume_page(search_url)  # Continue an interrupted crawl
+        earlier = self.checkpoint.profiles(search_url) if start_page > 1 else 0  # Profiles from earlier runs
+        self.metrics.observe("pacing", self.rate_policy.wait())  # Respect the navigation rate limit
+        with self.metrics.timer("search"):
+            self.driver.get(build_search_url(keyword, page=start_page))  # Open the search results page
+        previous = None  # A card from the page we just left, which must go stale before we read the next one
+
+        try:
+            for page in range(start_page, start_page + max_pages):
+                print(f"🔄 Scanning page {page}... Collected so far: {collected}")
                 try:
-                    # Extract the profile name and URL from each card
-                    name_el = card.find_element(By.CSS_SELECTOR, "span.entity-result__title-text > a > span[aria-hidden='true']")
-                    url_el = card.find_element(By.CSS_SELECTOR, "a.app-aware-link")
-                    name = name_el.text.strip()  # Get the profile name
-                    url = url_el.get_attribute("href").split("?")[0]  # Get the profile URL (without query params)
-
-                    # Add the profile to the collected list if it hasn't been visited
-                    if url not in visited:
-                        collected.append({"name": name, "url": url})
-                        visited.add(url)
-
-                        # Stop if the maximum number of profiles is reached
-                        if len(collected) >= max_profiles:
-                            break
+                    # Wait for the profile cards to load on the page and stop changing
+                    with self.metrics.timer("wait"):
+                        wait_for_results_selenium(self.driver, previous=previous, timeout=10)
+                    cards = self.driver.find_elements(By.CSS_SELECTOR, CARD_SELECTORS["card"])
+                    previous = cards[0]
                 except:
-                    # Skip profiles that fail to load or parse
+                    if self.paginate == "url" and page > 1:
+                        # Opening a page past the last one shows no result cards
+                        print("🚦 No more pages.")
+                        if self.checkpoint:
+                            self.checkpoint.finish(search_url)
+                        break
+                    # Handle case where results fail to load (e.g., rate-limiting or blocking)
+                    print("❌ Couldn't load results, possibly blocked.")
+                    break
+
+                if self.archive:
+                    self.archive.save(self.driver.page_source, self.driver.current_url)  # Keep the raw page
+
+                with self.metrics.timer("extract"):
+                    if self.batch_extract:
+                        cards, card_count = extract_cards_selenium(self.driver)  # One round trip for the whole page
+                    else:
+                        card_count = len(cards)
+                        cards = [self.extract_card(card) for card in cards]
+                    cards = record_cards(self.metrics, cards, card_count)  # Count pages, cards and failed selectors
+
+                partial = False  # Stopped before the page's last card
+                for card in cards:
+                    # Stop if the maximum number of profiles is reached
+                    if collected >= max_profiles:
+                        partial = True  # The rest of the page is left for a resumed run
+                        break
+                    if card["url"] in visited:
+                        self.metrics.inc("duplicates_skipped")
+                        continue
+
+                    # Hand the profile to the consumer since it hasn't been visited (or was stale and changed)
+                    profile = {"name": card["name"], "url": card["url"]}
+                    if visited.stamp(card["url"], profile) == "unchanged":
+                        self.metrics.inc("refresh_unchanged")
+                        continue
+                    collected += 1
+                    yield profile
+
+                if self.resource_policy:
+                    print(self.resource_policy.summary(self.resource_policy.collect_selenium(self.driver)))
+
+                # Record the finished page so an interrupted run can resume after it
+                if self.checkpoint:
+                    visited.commit()  # Seen URLs must be durable before the page counts as done
+                    self.checkpoint.update(search_url, page, earlier + collected, partial=partial)
+
+                # Stop if the maximum number of profiles is reached
+                if collected >= max_profiles:
+                    break
+
+                if self.paginate == "url":
+                    # Open the next page directly (no scrolling, clicking or staleness wait)
+                    self.metrics.observe("pacing", self.rate_policy.wait())  # Respect the navigation rate limit
+                    with self.metrics.timer("pagination"):
+                        self.driver.get(build_search_url(keyword, page=page + 1))
+                    previous = None
                     continue
 
-            # Stop if the maximum number of profiles is reached
-            if len(collected) >= max_profiles:
-                break
-
-            try:
-                # Find and click the "Next" button to go to the next page of results
-                next_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Next']")
-                if next_button.is_enabled():
-                    next_button.click()
-                    time.sleep(random.uniform(3, 6))  # Add a random delay to mimic human behavior
-                else:
-                    print("🚦 No more pages.")
+                try:
+                    # Find and click the "Next" button to go to the next page of results
+                    next_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Next']")
+                    if next_button.is_enabled():
+                        self.metrics.observe("pacing", self.rate_policy.wait())  # Respect the navigation rate limit
+                        with self.metrics.timer("pagination"):
+                            next_button.click()
+                    else:
+                        print("🚦 No more pages.")
+                        if self.checkpoint:
+                            self.checkpoint.finish(search_url)
+                        break
+                except:
+                    # Handle case where the "Next" button is not clickable
+                    print("⚠️ Can't click next, ending.")
                     break
-            except:
-                # Handle case where the "Next" button is not clickable
-                print("⚠️ Can't click next, ending.")
-                break
+        finally:
+            visited.commit()
 
-        # Save the collected profiles to a JSON file
-        self.save_to_file(collected)
-        print(f"✅ Done! Total profiles collected: {len(collected)}")
-        self.driver.quit()  # Close the browser
+    @timed("scrape")
+    def scrape_profiles(self, keyword="data scientist", max_profiles=200, max_pages=20, sinks=None):
+        """
+        Scrape LinkedIn profiles based on a search keyword, streaming each one to the sinks.
+        :param keyword: The search term to find profiles (default: "data scientist").
+        :param max_profiles: Maximum number of profiles to scrape (default: 200).
+        :param max_pages: Maximum number of search result pages to scan (default: 20).
+        :param sinks: Sinks from sinks.py receiving each profile (default: a JSON array in self.output_file, or
+                      with a checkpoint, JSON lines appended to self.resumable_output_file and fsynced as they
+                      come, so the profiles of checkpointed pages survive a crash and a resumed run keeps them).
+        """
+        if not sinks:
+            sinks = [JsonlSink(self.resumable_output_file, durable=True) if self.checkpoint
+                     else JsonArraySink(self.output_file)]
+        total = drain(self.iter_profiles(keyword, max_profiles, max_pages), *sinks)
+        print(f"✅ Done! Total profiles collected: {total}")
+        self.close()
 
-    def save_to_file(self, data):
+    def close(self):
         """
-        Save the collected profile data to a JSON file.
-        :param data: List of profile data to save.
+        Export the run metrics and close the browser.
         """
-        with open(self.output_file, "w") as f:
-            json.dump(data, f, indent=2)  # Write data to file with indentation for readability
+        # Add pacing and blocking totals to the run summary and write it out
+        self.metrics.info["pacing"] = self.rate_policy.stats()
+        if self.resource_policy:
+            self.metrics.info["resources"] = self.resource_policy.total
+        warn_failing_selectors(self.metrics)  # Per-selector hit/miss tally, with a warning for failing ones
+        self.metrics.export()
+        try:
+            self.driver.quit()  # Close the browser
+        except Exception:
+            pass  # Already closed, e.g. after a failed login
 
 #  Usage example
 if __name__ == "__main__":
@@ -143,6 +281,8 @@ if __name__ == "__main__":
     # Note: Make sure to handle your credentials securely in production code
 
     # Create an instance of the scraper and start scraping
-    scraper = LinkedInScraper(EMAIL, PASSWORD)
+    scraper = LinkedInScraper(EMAIL, PASSWORD, resource_policy=ResourcePolicy(),
+                              metrics=Metrics("run_summary.json", "run_metrics.prom"),
+                              cookie_file="linkedin_cookies.json")  # Reuse the login on the next run
     scraper.login()  # Log in to LinkedIn
     scraper.scrape_profiles(keyword="data scientist", max_profiles=100)  # Scrape profiles based on the keyword
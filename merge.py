@@ -0,0 +1,291 @@
+# Merge the scrapers' output files into one deduplicated dataset, spilling to sorted runs when it will not fit in RAM
+import heapq
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from dedup_index import canonical_profile_slug, content_hash
+
+TEXT_FIELDS = ('name', 'headline', 'location')  # Filled with "N/A" when a source does not have them
+EMPTY = (None, '', 'N/A')
+CHUNK_BYTES = 64 * 2 ** 20  # JSON lines files are parsed in chunks of this size, in parallel
+MERGE_FAN_IN = 256  # Most run files open at once in one k-way merge (stays under the usual 1024-descriptor limit)
+
+
+def normalize(item):
+    """
+    Bring a record from any scraper to the main.py schema.
+    Accepts main.py profiles (`profile_url`), main2.py/main3.py records (`url`)
+    and the bare URLs of main2.py's `cache.json`.
+    :return: (canonical slug, profile dict), or None if the item has no profile URL.
+    """
+    if isinstance(item, str):
+        item = {'url': item}
+    elif not isinstance(item, dict):
+        return None
+    url = item.get('profile_url') or item.get('url')
+    if not isinstance(url, str) or not url.strip():
+        return None
+    profile = {field: item.get(field) or "N/A" for field in TEXT_FIELDS}
+    profile['profile_url'] = url.strip().split('?')[0]
+    for field in ('first_seen', 'last_seen', 'content_hash'):
+        if item.get(field):
+            profile[field] = item[field]
+    # Keep the main.py field order: name, profile_url, headline, location, stamps
+    profile = {'name': profile.pop('name'), 'profile_url': profile.pop('profile_url'), **profile}
+    return canonical_profile_slug(url), profile
+
+
+def merge_records(old, new):
+    """
+    Combine two records of the same profile. A known value never gives way to "N/A";
+    when both know a field, the more recently seen record wins (the later one on a tie).
+    First-seen and last-seen stamps span both records.
+    """
+    newer_first = old.get('last_seen', '') <= new.get('last_seen', '')
+    primary, secondary = (new, old) if newer_first else (old, new)
+    merged = dict(secondary)
+    merged.update({key: value for key, value in primary.items() if value not in EMPTY})
+    for key in ('first_seen', 'last_seen'):
+        stamps = [r[key] for r in (old, new) if r.get(key)]
+        if stamps:
+            merged[key] = min(stamps) if key == 'first_seen' else max(stamps)
+    if 'content_hash' in merged:
+        merged['content_hash'] = content_hash(merged)  # The merged content may differ from both inputs
+    return merged
+
+
+def _tasks(path):
+    """
+    Split an input into parse tasks: byte ranges of a JSON lines file, or the whole file for other formats.
+    """
+    from columnar import is_columnar
+
+    size = os.path.getsize(path)
+    if is_columnar(path):
+        return [(path, None, None)]
+    with open(path, 'rb') as f:
+        head = f.read(4096).lstrip()
+    if head.startswith(b'['):
+        return [(path, None, None)]  # A JSON array is streamed by one worker, not split into chunks
+    return [(path, start, min(start + CHUNK_BYTES, size)) for start in range(0, max(size, 1), CHUNK_BYTES)]
+
+
+def iter_json_array(f, chunk_size=2 ** 20):
+    """
+    Stream the elements of a JSON array file one at a time, so a large array
+    is never held in memory as a whole (only one element and one chunk are).
+    :param f: Text file positioned before the opening bracket.
+    :param chunk_size: Characters read at a time.
+    :raises json.JSONDecodeError: On invalid or truncated input, after yielding the elements before it.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = '', 0, False
+
+    def fill():
+        nonlocal buffer, pos, eof
+        more = f.read(chunk_size)
+        eof = not more
+        buffer, pos = buffer[pos:] + more, 0
+
+    def skip(separators):
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in separators:
+                pos += 1
+            if pos < len(buffer) or eof:
+                return
+            fill()
+
+    skip(' \t\r\n')
+    if buffer[pos:pos + 1] != '[':
+        raise json.JSONDecodeError("Expected a JSON array", buffer, pos)
+    pos += 1
+    while True:
+        skip(' \t\r\n,')
+        if pos >= len(buffer):
+            raise json.JSONDecodeError("Unterminated JSON array", buffer, pos)
+        if buffer[pos] == ']':
+            return
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            fill()  # The element continues in the next chunk
+            continue
+        if end == len(buffer) and not eof:
+            fill()  # A number at the end of the chunk may continue in the next one
+            continue
+        yield item
+        pos = end
+
+
+def _read_task(path, start, end, stats):
+    if start is None:
+        from columnar import iter_profile_file, is_columnar
+        if is_columnar(path):
+            yield from iter_profile_file(path)
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                yield from iter_json_array(f)
+        except json.JSONDecodeError:
+            stats['invalid'] += 1
+        return
+
+    with open(path, 'rb') as f:
+        # A line belongs to the chunk it starts in
+        if start:
+            f.seek(start - 1)
+            f.readline()
+        position = f.tell()
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                stats['invalid'] += 1  # E.g. a torn last line after a crash
+
+
+def _write_run(buffer, run_dir):
+    fd, path = tempfile.mkstemp(suffix='.run', dir=run_dir)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for key in sorted(buffer):
+            f.write(json.dumps([key, buffer[key]], ensure_ascii=False) + '\n')
+    return path
+
+
+def parse_task(task):
+    """
+    Worker: parse one task and dedupe its records.
+    In memory mode the deduplicated records are returned; with a run directory
+    they are written as sorted run files of at most `run_size` profiles each.
+    :param task: (path, start, end, run_dir, run_size).
+    :return: (stats, records or None, run paths).
+    """
+    path, start, end, run_dir, run_size = task
+    stats = {'path': path, 'records': 0, 'invalid': 0}
+    buffer, runs = {}, []
+    for item in _read_task(path, start, end, stats):
+        normalized = normalize(item)
+        if normalized is None:
+            stats['invalid'] += 1
+            continue
+        stats['records'] += 1
+        key, profile = normalized
+        buffer[key] = merge_records(buffer[key], profile) if key in buffer else profile
+        if run_dir and len(buffer) >= run_size:
+            runs.append(_write_run(buffer, run_dir))
+            buffer = {}
+    if run_dir:
+        if buffer:
+            runs.append(_write_run(buffer, run_dir))
+        return stats, None, runs
+    return stats, list(buffer.items()), runs
+
+
+def _read_run(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def _merge_runs(runs, run_dir):
+    """
+    Merge sorted runs into one sorted run and delete them. Records are not combined here,
+    and equal keys keep their input order, so the final merge sees them as if read directly.
+    """
+    fd, path = tempfile.mkstemp(suffix='.run', dir=run_dir)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for item in heapq.merge(*(_read_run(run) for run in runs), key=lambda item: item[0]):
+            f.write(json.dumps(item, ensure_ascii=False) + '\n')
+    for run in runs:
+        os.remove(run)
+    return path
+
+
+def merge_files(paths, sink, workers=None, memory_limit_mb=512, run_size=200_000, tmp_dir=None,
+                fan_in=MERGE_FAN_IN):
+    """
+    Merge profile files of any scraper into one sink, one record per canonical profile URL.
+    Inputs are parsed in a process pool. If their total size exceeds `memory_limit_mb`,
+    each worker writes sorted runs to disk and the runs are merged with a k-way merge,
+    so memory stays bounded; the output is then ordered by profile slug instead of input order.
+    :param paths: Input files: JSON arrays, JSON lines, URL lists, .lpc or .parquet.
+    :param sink: Sink from sinks.py receiving the merged profiles (closed when done).
+    :param workers: Worker processes (default: CPU count).
+    :param memory_limit_mb: Input size above which the external sort-merge is used.
+    :param run_size: Profiles per sorted run file in external mode.
+    :param tmp_dir: Directory for the run files (default: the system temp directory).
+    :param fan_in: Most runs merged at once; with more runs, batches of them are first merged
+                   into intermediate runs, so open files stay bounded however many runs there are.
+    :return: Merge statistics.
+    """
+    start = time.perf_counter()
+    input_bytes = sum(os.path.getsize(path) for path in paths)
+    external = input_bytes > memory_limit_mb * 2 ** 20
+    stats = {'mode': 'external' if external else 'memory', 'input_files': len(paths), 'input_bytes': input_bytes,
+             'records': 0, 'invalid': 0, 'unique': 0, 'duplicates': 0, 'runs': 0, 'merge_passes': 0, 'files': {}}
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir:
+        tasks = [(path, first, end, run_dir if external else None, run_size)
+                 for source in paths for path, first, end in _tasks(source)]
+        merged, runs = {}, []
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # Results come back in input order, so later files and later lines win ties
+                for task_stats, records, task_runs in pool.map(parse_task, tasks):
+                    file_stats = stats['files'].setdefault(task_stats['path'], {'records': 0, 'invalid': 0})
+                    for key in ('records', 'invalid'):
+                        file_stats[key] += task_stats[key]
+                        stats[key] += task_stats[key]
+                    runs.extend(task_runs)
+                    for key, profile in records or ():
+                        merged[key] = merge_records(merged[key], profile) if key in merged else profile
+
+            if external:
+                stats['runs'] = len(runs)
+                fan_in = max(2, fan_in)
+                while len(runs) > fan_in:
+                    # Consecutive batches keep equal keys in input order across passes
+                    runs = [_merge_runs(runs[i:i + fan_in], run_dir) for i in range(0, len(runs), fan_in)]
+                    stats['merge_passes'] += 1
+                current_key, current = None, None
+                # heapq.merge is stable, so equal keys arrive in input order
+                for key, profile in heapq.merge(*(_read_run(run) for run in runs), key=lambda item: item[0]):
+                    if key == current_key:
+                        current = merge_records(current, profile)
+                        continue
+                    if current is not None:
+                        sink.write(current)
+                        stats['unique'] += 1
+                    current_key, current = key, profile
+                if current is not None:
+                    sink.write(current)
+                    stats['unique'] += 1
+            else:
+                for profile in merged.values():
+                    sink.write(profile)
+                stats['unique'] = len(merged)
+        finally:
+            sink.close()
+
+    stats['duplicates'] = stats['records'] - stats['unique']
+    stats['seconds'] = round(time.perf_counter() - start, 3)
+    return stats
+
+
+# Main script execution: same as `python -m linkedin_scraper merge ...`
+if __name__ == "__main__":
+    from linkedin_scraper.cli import main
+
+    sys.exit(main(['merge', *sys.argv[1:]]))
@@ -0,0 +1,249 @@
+# Per-phase timing histograms and counters with JSON and Prometheus text exports
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+
+from extraction import CARD_SELECTORS
+
+# Histogram bucket upper bounds in seconds (Prometheus `le` labels)
+BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, float('inf'))
+
+PREFIX = 'linkedin_scraper'  # Metric name prefix in the Prometheus export
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{value}"' for key, value in labels) + '}'
+
+
+# Define the Histogram class
+class Histogram:
+    """
+    Cumulative-bucket histogram of durations, plus min/max for the JSON summary.
+    """
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, seconds):
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        self.count += 1
+        self.sum += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            total += count
+            yield bound, total
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'total_s': round(self.sum, 4),
+            'mean_s': round(self.sum / self.count, 4) if self.count else None,
+            'min_s': round(self.min, 4) if self.min is not None else None,
+            'max_s': round(self.max, 4) if self.max is not None else None,
+        }
+
+
+# Define the Metrics class
+class Metrics:
+    """
+    Collects phase timings (login, search, wait, extract, pagination, persist, ...)
+    and counters (pages, cards seen, duplicates skipped, extraction failures by selector).
+    """
+
+    def __init__(self, json_path=None, prometheus_path=None):
+        """
+        :param json_path: Where export() writes the JSON run summary (None to skip).
+        :param prometheus_path: Where export() writes the Prometheus text-format file (None to skip).
+        """
+        self.json_path = json_path
+        self.prometheus_path = prometheus_path
+        self.started = time.time()
+        self.histograms = {}  # phase -> Histogram
+        self.counters = {}  # (name, labels) -> value
+        self.info = {}  # Extra sections for the JSON summary (pacing, resources, ...)
+
+    def observe(self, phase, seconds):
+        """
+        Record one duration for a phase.
+        """
+        self.histograms.setdefault(phase, Histogram()).observe(seconds)
+
+    @contextmanager
+    def timer(self, phase):
+        """
+        Time the enclosed block as one observation of `phase`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - start)
+
+    def inc(self, name, amount=1, **labels):
+        """
+        Increase a counter, e.g. inc('extraction_failures', selector='headline').
+        """
+        key = (name, _label_key(labels))
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def count(self, name, **labels):
+        """
+        Current value of a counter.
+        """
+        return self.counters.get((name, _label_key(labels)), 0)
+
+    def summary(self):
+        """
+        Build the JSON run summary.
+        """
+        counters = {}
+        for (name, labels), value in sorted(self.counters.items()):
+            if labels:
+                counters.setdefault(name, {})[','.join(f'{k}={v}' for k, v in labels)] = value
+            else:
+                counters[name] = value
+        summary = {
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+            'duration_s': round(time.time() - self.started, 3),
+            'phases': {phase: hist.summary() for phase, hist in sorted(self.histograms.items())},
+            'counters': counters,
+        }
+        summary.update(self.info)
+        return summary
+
+    def prometheus(self):
+        """
+        Render all metrics in the Prometheus text exposition format.
+        """
+        lines = [
+            f'# HELP {PREFIX}_phase_seconds Time spent per scraper phase.',
+            f'# TYPE {PREFIX}_phase_seconds histogram',
+        ]
+        for phase, hist in sorted(self.histograms.items()):
+            for bound, total in hist.cumulative():
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{PREFIX}_phase_seconds_bucket{{phase="{phase}",le="{le}"}} {total}')
+            lines.append(f'{PREFIX}_phase_seconds_sum{{phase="{phase}"}} {hist.sum:.6f}')
+            lines.append(f'{PREFIX}_phase_seconds_count{{phase="{phase}"}} {hist.count}')
+
+        typed = set()
+        for (name, labels), value in sorted(self.counters.items()):
+            metric = f'{PREFIX}_{name}_total'
+            if metric not in typed:
+                lines.append(f'# TYPE {metric} counter')
+                typed.add(metric)
+            lines.append(f'{metric}{_format_labels(labels)} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self):
+        """
+        Write the JSON summary and/or Prometheus file, whichever paths are configured.
+        Files are written to a temp name and renamed so a dashboard collector never reads a partial file.
+        """
+        for path, content in ((self.json_path, lambda: json.dumps(self.summary(), indent=2)),
+                              (self.prometheus_path, self.prometheus)):
+            if not path:
+                continue
+            tmp_path = f'{path}.tmp'
+            with open(tmp_path, 'w') as f:
+                f.write(content())
+            os.replace(tmp_path, path)
+
+
+def timed(phase):
+    """
+    Method decorator timing each call as one observation of `phase` on `self.metrics`.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.timer(phase):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_cards(metrics, cards, card_elements):
+    """
+    Count cards seen on a page and tally hits and misses per selector.
+    Warns straight away when a selector matched none of the cards on a page, which
+    usually means the site's markup changed.
+    :param metrics: Metrics instance.
+    :param cards: Extracted card dicts (None for a card whose link could not be read).
+    :param card_elements: Number of result card elements on the page.
+    :return: The extracted cards, without the None entries.
+    """
+    metrics.inc('pages')
+    metrics.inc('cards_seen', card_elements)
+    extracted = [card for card in cards if card is not None]
+    tally = {'link': (len(extracted), max(0, card_elements - len(extracted)))}
+    for field in ('headline', 'location'):
+        present = [card for card in extracted if field in card]  # Backends that read the field at all
+        if present:
+            hits = sum(1 for card in present if card[field])
+            tally[field] = (hits, len(present) - hits)
+
+    for selector, (hits, misses) in tally.items():
+        if hits:
+            metrics.inc('selector_hits', hits, selector=selector)
+        if misses:
+            metrics.inc('extraction_failures', misses, selector=selector)
+        if misses and not hits:
+            print(f"⚠️ Selector for '{selector}' ({CARD_SELECTORS[selector]}) matched none of {misses} cards on this page")
+    return extracted
+
+
+def selector_report(metrics, min_hit_rate=0.5, min_cards=20):
+    """
+    Summarise the per-selector tallies for the run summary.
+    :param metrics: Metrics instance filled by record_cards.
+    :param min_hit_rate: Hit rate below which a selector is flagged as failing.
+    :param min_cards: Cards a selector must have been tried on before it can be flagged.
+    :return: Dict of selector -> hits, misses, hit_rate and failing.
+    """
+    report = {}
+    for selector in ('link', 'headline', 'location'):
+        hits = metrics.count('selector_hits', selector=selector)
+        misses = metrics.count('extraction_failures', selector=selector)
+        if not hits + misses:
+            continue
+        rate = hits / (hits + misses)
+        report[selector] = {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(rate, 3),
+            'failing': hits + misses >= min_cards and rate < min_hit_rate,
+        }
+    return report
+
+
+def warn_failing_selectors(metrics):
+    """
+    Add the selector report to the run summary and warn about each failing selector.
+    :param metrics: Metrics instance filled by record_cards.
+    :return: The selector report (see selector_report).
+    """
+    report = metrics.info['selectors'] = selector_report(metrics)  # Per-selector hit/miss tally
+    for selector, tally in report.items():
+        if tally['failing']:
+            print(f"⚠️ Selector '{selector}' matched only {tally['hit_rate']:.0%} of cards; the markup may have changed")
+    return report
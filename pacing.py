@@ -0,0 +1,193 @@
+# Politeness pacing (how often we navigate) kept separate from readiness (when a page is loaded)
+import asyncio
+import random
+import time
+
+from extraction import CARD_SELECTORS
+
+FALLBACK_TIMEOUT_MS = 3000  # Longest settle wait when only document.body can be observed
+
+# Resolves once the results list has gone `quietMs` without DOM mutations (or after `timeoutMs`).
+# Watches the results container, else the parent of the card list; the whole body (which
+# never stops churning on a live page) is only a last resort, with its wait capped at `fallbackMs`.
+# Used as a promise by Playwright's page.evaluate and via execute_async_script in Selenium.
+RESULTS_SETTLED_JS = """
+({selector, resultsSelector, quietMs, timeoutMs, fallbackMs}) => new Promise((resolve) => {
+    const card = document.querySelector(selector);
+    const list = card && card.parentElement;
+    let root = document.querySelector(resultsSelector) || (list && (list.parentElement || list));
+    if (!root) {
+        root = document.body;
+        timeoutMs = Math.min(timeoutMs, fallbackMs);
+    }
+    let quietTimer = null;
+    const finish = () => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(deadline);
+        resolve(document.querySelectorAll(selector).length);
+    };
+    const rearm = () => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(finish, quietMs);
+    };
+    const observer = new MutationObserver(rearm);
+    observer.observe(root, {childList: true, subtree: true, characterData: true});
+    const deadline = setTimeout(finish, timeoutMs);
+    rearm();
+})
+"""
+
+
+# Define the RatePolicy class
+class RatePolicy:
+    """
+    Token bucket limiting page loads per minute.
+
+    Call `wait()` right before every navigation (goto, get, Next click). It
+    only sleeps when the previous navigations were closer together than the
+    configured rate allows, plus a random jitter on top of the required wait.
+    """
+
+    def __init__(self, max_per_minute=12, jitter=0.25, burst=1):
+        """
+        Initialize the policy.
+        :param max_per_minute: Maximum page loads per minute (must be positive).
+        :param jitter: Extra random delay, as a fraction of the minimum interval, added whenever we wait.
+        :param burst: Number of navigations allowed back to back before pacing kicks in.
+        """
+        if not max_per_minute or max_per_minute <= 0:
+            raise ValueError(f"max_per_minute must be a positive number, got {max_per_minute!r}")
+        self.interval = 60.0 / max_per_minute  # Minimum seconds between navigations
+        self.jitter = jitter
+        self.capacity = burst
+        self.tokens = float(burst)  # Start full so the first navigation is immediate
+        self.updated = time.monotonic()
+        self.navigations = 0  # Navigations paced so far
+        self.total_wait = 0.0  # Seconds spent sleeping for pacing
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval)
+        self.updated = now
+
+    def delay(self):
+        """
+        Seconds to sleep before the next navigation is allowed (without jitter).
+        """
+        self._refill()
+        return max(0.0, (1.0 - self.tokens) * self.interval)
+
+    def acquire(self):
+        """
+        Compute the wait for the next navigation and take its token.
+        :return: Seconds the caller must sleep before navigating.
+        """
+        delay = self.delay()
+        if delay > 0:
+            delay += random.uniform(0, self.jitter * self.interval)
+        # Spend the token now; the sleep below pays back the deficit
+        self.tokens -= 1.0
+        self.navigations += 1
+        self.total_wait += delay
+        return delay
+
+    def wait(self):
+        """
+        Block until the next navigation is allowed.
+        :return: Seconds slept.
+        """
+        delay = self.acquire()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def wait_async(self):
+        """
+        Async version of wait(); safe to share between tasks on one event loop.
+        :return: Seconds slept.
+        """
+        delay = self.acquire()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def stats(self):
+        """
+        Pacing totals for the run summary.
+        """
+        return {
+            'navigations': self.navigations,
+            'total_wait_s': round(self.total_wait, 3),
+            'max_per_minute': round(60.0 / self.interval, 3),
+        }
+
+
+def _settle_args(timeout, quiet_ms):
+    """
+    Arguments for RESULTS_SETTLED_JS.
+    """
+    return {'selector': CARD_SELECTORS['card'], 'resultsSelector': CARD_SELECTORS['results'],
+            'quietMs': quiet_ms, 'timeoutMs': timeout * 1000, 'fallbackMs': FALLBACK_TIMEOUT_MS}
+
+
+def wait_for_results_selenium(driver, previous=None, timeout=20, quiet_ms=300):
+    """
+    Wait until a search results page is ready: the old results are gone, a
+    card is present and the results list has stopped mutating.
+    :param driver: Selenium WebDriver.
+    :param previous: An element from the previous page that must go stale first.
+    :param timeout: Maximum seconds for each stage.
+    :param quiet_ms: Milliseconds without DOM mutations that count as settled.
+    :return: Number of result cards on the page.
+    """
+    # Selenium imports stay local so the Playwright scraper can use this module without Selenium installed
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    if previous is not None:
+        WebDriverWait(driver, timeout).until(EC.staleness_of(previous))
+    WebDriverWait(driver, timeout).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, CARD_SELECTORS['card']))
+    )
+    previous_timeout = driver.timeouts.script  # Seconds; put back so later async scripts keep their own limit
+    driver.set_script_timeout(timeout + 5)
+    try:
+        return driver.execute_async_script(
+            f"const done = arguments[arguments.length - 1]; ({RESULTS_SETTLED_JS})(arguments[0]).then(done);",
+            _settle_args(timeout, quiet_ms),
+        )
+    finally:
+        driver.set_script_timeout(previous_timeout)
+
+
+def wait_for_results_playwright(page, previous=None, timeout=20, quiet_ms=300):
+    """
+    Playwright counterpart of wait_for_results_selenium.
+    :param page: Playwright page.
+    :param previous: Element handle from the previous page that must detach first.
+    :param timeout: Maximum seconds for each stage.
+    :param quiet_ms: Milliseconds without DOM mutations that count as settled.
+    :return: Number of result cards on the page.
+    """
+    if previous is not None:
+        previous.wait_for_element_state('hidden', timeout=timeout * 1000)  # Detached counts as hidden
+    page.wait_for_selector(CARD_SELECTORS['card'], timeout=timeout * 1000)
+    return page.evaluate(
+        RESULTS_SETTLED_JS,
+        _settle_args(timeout, quiet_ms),
+    )
+
+
+async def wait_for_results_playwright_async(page, previous=None, timeout=20, quiet_ms=300):
+    """
+    Async counterpart of wait_for_results_playwright for playwright.async_api pages.
+    """
+    if previous is not None:
+        await previous.wait_for_element_state('hidden', timeout=timeout * 1000)  # Detached counts as hidden
+    await page.wait_for_selector(CARD_SELECTORS['card'], timeout=timeout * 1000)
+    return await page.evaluate(
+        RESULTS_SETTLED_JS,
+        _settle_args(timeout, quiet_ms),
+    )
@@ -0,0 +1,200 @@
+# Import necessary libraries
+import json
+import os
+
+
+# Define the ProfileStore class
+class ProfileStore:
+    """
+    Append-only profile storage.
+
+    Every new profile is appended as one JSON line to a log file next to the
+    snapshot, so saving a profile costs one small write instead of rewriting
+    the whole dataset. The log is fsynced in batches and periodically folded
+    into the snapshot with an atomic temp-file rename.
+    """
+
+    def __init__(self, path, key='profile_url', fsync_interval=20, compact_every=500):
+        """
+        Initialize the store.
+        :param path: Snapshot file (JSON lines). The log lives at `<path>.log`.
+        :param key: Record field used to identify a profile (later records win).
+        :param fsync_interval: Number of appended records between fsyncs.
+        :param compact_every: Number of appended records after which the log is compacted.
+        """
+        self.path = path  # Snapshot file
+        self.log_path = f'{path}.log'  # Append-only log of new records
+        self.key = key  # Field that identifies a profile
+        self.fsync_interval = max(1, fsync_interval)  # Records between fsyncs
+        self.compact_every = compact_every  # Records between compactions (0 disables)
+        self._log = None  # Lazily opened log file handle
+        self._unsynced = 0  # Records written since the last fsync
+        self._since_compact = 0  # Records written since the last compaction
+
+    def _iter_file(self, path):
+        """
+        Stream records from a JSON lines file, skipping a torn trailing line.
+        Legacy files holding a single JSON array are also accepted.
+        :param path: File to read.
+        """
+        try:
+            f = open(path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            return
+        with f:
+            # Peek at the first character to detect the old pretty-printed array format
+            head = f.read(1)
+            while head and head.isspace():
+                head = f.read(1)
+            f.seek(0)
+            if head == '[':
+                try:
+                    yield from json.load(f)
+                except json.JSONDecodeError:
+                    pass  # Treat an invalid legacy file as empty, like the old cache loader
+                return
+
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # A crash mid-append can leave a partial last line
+
+    def __iter__(self):
+        """
+        Stream every stored record: the snapshot first, then the log.
+        Records may repeat if a compaction was interrupted; use `load()` to dedupe.
+        """
+        yield from self._iter_file(self.path)
+        yield from self._iter_file(self.log_path)
+
+    def load(self):
+        """
+        Rebuild the profile list from the snapshot and the log.
+        :return: A list of profiles, deduplicated by key (latest record wins).
+        """
+        records = {}
+        for record in self:
+            records[record.get(self.key)] = record
+        return list(records.values())
+
+    def iter_unique(self):
+        """
+        Stream one record per key (latest wins) without holding the records in memory:
+        a first pass notes where each key last occurs, a second pass yields those records.
+        """
+        last = {}
+        for position, record in enumerate(self):
+            last[record.get(self.key)] = position
+        for position, record in enumerate(self):
+            if last.get(record.get(self.key)) == position:
+                yield record
+
+    def migrate_from(self, path):
+        """
+        Seed an empty store from an older cache file (JSON array or JSON lines), which is left in place.
+        :param path: Old cache file, e.g. the `profiles.json` used before this store existed.
+        :return: Number of records migrated (0 if the store already has data or the file is missing).
+        """
+        if os.path.exists(self.path) or os.path.exists(self.log_path) or not os.path.exists(path):
+            return 0
+        records = {}
+        for record in self._iter_file(path):
+            records[record.get(self.key)] = record
+        self.compact(records.values())
+        return len(records)
+
+    def _repair_log(self):
+        """
+        Cut a torn last line (left by a crash mid-append) off the log, so the next
+        record starts on a line of its own instead of being glued onto the fragment.
+        """
+        try:
+            f = open(self.log_path, 'rb+')
+        except FileNotFoundError:
+            return
+        with f:
+            size = f.seek(0, os.SEEK_END)
+            end = size
+            while end:
+                start = max(0, end - 4096)
+                f.seek(start)
+                block = f.read(end - start)
+                newline = block.rfind(b'\n')
+                if newline != -1:
+                    end = start + newline + 1
+                    break
+                end = start
+            if end != size:
+                f.truncate(end)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def append(self, record):
+        """
+        Append a single profile to the log.
+        :param record: Profile dictionary to store.
+        """
+        if self._log is None:
+            self._repair_log()
+            self._log = open(self.log_path, 'a', encoding='utf-8')
+        self._log.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._log.flush()  # Hand the line to the OS so other readers can see it
+        self._unsynced += 1
+        self._since_compact += 1
+
+        if self._unsynced >= self.fsync_interval:
+            self.sync()
+
+    def should_compact(self):
+        """
+        Check whether enough records have been appended to warrant a compaction.
+        """
+        return bool(self.compact_every) and self._since_compact >= self.compact_every
+
+    def sync(self):
+        """
+        Force buffered log writes to disk.
+        """
+        if self._log is not None and self._unsynced:
+            self._log.flush()
+            os.fsync(self._log.fileno())
+        self._unsynced = 0
+
+    def compact(self, records=None):
+        """
+        Write the given records as the new snapshot and reset the log.
+        The snapshot is written to a temp file and renamed into place, so a
+        crash leaves either the old or the new snapshot, never a partial one.
+        :param records: Profiles to keep (default: the stored ones, deduplicated by streaming with iter_unique).
+        """
+        if records is None:
+            records = self.iter_unique()
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)  # Atomic on POSIX and Windows
+
+        # The snapshot now holds everything, so the log can start over
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        with open(self.log_path, 'w', encoding='utf-8'):
+            pass
+        self._unsynced = 0
+        self._since_compact = 0
+
+    def close(self):
+        """
+        Flush pending writes and close the log file.
+        """
+        self.sync()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
@@ -0,0 +1,116 @@
+# Restart the browser during long crawls before its memory use gets out of hand
+import os
+
+try:
+    import psutil  # Optional: portable process-tree memory readings
+except ImportError:
+    psutil = None  # Fall back to /proc on Linux
+
+
+def _proc_tree_rss(root):
+    """
+    Resident memory of every descendant of `root`, read from /proc (Linux only).
+    """
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                stat = f.read()
+        except OSError:
+            continue  # Process exited while scanning
+        ppid = int(stat.rsplit(')', 1)[1].split()[1])  # The command name may contain spaces and parentheses
+        children.setdefault(ppid, []).append(int(entry))
+
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total, stack = 0, list(children.get(root, []))
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        try:
+            with open(f'/proc/{pid}/statm', 'r') as f:
+                total += int(f.read().split()[1]) * page_size
+        except OSError:
+            pass
+    return total
+
+
+def browser_rss():
+    """
+    Resident memory of all processes started by this one: the browser, its renderers and
+    the driver (chromedriver or the Playwright driver).
+    :return: Bytes, or None if memory cannot be read on this platform.
+    """
+    if psutil is not None:
+        total = 0
+        for proc in psutil.Process().children(recursive=True):
+            try:
+                total += proc.memory_info().rss
+            except psutil.Error:
+                pass  # Process exited between listing and reading
+        return total
+    if os.path.isdir('/proc'):
+        return _proc_tree_rss(os.getpid())
+    return None
+
+
+def _mb(size):
+    return f'{size / 2 ** 20:.0f} MB' if size is not None else 'n/a'
+
+
+# Define the BrowserRecycler class
+class BrowserRecycler:
+    """
+    Decides when a long-running browser should be restarted: after a number
+    of result pages, or once its process tree uses more than a memory limit.
+    The scrapers ask `should_recycle()` between pages, where no record is in
+    flight, and report each restart with `recycled()`.
+    """
+
+    def __init__(self, max_rss_mb=1500, max_pages=150, metrics=None):
+        """
+        :param max_rss_mb: Restart once the browser's processes use more than this (None to ignore memory).
+        :param max_pages: Restart after this many result pages (None to ignore the page count).
+        :param metrics: Optional Metrics receiving recycle counters.
+        """
+        self.max_rss = max_rss_mb * 2 ** 20 if max_rss_mb else None
+        self.max_pages = max_pages
+        self.metrics = metrics
+        self.pages = 0  # Result pages since the last (re)start
+        self.rss_before = None  # Memory reading that triggered the pending recycle
+        self.reason = None  # 'pages' or 'memory'
+        self.recycles = 0
+
+    def page_loaded(self):
+        self.pages += 1
+
+    def should_recycle(self):
+        """
+        Check the thresholds. Memory is only read when a limit is set.
+        """
+        if self.max_pages and self.pages >= self.max_pages:
+            self.rss_before, self.reason = browser_rss(), 'pages'
+            return True
+        if self.max_rss:
+            rss = browser_rss()
+            if rss is not None and rss > self.max_rss:
+                self.rss_before, self.reason = rss, 'memory'
+                return True
+        return False
+
+    def recycled(self):
+        """
+        Log a finished restart with the memory it freed and reset the page count.
+        """
+        after = browser_rss()
+        freed = self.rss_before - after if self.rss_before is not None and after is not None else None
+        print(f"♻️ Restarted the browser after {self.pages} pages ({self.reason} limit): "
+              f"{_mb(self.rss_before)} -> {_mb(after)}, freed {_mb(freed)}")
+        if self.metrics is not None:
+            self.metrics.inc('browser_recycles')
+            if freed is not None:
+                self.metrics.inc('browser_recycle_freed_bytes', max(0, freed))
+        self.recycles += 1
+        self.pages = 0
+        self.rss_before = None
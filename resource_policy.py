@@ -0,0 +1,196 @@
+# Resource blocking for the Selenium (CDP) and Playwright (route) backends
+import json
+from fnmatch import fnmatch
+
+# Resource types our extraction never reads
+DEFAULT_BLOCK_TYPES = ('image', 'font', 'media')
+
+# URL patterns for trackers and previews (fnmatch / CDP wildcard syntax)
+DEFAULT_BLOCK_PATTERNS = (
+    '*://media.licdn.com/dms/image/*',  # Avatars and banners
+    '*://static.licdn.com/*/fonts/*',  # Web fonts
+    '*://px.ads.linkedin.com/*',  # Ad pixels
+    '*://*.doubleclick.net/*',  # Ad tracking
+    '*://www.google-analytics.com/*',  # Analytics
+    '*/li/track*',  # LinkedIn tracking beacons
+)
+
+# CDP can only block by URL, so resource types are mapped to file extensions for Selenium
+TYPE_PATTERNS = {
+    'image': ('*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*', '*.ico*'),
+    'font': ('*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*'),
+    'media': ('*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*', '*.ogg*'),
+    'stylesheet': ('*.css*',),
+}
+
+
+def _new_stats():
+    return {'requests': 0, 'blocked_requests': 0, 'loaded_bytes': 0, 'blocked_bytes': 0, 'blocked_by_type': {}}
+
+
+# Define the ResourcePolicy class
+class ResourcePolicy:
+    """
+    Decides which requests to block and counts what was blocked per page.
+
+    Blocked requests never reach the network, so their size cannot be known.
+    Run with `dry_run=True` to let matching requests through and measure the
+    bytes they would have cost; `loaded_bytes` is what the page actually pulled.
+    """
+
+    def __init__(self, block_types=DEFAULT_BLOCK_TYPES, block_patterns=DEFAULT_BLOCK_PATTERNS, dry_run=False):
+        """
+        Initialize the policy.
+        :param block_types: Resource types to block ('image', 'font', 'media', 'stylesheet', 'script', ...).
+        :param block_patterns: URL wildcard patterns to block regardless of type.
+        :param dry_run: Count matching requests without blocking them.
+        """
+        self.block_types = {t.lower() for t in block_types}
+        self.block_patterns = tuple(block_patterns)
+        self.dry_run = dry_run
+        self.page = _new_stats()  # Counters for the current page
+        self.total = _new_stats()  # Counters for the whole run
+        self._requests = {}  # CDP requestId -> (url, resource type), Selenium only
+
+    def should_block(self, url, resource_type=None):
+        """
+        Check whether a request matches the policy.
+        :param url: Request URL.
+        :param resource_type: Resource type if the backend reports one.
+        """
+        if resource_type and resource_type.lower() in self.block_types:
+            return True
+        if resource_type is None:
+            # No type available: fall back to file extensions
+            for blocked_type in self.block_types:
+                if any(fnmatch(url, pattern) for pattern in TYPE_PATTERNS.get(blocked_type, ())):
+                    return True
+        return any(fnmatch(url, pattern) for pattern in self.block_patterns)
+
+    def _record(self, blocked, resource_type, size=0):
+        """
+        Count one request on the current page.
+        """
+        self.page['requests'] += 1
+        if blocked:
+            resource_type = (resource_type or 'other').lower()
+            self.page['blocked_requests'] += 1
+            self.page['blocked_bytes'] += size
+            self.page['blocked_by_type'][resource_type] = self.page['blocked_by_type'].get(resource_type, 0) + 1
+        else:
+            self.page['loaded_bytes'] += size
+
+    def end_page(self):
+        """
+        Close the current page's counters and add them to the run totals.
+        :return: The finished page's counters.
+        """
+        page, self.page = self.page, _new_stats()
+        for key in ('requests', 'blocked_requests', 'loaded_bytes', 'blocked_bytes'):
+            self.total[key] += page[key]
+        for resource_type, count in page['blocked_by_type'].items():
+            self.total['blocked_by_type'][resource_type] = self.total['blocked_by_type'].get(resource_type, 0) + count
+        return page
+
+    def summary(self, stats):
+        """
+        Format a counters dict as a one-line log message.
+        """
+        verb = 'Would block' if self.dry_run else 'Blocked'
+        return (f"🧹 {verb} {stats['blocked_requests']}/{stats['requests']} requests "
+                f"({stats['blocked_bytes'] / 1024:.0f} KiB blocked, {stats['loaded_bytes'] / 1024:.0f} KiB loaded)")
+
+    # ---- Playwright ----
+
+    def install_playwright(self, context):
+        """
+        Route every request of a Playwright (sync) browser context through the policy.
+        :param context: Browser context, e.g. from launch_persistent_context.
+        """
+        def handle_route(route):
+            request = route.request
+            if self.should_block(request.url, request.resource_type) and not self.dry_run:
+                self._record(True, request.resource_type)
+                route.abort()
+            else:
+                route.continue_()
+
+        def handle_response(response):
+            # Content-Length is read from the already-received headers, so this costs no extra IPC
+            request = response.request
+            size = int(response.headers.get('content-length') or 0)
+            self._record(self.should_block(request.url, request.resource_type), request.resource_type, size)
+
+        context.route('**/*', handle_route)
+        context.on('response', handle_response)
+
+    async def install_playwright_async(self, context):
+        """
+        Async counterpart of install_playwright for playwright.async_api contexts.
+        :param context: Async browser context.
+        """
+        async def handle_route(route):
+            request = route.request
+            if self.should_block(request.url, request.resource_type) and not self.dry_run:
+                self._record(True, request.resource_type)
+                await route.abort()
+            else:
+                await route.continue_()
+
+        def handle_response(response):
+            request = response.request
+            size = int(response.headers.get('content-length') or 0)
+            self._record(self.should_block(request.url, request.resource_type), request.resource_type, size)
+
+        await context.route('**/*', handle_route)
+        context.on('response', handle_response)
+
+    # ---- Selenium (Chrome DevTools Protocol) ----
+
+    def apply_chrome_options(self, options):
+        """
+        Add the Chrome options the policy needs; call before creating the driver.
+        :param options: selenium ChromeOptions.
+        """
+        # Both settings are dicts that replace the caller's; merge into what is already set instead
+        if 'image' in self.block_types and not self.dry_run:
+            prefs = dict(options.experimental_options.get('prefs', {}))
+            prefs['profile.managed_default_content_settings.images'] = 2
+            options.add_experimental_option('prefs', prefs)
+        logging_prefs = dict(options.capabilities.get('goog:loggingPrefs', {}))
+        logging_prefs['performance'] = 'ALL'  # Needed to count requests
+        options.set_capability('goog:loggingPrefs', logging_prefs)
+
+    def install_selenium(self, driver):
+        """
+        Enable CDP network blocking on a Chrome WebDriver.
+        :param driver: Chrome WebDriver created with apply_chrome_options.
+        """
+        driver.execute_cdp_cmd('Network.enable', {})
+        if self.dry_run:
+            return
+        urls = list(self.block_patterns)
+        for blocked_type in self.block_types:
+            urls.extend(TYPE_PATTERNS.get(blocked_type, ()))
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': urls})
+
+    def collect_selenium(self, driver):
+        """
+        Drain Chrome's performance log and count the network events since the last call.
+        :param driver: Chrome WebDriver created with apply_chrome_options.
+        :return: The counters for the page that was just processed.
+        """
+        for entry in driver.get_log('performance'):
+            message = json.loads(entry['message'])['message']
+            method, params = message.get('method'), message.get('params', {})
+
+            if method == 'Network.requestWillBeSent':
+                self._requests[params['requestId']] = (params['request']['url'], params.get('type'))
+            elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                _, resource_type = self._requests.pop(params['requestId'], ('', params.get('type')))
+                self._record(True, resource_type)
+            elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+                url, resource_type = self._requests.pop(params['requestId'], ('', None))
+                size = int(params.get('encodedDataLength') or 0)
+                self._record(self.dry_run and self.should_block(url, resource_type), resource_type, size)
+        return self.end_page()
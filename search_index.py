@@ -0,0 +1,259 @@
+# Persistent inverted index over profile names, headlines and locations, backed by SQLite
+import re
+import sqlite3
+import unicodedata
+
+from merge import EMPTY, normalize
+
+FIELDS = ('name', 'headline', 'location')  # Indexed fields; postings store their position in this tuple
+TOKEN_RE = re.compile(r'\w+')
+MAX_PREFIX_TERMS = 200  # Most frequent terms a prefix like `eng*` expands to
+
+
+def tokenize(text):
+    """
+    Split text into lowercase, accent-free word tokens: 'Zürich, Data-Engineer' -> ['zurich', 'data', 'engineer'].
+    """
+    text = unicodedata.normalize('NFKD', text.casefold())
+    return TOKEN_RE.findall(''.join(c for c in text if not unicodedata.combining(c)))
+
+
+def _postings(profile):
+    """
+    Distinct (term, field) pairs of a profile; "N/A" fields are not indexed.
+    """
+    return {(token, field) for field, name in enumerate(FIELDS)
+            if profile.get(name) not in EMPTY for token in tokenize(profile[name])}
+
+
+# Define the SearchIndex class
+class SearchIndex:
+    """
+    Inverted index from word tokens to profiles, stored in SQLite so it is
+    updated in place and queried without loading the dataset.
+
+    Postings are keyed by (term, profile id), so an AND query walks the
+    rarest term's postings and checks each hit against the other terms with
+    index lookups, stopping as soon as `limit` profiles are found. A term
+    table with posting counts picks the rarest term and expands prefixes.
+    Profiles are keyed by canonical slug: re-adding a profile replaces its
+    postings only when its indexed fields changed.
+    """
+
+    def __init__(self, path='profiles_index.sqlite', commit_every=1000):
+        """
+        Open (or create) an index.
+        :param path: SQLite file, or ':memory:'.
+        :param commit_every: Number of added or changed profiles between commits.
+        """
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        if path != ':memory:':
+            self.conn.execute('PRAGMA journal_mode=WAL')  # Queries don't block a scraper adding profiles
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS profiles (id INTEGER PRIMARY KEY, slug TEXT UNIQUE NOT NULL, '
+                          'name TEXT, profile_url TEXT, headline TEXT, location TEXT)')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS postings (term TEXT, id INTEGER, field INTEGER, '
+                          'PRIMARY KEY (term, id, field)) WITHOUT ROWID')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS terms (term TEXT PRIMARY KEY, df INTEGER NOT NULL) WITHOUT ROWID')
+        self.commit_every = commit_every
+        self._pending = 0  # Changes since the last commit
+
+    def add(self, profile):
+        """
+        Index a profile, or re-index it if its name, headline or location changed.
+        :param profile: Profile dict from any scraper (`profile_url` or `url`).
+        :return: 'new', 'changed', 'unchanged', or None if the record has no profile URL.
+        """
+        normalized = normalize(profile)
+        if normalized is None:
+            return None
+        slug, profile = normalized
+        values = tuple(profile[field] for field in ('name', 'profile_url', 'headline', 'location'))
+        row = self.conn.execute('SELECT id, name, profile_url, headline, location FROM profiles WHERE slug = ?',
+                                (slug,)).fetchone()
+        if row is None:
+            status = 'new'
+            profile_id = self.conn.execute('INSERT INTO profiles (slug, name, profile_url, headline, location) '
+                                           'VALUES (?, ?, ?, ?, ?)', (slug,) + values).lastrowid
+            old = set()
+        else:
+            # A sparser record (e.g. a bare URL from cache.json) does not erase what is known,
+            # and the URL first indexed for this slug is kept (variants differ only in host or case)
+            values = tuple(old if value in EMPTY or i == 1 else value
+                           for i, (value, old) in enumerate(zip(values, row[1:])))
+            profile = dict(zip(('name', 'profile_url', 'headline', 'location'), values))
+            if row[1:] == values:
+                return 'unchanged'
+            status, profile_id = 'changed', row[0]
+            self.conn.execute('UPDATE profiles SET name = ?, profile_url = ?, headline = ?, location = ? '
+                              'WHERE id = ?', values + (profile_id,))
+            old = _postings(dict(zip(('name', 'profile_url', 'headline', 'location'), row[1:])))
+
+        new = _postings(profile)
+        removed, added = old - new, new - old
+        self.conn.executemany('DELETE FROM postings WHERE term = ? AND id = ? AND field = ?',
+                              [(term, profile_id, field) for term, field in removed])
+        self.conn.executemany('UPDATE terms SET df = df - 1 WHERE term = ?', [(term,) for term, _ in removed])
+        self.conn.executemany('INSERT INTO postings (term, id, field) VALUES (?, ?, ?)',
+                              [(term, profile_id, field) for term, field in added])
+        self.conn.executemany('INSERT INTO terms (term, df) VALUES (?, 1) ON CONFLICT(term) DO UPDATE SET df = df + 1',
+                              [(term,) for term, _ in added])
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.commit()
+        return status
+
+    def add_many(self, profiles):
+        """
+        Index many profiles and commit.
+        :return: Counts per add() status.
+        """
+        counts = {'new': 0, 'changed': 0, 'unchanged': 0, 'invalid': 0}
+        for profile in profiles:
+            counts[self.add(profile) or 'invalid'] += 1
+        self.commit()
+        return counts
+
+    def _clauses(self, query):
+        """
+        Parse a query into AND clauses of (matching terms, total postings, field).
+        Words are `engineer`, prefixes `eng*`, and either may be limited to a field: `location:seattle`.
+        """
+        clauses = []
+        for word in query.split():
+            field = None
+            name, sep, rest = word.partition(':')
+            if sep and name.lower() in FIELDS:
+                field, word = FIELDS.index(name.lower()), rest
+            prefix = word.endswith('*')
+            tokens = tokenize(word)
+            for i, token in enumerate(tokens):
+                if prefix and i == len(tokens) - 1:
+                    rows = self.conn.execute('SELECT term, df FROM terms WHERE term >= ? AND term < ? AND df > 0 '
+                                             'ORDER BY df DESC LIMIT ?',
+                                             (token, token + '\U0010ffff', MAX_PREFIX_TERMS)).fetchall()
+                else:
+                    rows = self.conn.execute('SELECT term, df FROM terms WHERE term = ? AND df > 0',
+                                             (token,)).fetchall()
+                clauses.append(([term for term, _ in rows], sum(df for _, df in rows), field))
+        return clauses
+
+    def _match_sql(self, query):
+        """
+        Build the SQL selecting matching profile ids, driven by the rarest clause.
+        :return: (sql, params), or None if some clause matches nothing.
+        """
+        clauses = self._clauses(query)
+        if not clauses or any(not terms for terms, _, _ in clauses):
+            return None
+        clauses.sort(key=lambda clause: clause[1])
+        sql, params = [], []
+        for i, (terms, _, field) in enumerate(clauses):
+            alias = 'p' if i == 0 else f'q{i}'
+            condition = f"{alias}.term IN ({', '.join('?' * len(terms))})"
+            params.extend(terms)
+            if field is not None:
+                condition += f' AND {alias}.field = ?'
+                params.append(field)
+            if i == 0:
+                sql.append(f'SELECT DISTINCT p.id FROM postings p WHERE {condition}')
+            else:
+                sql.append(f'AND EXISTS (SELECT 1 FROM postings {alias} WHERE {condition} AND {alias}.id = p.id)')
+        return ' '.join(sql), params
+
+    def search(self, query, limit=20, offset=0):
+        """
+        Find profiles matching every word of the query.
+        :param query: E.g. 'ml engineer location:seattle' or 'data eng*'.
+        :param limit: Maximum number of profiles (None: all).
+        :param offset: Number of matches to skip, for paging.
+        :return: Profile dicts (name, profile_url, headline, location) in indexing order.
+        """
+        match = self._match_sql(query)
+        if match is None:
+            return []
+        sql, params = match
+        ids = [row[0] for row in self.conn.execute(f'{sql} ORDER BY p.id LIMIT ? OFFSET ?',
+                                                   params + [-1 if limit is None else limit, offset])]
+        profiles = []
+        for start in range(0, len(ids), 500):  # Stay under SQLite's bound-parameter limit
+            chunk = ids[start:start + 500]
+            profiles.extend(self.conn.execute(
+                f"SELECT name, profile_url, headline, location FROM profiles WHERE id IN ({', '.join('?' * len(chunk))}) "
+                'ORDER BY id', chunk))
+        return [dict(zip(('name', 'profile_url', 'headline', 'location'), row)) for row in profiles]
+
+    def count(self, query):
+        """
+        Number of profiles matching the query.
+        """
+        match = self._match_sql(query)
+        if match is None:
+            return 0
+        sql, params = match
+        return self.conn.execute(f'SELECT COUNT(*) FROM ({sql})', params).fetchone()[0]
+
+    def __len__(self):
+        return self.conn.execute('SELECT COUNT(*) FROM profiles').fetchone()[0]
+
+    def commit(self):
+        self.conn.commit()
+        self._pending = 0
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Define the IndexSink class
+class IndexSink:
+    """
+    Sink (see sinks.py) that indexes each profile as it is scraped, e.g.
+    `drain(scraper.iter_profiles('ml engineer'), JsonlSink('out.jsonl'), IndexSink('profiles_index.sqlite'))`.
+    """
+
+    def __init__(self, index):
+        """
+        :param index: A SearchIndex, or the path of one to open (and close with the sink).
+        """
+        self._owned = not isinstance(index, SearchIndex)
+        self.index = SearchIndex(index) if self._owned else index
+        self.count = 0
+
+    def write(self, profile):
+        self.index.add(profile)
+        self.count += 1
+
+    def close(self):
+        if self._owned:
+            self.index.close()
+        else:
+            self.index.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def index_files(index, paths):
+    """
+    Add every profile in the given files to the index (any format merge.py reads).
+    :return: Counts per add() status.
+    """
+    from columnar import iter_profile_file
+
+    counts = {'new': 0, 'changed': 0, 'unchanged': 0, 'invalid': 0}
+    for path in paths:
+        for status, count in index.add_many(iter_profile_file(path)).items():
+            counts[status] += count
+    return counts
+
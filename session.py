@@ -0,0 +1,102 @@
+# Reusable login sessions for the Selenium scrapers: a saved cookie jar and/or a persistent Chrome profile
+import json
+import os
+import time
+
+LINKEDIN_URL = 'https://www.linkedin.com'
+COOKIE_PAGE = f'{LINKEDIN_URL}/robots.txt'  # Tiny page on the right domain, needed before cookies can be set
+FEED_URL = f'{LINKEDIN_URL}/feed/'
+SESSION_COOKIE = 'li_at'  # LinkedIn's authentication cookie
+LOGGED_IN_SELECTOR = '.global-nav__me'  # User menu, only shown to a logged-in member
+LOGGED_OUT_MARKERS = ('/login', '/authwall', '/checkpoint', '/uas/')  # Where an expired session gets redirected
+
+
+# Define the SeleniumSession class
+class SeleniumSession:
+    """
+    Keeps a LinkedIn login across runs so the full credential login only
+    happens when the saved session no longer works.
+
+    With `user_data_dir`, Chrome keeps its own cookies in a persistent
+    profile. With `cookie_file`, cookies are exported after a login and
+    loaded into a fresh browser on the next run. Both can be combined.
+    """
+
+    def __init__(self, cookie_file=None, user_data_dir=None):
+        """
+        :param cookie_file: JSON file for the saved cookies (written with owner-only permissions).
+        :param user_data_dir: Chrome profile directory to reuse between runs.
+        """
+        self.cookie_file = cookie_file
+        self.user_data_dir = os.path.abspath(user_data_dir) if user_data_dir else None
+
+    def apply_chrome_options(self, options):
+        """
+        Point Chrome at the persistent profile, if one is configured.
+        """
+        if self.user_data_dir:
+            options.add_argument(f'--user-data-dir={self.user_data_dir}')
+
+    def _load_cookies(self):
+        if not self.cookie_file:
+            return []
+        try:
+            with open(self.cookie_file, 'r') as f:
+                cookies = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+        now = time.time()
+        return [c for c in cookies if c.get('expiry') is None or c['expiry'] > now]
+
+    def restore(self, driver, navigate=None, timeout=10):
+        """
+        Load the saved session into the browser and check that it is still logged in.
+        Returns quickly without any navigation when nothing usable was saved.
+        :param driver: Selenium WebDriver.
+        :param navigate: Function opening a URL (e.g. the scraper's rate-limited navigation); defaults to driver.get.
+        :param timeout: Seconds to wait for the feed to show the user menu or bounce to the login page.
+        :return: True if the browser is logged in.
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException
+
+        navigate = navigate or driver.get
+        cookies = self._load_cookies()
+        if not self.user_data_dir and not any(c['name'] == SESSION_COOKIE for c in cookies):
+            return False  # No profile and no unexpired session cookie: a login is needed anyway
+
+        if cookies:
+            navigate(COOKIE_PAGE)
+            for cookie in cookies:
+                cookie.pop('sameSite', None)  # Older drivers reject some exported values
+                try:
+                    driver.add_cookie(cookie)
+                except Exception:
+                    pass  # A cookie for another subdomain; the session cookie is what matters
+
+        # One navigation: the feed either shows the user menu or redirects to a login wall
+        navigate(FEED_URL)
+        try:
+            WebDriverWait(driver, timeout).until(
+                lambda d: d.find_elements(By.CSS_SELECTOR, LOGGED_IN_SELECTOR)
+                or any(marker in d.current_url for marker in LOGGED_OUT_MARKERS)
+            )
+        except TimeoutException:
+            return False
+        return bool(driver.find_elements(By.CSS_SELECTOR, LOGGED_IN_SELECTOR))
+
+    def save(self, driver):
+        """
+        Export the browser's cookies after a successful login.
+        The file is written atomically and readable by the owner only, since it grants account access.
+        """
+        if not self.cookie_file:
+            return
+        directory = os.path.dirname(os.path.abspath(self.cookie_file))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f'{self.cookie_file}.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(driver.get_cookies(), f)
+        os.replace(tmp_path, self.cookie_file)
@@ -0,0 +1,189 @@
+# Output sinks that consume scraped profiles one at a time as they are extracted
+import csv
+import json
+import os
+import sys
+
+
+# Define the JsonlSink class
+class JsonlSink:
+    """
+    Appends each profile as one JSON line and flushes it, so other processes
+    can tail the file while the crawl is still running.
+    """
+
+    def __init__(self, path, append=True, durable=False):
+        """
+        :param path: Output file.
+        :param append: Add to an existing file instead of truncating it.
+        :param durable: fsync every profile, so it is on disk before the crawl moves on
+                        (needed when a checkpoint records the page as done).
+        """
+        self.path = path
+        self.durable = durable
+        self.count = 0
+        self._file = open(path, 'a' if append else 'w', encoding='utf-8')
+
+    def write(self, profile):
+        self._file.write(json.dumps(profile, ensure_ascii=False) + '\n')
+        self._file.flush()
+        if self.durable:
+            os.fsync(self._file.fileno())
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Define the StdoutSink class
+class StdoutSink(JsonlSink):
+    """
+    Writes JSON lines to standard output, e.g. to pipe into `jq` or another tool.
+    """
+
+    def __init__(self, stream=None):
+        self.path = '-'
+        self.durable = False  # Pipes cannot be fsynced
+        self.count = 0
+        self._file = stream or sys.stdout
+
+    def close(self):
+        self._file.flush()  # Never close stdout
+
+
+# Define the CsvSink class
+class CsvSink:
+    """
+    Writes profiles as CSV rows. The header comes from `fields` or from the first profile's keys.
+    """
+
+    def __init__(self, path, fields=None):
+        """
+        :param path: Output file (truncated).
+        :param fields: Column names; fields a profile lacks are left empty and extra fields are dropped.
+        """
+        self.path = path
+        self.fields = fields
+        self.count = 0
+        self._file = open(path, 'w', encoding='utf-8', newline='')
+        self._writer = None
+
+    def write(self, profile):
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fields or list(profile),
+                                          extrasaction='ignore')
+            self._writer.writeheader()
+        self._writer.writerow(profile)
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Define the JsonArraySink class
+class JsonArraySink:
+    """
+    Streams profiles into a pretty-printed JSON array (the scrapers' classic
+    output.json layout) without holding them in memory. The array is written
+    to a temp file and renamed into place on close, so readers never see a
+    half-written file.
+    """
+
+    def __init__(self, path, indent=2):
+        self.path = path
+        self.indent = indent
+        self.count = 0
+        self._tmp_path = f'{path}.tmp'
+        self._file = open(self._tmp_path, 'w', encoding='utf-8')
+        self._file.write('[')
+
+    def write(self, profile):
+        item = json.dumps(profile, indent=self.indent, ensure_ascii=False)
+        pad = ' ' * self.indent
+        self._file.write((',\n' if self.count else '\n') + pad + item.replace('\n', '\n' + pad))
+        self.count += 1
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.write('\n]' if self.count else ']')
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Define the CallbackSink class
+class CallbackSink:
+    """
+    Hands every profile to a function, e.g. to enqueue it for enrichment as soon as it is found.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.count = 0
+
+    def write(self, profile):
+        self.callback(profile)
+        self.count += 1
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_sink(target):
+    """
+    Pick a sink from an output path: '-' for stdout, otherwise by extension
+    (.jsonl, .csv, .json, or .parquet/.lpc for the columnar formats).
+    """
+    if target == '-':
+        return StdoutSink()
+    if target.endswith(('.parquet', '.lpc')):
+        from columnar import ColumnarSink
+        return ColumnarSink(target)
+    if target.endswith('.csv'):
+        return CsvSink(target)
+    if target.endswith('.json'):
+        return JsonArraySink(target)
+    return JsonlSink(target)
+
+
+def drain(profiles, *sinks):
+    """
+    Feed every profile from an iterator to each sink as it arrives, then close the sinks.
+    :param profiles: Iterator of profile dicts (e.g. a scraper's iter_profiles()).
+    :return: Number of profiles consumed.
+    """
+    count = 0
+    try:
+        for profile in profiles:
+            for sink in sinks:
+                sink.write(profile)
+            count += 1
+    finally:
+        for sink in sinks:
+            sink.close()
+    return count
@@ -0,0 +1,71 @@
+# CrawlCheckpoint: page-number URLs and resuming interrupted crawls
+from checkpoint import CrawlCheckpoint, build_search_url
+from dedup_index import UrlIndex
+
+QUERY = build_search_url('data scientist')
+PAGES = [[f'https://www.linkedin.com/in/p{page}-{card}' for card in range(5)] for page in range(4)]
+
+
+def crawl(checkpoint, index, max_profiles):
+    """
+    The scrapers' 'url' pagination loop over PAGES, reduced to its checkpoint and dedup bookkeeping.
+    """
+    collected = []
+    start = checkpoint.resume_page(QUERY)
+    earlier = checkpoint.profiles(QUERY) if start > 1 else 0
+    for page in range(start, len(PAGES) + 1):
+        partial = False
+        for url in PAGES[page - 1]:
+            if len(collected) >= max_profiles:
+                partial = True
+                break
+            if url in index:
+                continue
+            index.stamp(url)
+            collected.append(url)
+        checkpoint.update(QUERY, page, earlier + len(collected), partial=partial)
+        if len(collected) >= max_profiles:
+            break
+    else:
+        checkpoint.finish(QUERY)
+    return collected
+
+
+def test_build_search_url_adds_company_and_page():
+    assert build_search_url('ml engineer') == 'https://www.linkedin.com/search/results/people/?keywords=ml%20engineer'
+    assert build_search_url('ml', 'Acme Inc', 3).endswith('?keywords=ml&currentCompany=Acme%20Inc&page=3')
+
+
+def test_resume_starts_after_the_last_completed_page(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'checkpoints.json'))
+    assert checkpoint.resume_page(QUERY) == 1
+    checkpoint.update(QUERY, 2, 10)
+    reloaded = CrawlCheckpoint(checkpoint.path)
+    assert reloaded.resume_page(QUERY) == 3
+    assert reloaded.profiles(QUERY) == 10
+
+
+def test_partial_page_is_not_counted_as_completed(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / 'checkpoints.json'))
+    checkpoint.update(QUERY, 2, 7, partial=True)
+    assert checkpoint.resume_page(QUERY) == 2
+    assert checkpoint.profiles(QUERY) == 7
+
+
+def test_resume_after_a_partial_page_loses_no_cards(tmp_path):
+    path = str(tmp_path / 'checkpoints.json')
+    index = UrlIndex(str(tmp_path / 'seen.sqlite'))
+    first = crawl(CrawlCheckpoint(path), index, max_profiles=7)  # Stops on page 2, three cards unread
+    second = crawl(CrawlCheckpoint(path), index, max_profiles=100)
+    assert first + second == [url for page in PAGES for url in page]
+    assert CrawlCheckpoint(path).resume_page(QUERY) == 1  # Finished, so the next run starts over
+
+
+def test_finish_resets_the_query_and_unreadable_files_start_fresh(tmp_path):
+    path = tmp_path / 'checkpoints.json'
+    checkpoint = CrawlCheckpoint(str(path))
+    checkpoint.update(QUERY, 4, 20)
+    checkpoint.finish(QUERY)
+    assert checkpoint.resume_page(QUERY) == 1 and checkpoint.profiles(QUERY) == 0
+    path.write_text('{"trunc')
+    assert CrawlCheckpoint(str(path)).entries == {}
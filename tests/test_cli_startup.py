@@ -0,0 +1,65 @@
+# The unified CLI must not import any browser backend for commands that do not scrape
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # Repository root
+BACKEND_MODULES = ('selenium', 'playwright', 'main', 'main2', 'main3')
+
+# Runs the CLI in-process in a fresh interpreter, then reports which backend modules got imported
+PROBE = """
+import json, runpy, sys
+sys.argv = ['linkedin_scraper'] + json.loads(sys.argv[1])
+try:
+    runpy.run_module('linkedin_scraper', run_name='__main__')
+except SystemExit:
+    pass
+print(json.dumps([m for m in %r if m in sys.modules]), file=sys.stderr)
+""" % (BACKEND_MODULES,)
+
+
+def run_python(*args):
+    env = dict(os.environ, LINKEDIN_EMAIL='test@example.com', LINKEDIN_PASSWORD='test')  # For scrape --check
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True)
+
+
+def imported_backends(cli_args):
+    result = run_python('-c', PROBE, json.dumps(cli_args))
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+def median_seconds(args, runs=5):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = run_python(*args)
+        timings.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            return None
+    return statistics.median(timings)
+
+
+@pytest.mark.parametrize('cli_args', [
+    ['--help'],
+    ['scrape', 'data scientist', '--check'],
+    ['scrape', 'data scientist', '-b', 'playwright', '--check'],
+    ['extract', '--help'],
+    ['query', '--help'],
+])
+def test_cli_does_not_import_backends(cli_args):
+    assert imported_backends(cli_args) == []
+
+
+def test_cli_starts_faster_than_an_eager_backend_import():
+    cli = median_seconds(['-m', 'linkedin_scraper', 'scrape', 'data scientist', '--check'])
+    assert cli is not None
+    eager = [median_seconds(['-c', f'import {module}']) for module in ('main', 'main2', 'main3')]
+    eager = [seconds for seconds in eager if seconds is not None]
+    if not eager:
+        pytest.skip("no browser backend is installed to compare against")
+    assert cli < min(eager)
@@ -0,0 +1,64 @@
+# UrlIndex: canonical slugs, stamping and the freshness TTL
+import time
+
+from dedup_index import UrlIndex, canonical_profile_slug
+
+
+def profile(headline='Engineer'):
+    return {'name': 'Jörg M', 'profile_url': 'https://www.linkedin.com/in/jorg-m/', 'headline': headline}
+
+
+def test_canonical_slug_ignores_host_case_query_and_subpages():
+    for url in ('https://de.linkedin.com/in/J%C3%B6rg-M/?trk=x', 'linkedin.com/in/jörg-m',
+                'https://www.linkedin.com/in/jörg-m/details/experience/'):
+        assert canonical_profile_slug(url) == 'in/jörg-m'
+
+
+def test_stamp_reports_new_changed_and_unchanged():
+    index = UrlIndex(':memory:')
+    record = profile()
+    assert index.stamp(record['profile_url'], record) == 'new'
+    assert record['first_seen'] == record['last_seen'] and record['content_hash']
+    assert index.stamp('https://linkedin.com/in/jorg-m?x=1', profile()) == 'unchanged'
+    assert index.stamp(record['profile_url'], profile('Manager')) == 'changed'
+    assert len(index) == 1
+
+
+def test_migrated_entry_without_hash_is_backfilled_as_unchanged():
+    index = UrlIndex(':memory:')
+    index.add_many([profile()['profile_url']])
+    assert index.stamp(profile()['profile_url'], profile()) == 'unchanged'
+    assert index.stamp(profile()['profile_url'], profile('Manager')) == 'changed'
+
+
+def test_add_records_keeps_hashes_so_refresh_detects_changes():
+    index = UrlIndex(':memory:')
+    index.add_records([profile()])
+    assert index.stamp(profile()['profile_url'], profile()) == 'unchanged'
+    assert index.stamp(profile()['profile_url'], profile('Manager')) == 'changed'
+
+
+def test_ttl_makes_stale_entries_leave_the_index(monkeypatch):
+    index = UrlIndex(':memory:', ttl=60)
+    index.stamp(profile()['profile_url'], profile())
+    assert profile()['profile_url'] in index
+    later = time.time() + 120
+    monkeypatch.setattr(time, 'time', lambda: later)
+    assert profile()['profile_url'] not in index
+    index.stamp(profile()['profile_url'], profile())
+    assert profile()['profile_url'] in index
+
+
+def test_entries_without_last_seen_are_stale_with_a_ttl():
+    index = UrlIndex(':memory:', ttl=60)
+    index.add_many(['https://www.linkedin.com/in/someone'])
+    assert 'https://www.linkedin.com/in/someone' not in index
+    index.ttl = None
+    assert 'https://www.linkedin.com/in/someone' in index
+
+
+def test_bloom_filter_agrees_with_sqlite():
+    index = UrlIndex(':memory:', bloom=True, capacity=1000)
+    index.add_many([f'https://www.linkedin.com/in/p{i}' for i in range(100)])
+    assert all(f'https://linkedin.com/in/P{i}/' in index for i in range(100))
+    assert 'https://www.linkedin.com/in/nobody' not in index
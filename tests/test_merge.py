@@ -0,0 +1,73 @@
+# merge.py: normalizing every scraper's output and deduplicating in memory or with an external sort
+import io
+import json
+
+import pytest
+
+from merge import iter_json_array, merge_files, merge_records, normalize
+from sinks import CallbackSink
+
+
+def merged(paths, **kwargs):
+    profiles = []
+    stats = merge_files([str(path) for path in paths], CallbackSink(profiles.append), workers=2, **kwargs)
+    return profiles, stats
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    """
+    The same profiles as main.py (JSON lines), main2.py/main3.py (output.json) and cache.json would write them.
+    """
+    main = tmp_path / 'profiles.jsonl'
+    main.write_text(''.join(json.dumps({'name': f'P{i}', 'profile_url': f'https://www.linkedin.com/in/p{i}/',
+                                        'headline': 'N/A', 'location': f'City {i}',
+                                        'last_seen': '2026-01-01T00:00:00Z'}) + '\n' for i in range(40)))
+    output = tmp_path / 'output.json'
+    output.write_text(json.dumps([{'name': f'P{i}', 'url': f'https://linkedin.com/in/P{i}?trk=x'}
+                                  for i in range(20, 60)], indent=2))
+    cache = tmp_path / 'cache.json'
+    cache.write_text(json.dumps([f'https://de.linkedin.com/in/p{i}' for i in range(50, 70)]))
+    return [main, output, cache]
+
+
+def test_normalize_maps_every_shape_to_the_main_schema():
+    assert normalize('https://www.linkedin.com/in/a?x=1') == \
+        ('in/a', {'name': 'N/A', 'profile_url': 'https://www.linkedin.com/in/a', 'headline': 'N/A', 'location': 'N/A'})
+    assert normalize({'name': 'A', 'url': 'linkedin.com/in/A/'})[0] == 'in/a'
+    assert normalize({'name': 'No URL'}) is None and normalize(42) is None
+
+
+def test_merge_records_prefers_known_and_newer_values():
+    old = {'name': 'A', 'headline': 'Old', 'location': 'Berlin', 'first_seen': '2026-01-01T00:00:00Z',
+           'last_seen': '2026-01-01T00:00:00Z'}
+    new = {'name': 'A', 'headline': 'New', 'location': 'N/A', 'first_seen': '2026-02-01T00:00:00Z',
+           'last_seen': '2026-02-01T00:00:00Z'}
+    result = merge_records(old, new)
+    assert result['headline'] == 'New' and result['location'] == 'Berlin'
+    assert (result['first_seen'], result['last_seen']) == ('2026-01-01T00:00:00Z', '2026-02-01T00:00:00Z')
+
+
+def test_memory_mode_dedupes_across_formats(inputs):
+    profiles, stats = merged(inputs)
+    assert stats['mode'] == 'memory'
+    assert (stats['records'], stats['unique'], stats['duplicates']) == (100, 70, 30)
+    by_url = {profile['profile_url'].lower().rstrip('/').rsplit('/', 1)[-1]: profile for profile in profiles}
+    assert by_url['p25']['location'] == 'City 25'  # Known value survives the sparser output.json record
+
+
+def test_external_mode_matches_memory_mode_with_many_runs(inputs):
+    expected, _ = merged(inputs)
+    profiles, stats = merged(inputs, memory_limit_mb=0, run_size=3, fan_in=2)
+    assert stats['mode'] == 'external' and stats['runs'] > 8 and stats['merge_passes'] >= 3
+    assert [p['profile_url'] for p in profiles] == sorted((p['profile_url'] for p in profiles),
+                                                          key=lambda url: normalize(url)[0])
+    key = lambda profile: normalize(profile)[0]
+    assert sorted(profiles, key=key) == sorted(expected, key=key)
+
+
+def test_json_arrays_are_streamed_in_chunks():
+    data = [{'profile_url': f'https://www.linkedin.com/in/p{i}', 'n': i * 1000} for i in range(50)]
+    assert list(iter_json_array(io.StringIO(json.dumps(data, indent=2)), chunk_size=7)) == data
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.StringIO('[{"profile_url": "x"}, {"trunc'), chunk_size=4))
@@ -0,0 +1,57 @@
+# RatePolicy token bucket and the Selenium settle wait's script timeout
+import pytest
+
+import pacing
+from pacing import RatePolicy
+
+
+def test_rate_policy_rejects_non_positive_rates():
+    for rate in (0, -1, None):
+        with pytest.raises(ValueError):
+            RatePolicy(max_per_minute=rate)
+
+
+def test_rate_policy_spaces_navigations_after_the_burst():
+    policy = RatePolicy(max_per_minute=60, jitter=0, burst=2)
+    assert policy.acquire() == 0 and policy.acquire() == 0
+    assert policy.acquire() == pytest.approx(1.0, abs=0.05)
+    assert policy.stats()['navigations'] == 3
+
+
+class Timeouts:
+    script = 30
+
+
+class Driver:
+    """
+    The WebDriver calls wait_for_results_selenium makes, recording the script timeouts it sets.
+    """
+
+    def __init__(self, fail=False):
+        self.timeouts = Timeouts()
+        self.fail = fail
+
+    def set_script_timeout(self, seconds):
+        self.timeouts.script = seconds
+
+    def find_element(self, by, value):
+        return object()  # A card is present
+
+    def execute_async_script(self, script, *args):
+        self.during = self.timeouts.script
+        if self.fail:
+            raise TimeoutError("script timeout")
+        return 10
+
+
+@pytest.mark.parametrize('fail', [False, True])
+def test_settle_wait_restores_the_script_timeout(fail):
+    pytest.importorskip('selenium')
+    driver = Driver(fail=fail)
+    if fail:
+        with pytest.raises(TimeoutError):
+            pacing.wait_for_results_selenium(driver, timeout=20)
+    else:
+        assert pacing.wait_for_results_selenium(driver, timeout=20) == 10
+    assert driver.during == 25
+    assert driver.timeouts.script == 30
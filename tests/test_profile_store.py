@@ -0,0 +1,61 @@
+# ProfileStore: append-only log, compaction, migration and crash recovery
+import json
+
+from profile_store import ProfileStore
+
+
+def profile(slug, **fields):
+    return {'name': slug.upper(), 'profile_url': f'https://www.linkedin.com/in/{slug}', **fields}
+
+
+def test_append_and_load_dedupes_by_key(tmp_path):
+    store = ProfileStore(str(tmp_path / 'profiles.jsonl'))
+    store.append(profile('a'))
+    store.append(profile('b'))
+    store.append(profile('a', headline='New'))
+    store.close()
+    assert ProfileStore(store.path).load() == [profile('a', headline='New'), profile('b')]
+
+
+def test_compact_folds_the_log_into_the_snapshot(tmp_path):
+    store = ProfileStore(str(tmp_path / 'profiles.jsonl'))
+    for record in (profile('a'), profile('b'), profile('a', headline='New')):
+        store.append(record)
+    store.compact()
+    assert (tmp_path / 'profiles.jsonl.log').read_text() == ''
+    assert [json.loads(line) for line in (tmp_path / 'profiles.jsonl').read_text().splitlines()] == \
+        [profile('b'), profile('a', headline='New')]
+    store.append(profile('c'))
+    store.close()
+    assert len(ProfileStore(store.path).load()) == 3
+
+
+def test_torn_last_line_does_not_swallow_the_next_record(tmp_path):
+    store = ProfileStore(str(tmp_path / 'profiles.jsonl'), fsync_interval=1)
+    store.append(profile('a'))
+    store.close()
+    with open(store.log_path, 'a', encoding='utf-8') as f:
+        f.write('{"name": "B", "profile_u')  # Crash in the middle of an append
+
+    store = ProfileStore(store.path)
+    store.append(profile('c'))
+    store.close()
+    assert ProfileStore(store.path).load() == [profile('a'), profile('c')]
+
+
+def test_migrate_from_legacy_json_array(tmp_path):
+    legacy = tmp_path / 'profiles.json'
+    legacy.write_text(json.dumps([profile('a'), profile('b'), profile('a', headline='New')], indent=4))
+    store = ProfileStore(str(tmp_path / 'profiles.jsonl'))
+    assert store.migrate_from(str(legacy)) == 2
+    assert store.load() == [profile('a', headline='New'), profile('b')]
+    assert legacy.exists()
+    assert store.migrate_from(str(legacy)) == 0  # Only an empty store is seeded
+
+
+def test_iter_unique_streams_the_latest_record_per_key(tmp_path):
+    store = ProfileStore(str(tmp_path / 'profiles.jsonl'))
+    for record in (profile('a'), profile('b'), profile('a', headline='New')):
+        store.append(record)
+    store.sync()
+    assert list(store.iter_unique()) == [profile('b'), profile('a', headline='New')]
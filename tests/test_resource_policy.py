@@ -0,0 +1,43 @@
+# ResourcePolicy: which requests are blocked, and the Chrome options it sets
+from resource_policy import ResourcePolicy
+
+
+class ChromeOptions:
+    """
+    The part of selenium's ChromeOptions that apply_chrome_options touches.
+    """
+
+    def __init__(self):
+        self.experimental_options = {}
+        self.capabilities = {}
+
+    def add_experimental_option(self, name, value):
+        self.experimental_options[name] = value
+
+    def set_capability(self, name, value):
+        self.capabilities[name] = value
+
+
+def test_should_block_by_type_extension_and_pattern():
+    policy = ResourcePolicy()
+    assert policy.should_block('https://example.com/a', 'Image')
+    assert policy.should_block('https://example.com/logo.png?v=1')
+    assert policy.should_block('https://px.ads.linkedin.com/collect', 'xhr')
+    assert not policy.should_block('https://www.linkedin.com/search/results/people/', 'document')
+
+
+def test_chrome_options_merge_with_the_callers_prefs():
+    options = ChromeOptions()
+    options.add_experimental_option('prefs', {'download.default_directory': '/tmp'})
+    options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
+    ResourcePolicy().apply_chrome_options(options)
+    assert options.experimental_options['prefs'] == {'download.default_directory': '/tmp',
+                                                     'profile.managed_default_content_settings.images': 2}
+    assert options.capabilities['goog:loggingPrefs'] == {'browser': 'ALL', 'performance': 'ALL'}
+
+
+def test_dry_run_leaves_images_loading():
+    options = ChromeOptions()
+    ResourcePolicy(dry_run=True).apply_chrome_options(options)
+    assert 'prefs' not in options.experimental_options
+    assert options.capabilities['goog:loggingPrefs'] == {'performance': 'ALL'}